@@ -0,0 +1,38 @@
+"""make car model names unique per make
+
+Revision ID: b4c5d6e7f8a9
+Revises: a3b4c5d6e7f8
+Create Date: 2026-10-18 20:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "b4c5d6e7f8a9"
+down_revision: Union[str, None] = "a3b4c5d6e7f8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Fold duplicates left by concurrent inserts into the oldest model first.
+    op.execute("""
+        WITH ranked AS (
+            SELECT id, min(id) OVER (PARTITION BY make_id, name) AS keep_id
+            FROM car_models
+        )
+        UPDATE cars SET car_model_id = ranked.keep_id
+        FROM ranked
+        WHERE cars.car_model_id = ranked.id AND ranked.id <> ranked.keep_id
+    """)
+    op.execute("""
+        DELETE FROM car_models cm
+        USING car_models keep
+        WHERE keep.make_id = cm.make_id AND keep.name = cm.name AND keep.id < cm.id
+    """)
+    op.create_index("ux_car_models_make_id_name", "car_models", ["make_id", "name"], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index("ux_car_models_make_id_name", table_name="car_models")
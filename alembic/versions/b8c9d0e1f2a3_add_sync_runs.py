@@ -0,0 +1,57 @@
+"""add sync runs
+
+Revision ID: b8c9d0e1f2a3
+Revises: a7b8c9d0e1f2
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "b8c9d0e1f2a3"
+down_revision: Union[str, None] = "a7b8c9d0e1f2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "sync_runs",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("name", sa.String(length=50), nullable=False),
+        sa.Column("mode", sa.String(length=10), nullable=False),
+        sa.Column("full", sa.Boolean(), nullable=False),
+        sa.Column("status", sa.String(length=10), nullable=False),
+        sa.Column(
+            "started_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("fetch_seconds", sa.Float(), nullable=True),
+        sa.Column("normalize_seconds", sa.Float(), nullable=True),
+        sa.Column("postgres_seconds", sa.Float(), nullable=True),
+        sa.Column("neo4j_seconds", sa.Float(), nullable=True),
+        sa.Column("total_seconds", sa.Float(), nullable=True),
+        sa.Column("fetched", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.Column("inserted", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.Column("updated", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.Column("skipped", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.Column("deleted", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.Column("errors", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.Column("peak_memory_bytes", sa.BigInteger(), nullable=True),
+        sa.Column("error_message", sa.String(length=500), nullable=True),
+        sa.Column("error_samples", sa.JSON(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_sync_runs_id"), "sync_runs", ["id"], unique=False)
+    op.create_index(op.f("ix_sync_runs_started_at"), "sync_runs", ["started_at"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_sync_runs_started_at"), table_name="sync_runs")
+    op.drop_index(op.f("ix_sync_runs_id"), table_name="sync_runs")
+    op.drop_table("sync_runs")
@@ -0,0 +1,25 @@
+"""make sync_seen_ids a logged table
+
+Revision ID: c5d6e7f8a9b0
+Revises: b4c5d6e7f8a9
+Create Date: 2026-10-18 21:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "c5d6e7f8a9b0"
+down_revision: Union[str, None] = "b4c5d6e7f8a9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Unlogged tables are truncated after a crash; a resumed full sync would
+    # then reconcile against a partial seen set and delete live cars.
+    op.execute("ALTER TABLE sync_seen_ids SET LOGGED")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE sync_seen_ids SET UNLOGGED")
@@ -0,0 +1,30 @@
+"""add partial indexes on synced cars for report filters
+
+Revision ID: d0e1f2a3b4c5
+Revises: c9d0e1f2a3b4
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "d0e1f2a3b4c5"
+down_revision: Union[str, None] = "c9d0e1f2a3b4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SYNCED = sa.text("external_id IS NOT NULL")
+
+
+def upgrade() -> None:
+    op.create_index("ix_cars_synced_year_id", "cars", ["year", "id"], postgresql_where=SYNCED)
+    op.create_index("ix_cars_synced_created_at_id", "cars", ["created_at", "id"], postgresql_where=SYNCED)
+    op.create_index("ix_cars_synced_car_model_id_id", "cars", ["car_model_id", "id"], postgresql_where=SYNCED)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_cars_synced_car_model_id_id", table_name="cars")
+    op.drop_index("ix_cars_synced_created_at_id", table_name="cars")
+    op.drop_index("ix_cars_synced_year_id", table_name="cars")
@@ -0,0 +1,33 @@
+"""add sync checkpoint
+
+Revision ID: d4e5f6a7b8c9
+Revises: c3d4e5f6a7b8
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "d4e5f6a7b8c9"
+down_revision: Union[str, None] = "c3d4e5f6a7b8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("sync_state", sa.Column("checkpoint_object_id", sa.String(length=50), nullable=True))
+    op.add_column("sync_state", sa.Column("checkpoint_since", sa.DateTime(timezone=True), nullable=True))
+    op.add_column("sync_state", sa.Column("checkpoint_watermark", sa.DateTime(timezone=True), nullable=True))
+    op.add_column(
+        "sync_state",
+        sa.Column("checkpoint_full", sa.Boolean(), server_default=sa.text("false"), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("sync_state", "checkpoint_full")
+    op.drop_column("sync_state", "checkpoint_watermark")
+    op.drop_column("sync_state", "checkpoint_since")
+    op.drop_column("sync_state", "checkpoint_object_id")
@@ -0,0 +1,58 @@
+"""add car_reports materialized view
+
+Moves the /reports indexes (pg_trgm on names, partial (year, id) /
+(created_at, id) on synced cars) onto the view that now serves the endpoint.
+
+Revision ID: e1f2a3b4c5d6
+Revises: d0e1f2a3b4c5
+Create Date: 2026-10-18 17:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "e1f2a3b4c5d6"
+down_revision: Union[str, None] = "d0e1f2a3b4c5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE MATERIALIZED VIEW car_reports AS
+        SELECT c.id, c.name, c.year, mk.name AS make, cm.name AS model, c.category,
+               c.created_at, c.updated_at,
+               lower(mk.name) AS make_lower, lower(cm.name) AS model_lower
+        FROM cars c
+        JOIN car_models cm ON cm.id = c.car_model_id
+        JOIN makes mk ON mk.id = cm.make_id
+        WHERE c.external_id IS NOT NULL
+        """
+    )
+    # The unique index is what allows REFRESH ... CONCURRENTLY
+    op.execute("CREATE UNIQUE INDEX ux_car_reports_id ON car_reports (id)")
+    op.execute("CREATE INDEX ix_car_reports_year_id ON car_reports (year, id)")
+    op.execute("CREATE INDEX ix_car_reports_created_at_id ON car_reports (created_at, id)")
+    op.execute("CREATE INDEX ix_car_reports_make_lower_trgm ON car_reports USING gin (make_lower gin_trgm_ops)")
+    op.execute("CREATE INDEX ix_car_reports_model_lower_trgm ON car_reports USING gin (model_lower gin_trgm_ops)")
+
+    op.drop_index("ix_cars_synced_car_model_id_id", table_name="cars")
+    op.drop_index("ix_cars_synced_created_at_id", table_name="cars")
+    op.drop_index("ix_cars_synced_year_id", table_name="cars")
+    op.drop_index("ix_car_models_name_lower_trgm", table_name="car_models")
+    op.drop_index("ix_makes_name_lower_trgm", table_name="makes")
+
+
+def downgrade() -> None:
+    synced = sa.text("external_id IS NOT NULL")
+    op.create_index("ix_makes_name_lower_trgm", "makes", [sa.text("lower(name) gin_trgm_ops")], postgresql_using="gin")
+    op.create_index(
+        "ix_car_models_name_lower_trgm", "car_models", [sa.text("lower(name) gin_trgm_ops")], postgresql_using="gin"
+    )
+    op.create_index("ix_cars_synced_year_id", "cars", ["year", "id"], postgresql_where=synced)
+    op.create_index("ix_cars_synced_created_at_id", "cars", ["created_at", "id"], postgresql_where=synced)
+    op.create_index("ix_cars_synced_car_model_id_id", "cars", ["car_model_id", "id"], postgresql_where=synced)
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS car_reports")
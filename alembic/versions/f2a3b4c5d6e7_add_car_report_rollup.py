@@ -0,0 +1,43 @@
+"""add car_report_rollup
+
+Revision ID: f2a3b4c5d6e7
+Revises: e1f2a3b4c5d6
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "f2a3b4c5d6e7"
+down_revision: Union[str, None] = "e1f2a3b4c5d6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "car_report_rollup",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("make", sa.String(length=100), nullable=False),
+        sa.Column("model", sa.String(length=100), nullable=False),
+        sa.Column("year", sa.Integer(), nullable=False),
+        sa.Column("category", sa.String(length=100), nullable=True),
+        sa.Column("make_lower", sa.String(length=100), nullable=False),
+        sa.Column("model_lower", sa.String(length=100), nullable=False),
+        sa.Column("cars", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.execute(
+        """
+        INSERT INTO car_report_rollup (make, model, year, category, make_lower, model_lower, cars)
+        SELECT make, model, year, category, make_lower, model_lower, count(*)
+        FROM car_reports
+        GROUP BY make, model, year, category, make_lower, model_lower
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("car_report_rollup")
@@ -2,6 +2,7 @@ from typing import AsyncGenerator
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker
 from neo4j import AsyncGraphDatabase
+import redis.asyncio as aioredis
 
 from app.core.config import config
 
@@ -46,3 +47,6 @@ class Neo4jService:
 async def get_neo4j_service() -> Neo4jService:
     return Neo4jService(neo4j_async_driver)
 
+
+# --- Redis (async): response and count caches, same DB as the sync lock ---
+redis_async_client = aioredis.Redis.from_url(config.REDIS_URL)
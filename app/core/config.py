@@ -18,10 +18,19 @@ class Config(BaseSettings):
     NEO4J_URI: str = Field("bolt://localhost:7687", env="NEO4J_URI")
     NEO4J_USER: str = Field("neo4j", env="NEO4J_USER")
     NEO4J_PASSWORD: str = Field("Neo4j_1234", env="NEO4J_PASSWORD")
+    NEO4J_BATCH_SIZE: int = Field(2000, env="NEO4J_BATCH_SIZE")
 
     # Redis
     REDIS_HOST: str = Field("localhost", env="REDIS_HOST")
     REDIS_PORT: int = Field(6379, env="REDIS_PORT")
+    REDIS_DB: int = Field(1, env="REDIS_DB")  # app data (locks, caches); Celery uses db 0
+
+    # Reports
+    REPORTS_CACHE_TTL: int = Field(86400, env="REPORTS_CACHE_TTL")  # seconds; only evicts old sync generations
+    REPORTS_EXPORT_BATCH_SIZE: int = Field(2000, env="REPORTS_EXPORT_BATCH_SIZE")  # rows per server-side cursor fetch
+
+    # Cars API
+    CARS_BULK_MAX_ITEMS: int = Field(500, env="CARS_BULK_MAX_ITEMS")  # per /cars/bulk request; one Neo4j transaction each
 
     # JWT / Auth
     JWT_SECRET_KEY: str = Field(
@@ -46,12 +55,24 @@ class Config(BaseSettings):
     )
     SYNC_YEAR_MIN: int = Field(2012, env="SYNC_YEAR_MIN")
     SYNC_YEAR_MAX: int = Field(2022, env="SYNC_YEAR_MAX")
+    SYNC_MODE: str = Field("bulk", env="SYNC_MODE")  # bulk | copy | orm
+    SYNC_BATCH_SIZE: int = Field(5000, env="SYNC_BATCH_SIZE")
+    SYNC_COMMIT_SIZE: int = Field(10000, env="SYNC_COMMIT_SIZE")
+    SYNC_MAX_INFLIGHT_PAGES: int = Field(2, env="SYNC_MAX_INFLIGHT_PAGES")
+    SYNC_PAGE_SIZE: int = Field(1000, env="SYNC_PAGE_SIZE")
+    SYNC_FETCH_CONCURRENCY: int = Field(4, env="SYNC_FETCH_CONCURRENCY")
+    SYNC_FETCH_RETRIES: int = Field(3, env="SYNC_FETCH_RETRIES")
+    SYNC_FETCH_BACKOFF: float = Field(0.5, env="SYNC_FETCH_BACKOFF")
+    SYNC_TRACE_MEMORY: bool = Field(False, env="SYNC_TRACE_MEMORY")  # the benchmark turns it on
+    SYNC_LOCK_TIMEOUT: int = Field(600, env="SYNC_LOCK_TIMEOUT")  # seconds, renewed every page
 
     # Celery
     CELERY_BROKER_URL: str = ""
     CELERY_RESULT_BACKEND: str = ""
+    REDIS_URL: str = ""
     CELERY_SYNC_HOUR: int = Field(0, env="CELERY_SYNC_HOUR")
     CELERY_SYNC_MINUTE: int = Field(0, env="CELERY_SYNC_MINUTE")
+    CELERY_FULL_SYNC_DAY_OF_WEEK: str = Field("sun", env="CELERY_FULL_SYNC_DAY_OF_WEEK")
     CELERY_CONCURRENCY: int = Field(1, env="CELERY_CONCURRENCY")
     CELERY_LOG_LEVEL: str = Field("info", env="CELERY_LOG_LEVEL")
 
@@ -91,6 +112,7 @@ class Config(BaseSettings):
 
         self.CELERY_BROKER_URL = f"redis://{self.REDIS_HOST}:{self.REDIS_PORT}/0"
         self.CELERY_RESULT_BACKEND = f"redis://{self.REDIS_HOST}:{self.REDIS_PORT}/0"
+        self.REDIS_URL = f"redis://{self.REDIS_HOST}:{self.REDIS_PORT}/{self.REDIS_DB}"
 
 
 config = Config()
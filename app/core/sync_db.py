@@ -2,6 +2,7 @@ from typing import Generator
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, Session
 from neo4j import GraphDatabase, Session as Neo4jSession
+import redis
 
 from app.core.config import config
 
@@ -46,3 +47,6 @@ def get_neo4j_sync_session() -> Generator[Neo4jSession, None, None]:
     with neo4j_driver.session() as session:
         yield session
 
+
+# --- Redis (sync): locks and app data, separate DB from the Celery broker ---
+redis_client = redis.Redis.from_url(config.REDIS_URL)
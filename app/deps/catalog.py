@@ -0,0 +1,10 @@
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.async_db import get_async_db, redis_async_client
+from app.utils.catalog import Catalog, catalog_cache
+
+
+async def get_catalog(db: AsyncSession = Depends(get_async_db)) -> Catalog:
+    """This worker's make/model catalog, reloaded when its Redis version moved."""
+    return await catalog_cache.get(db, redis_async_client)
@@ -10,6 +10,7 @@ from app.routers.users_routes import router as users_router
 from app.routers.auth_routes import router as auth_router
 from app.routers.reports_routes import router as reports_router
 from app.routers.makes_routes import router as makes_router
+from app.routers.sync_routes import router as sync_router
 
 
 @asynccontextmanager
@@ -37,6 +38,7 @@ app.include_router(users_router)
 app.include_router(auth_router)
 app.include_router(reports_router)
 app.include_router(makes_router)
+app.include_router(sync_router)
 
 @app.get("/", tags=["Health"])
 async def root():
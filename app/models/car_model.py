@@ -1,5 +1,5 @@
 from typing import List, Optional
-from sqlalchemy import String, ForeignKey, DateTime, func
+from sqlalchemy import String, ForeignKey, DateTime, Index, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.core.base import Base
 
@@ -11,17 +11,21 @@ class Make(Base):
     name: Mapped[str] = mapped_column(String(100), unique=True, nullable=False)
 
     # Relationships
+    # Collections never load implicitly (a make has many models, a model many
+    # cars); ask for them with selectinload(...) where needed.
     models: Mapped[List["CarModel"]] = relationship(
         "CarModel",
         back_populates="make",
         cascade="all, delete-orphan",
         passive_deletes=True,
-        lazy="selectin",
+        lazy="raise",
     )
 
 
 class CarModel(Base):
     __tablename__ = "car_models"
+    # Concurrent writers (sync, API) insert models with ON CONFLICT on this index.
+    __table_args__ = (Index("ux_car_models_make_id_name", "make_id", "name", unique=True),)
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     name: Mapped[str] = mapped_column(String(100), nullable=False)
@@ -34,7 +38,7 @@ class CarModel(Base):
         back_populates="car_model",
         cascade="all, delete-orphan",
         passive_deletes=True,
-        lazy="selectin",
+        lazy="raise",
     )
 
 
@@ -48,6 +52,8 @@ class Car(Base):
     car_model_id: Mapped[int] = mapped_column(ForeignKey("car_models.id", ondelete="CASCADE"), nullable=False)
     user_id: Mapped[Optional[int]] = mapped_column(nullable=True)
     external_id: Mapped[Optional[str]] = mapped_column(String(50), unique=True, nullable=True)
+    # Fingerprint of the Back4App source fields; unchanged records skip the sync write
+    source_hash: Mapped[Optional[str]] = mapped_column(String(32), nullable=True)
 
     created_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at: Mapped[Optional[DateTime]] = mapped_column(DateTime(timezone=True), onupdate=func.now())
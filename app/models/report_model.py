@@ -0,0 +1,44 @@
+from typing import Optional
+from sqlalchemy import String, DateTime
+from sqlalchemy.orm import Mapped, mapped_column
+from app.core.base import Base
+
+
+class CarReport(Base):
+    """
+    Read-only row of the `car_reports` materialized view: synced cars already
+    joined to their make and model, refreshed at the end of every sync that
+    changed data. The view and its indexes are managed by migrations.
+    """
+    __tablename__ = "car_reports"
+    __table_args__ = {"info": {"is_view": True}}
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(String(100))
+    year: Mapped[int]
+    make: Mapped[str] = mapped_column(String(100))
+    model: Mapped[str] = mapped_column(String(100))
+    category: Mapped[Optional[str]] = mapped_column(String(100))
+    created_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True))
+    updated_at: Mapped[Optional[DateTime]] = mapped_column(DateTime(timezone=True))
+    # Lower-cased copies for the partial-match filters (pg_trgm indexed)
+    make_lower: Mapped[str] = mapped_column(String(100))
+    model_lower: Mapped[str] = mapped_column(String(100))
+
+
+class CarReportRollup(Base):
+    """
+    Report counts per (make, model, year, category), rebuilt from `car_reports`
+    by every sync that changed data. Small enough to group on every request,
+    it answers facet counts for any make/model/year filter combination.
+    """
+    __tablename__ = "car_report_rollup"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    make: Mapped[str] = mapped_column(String(100), nullable=False)
+    model: Mapped[str] = mapped_column(String(100), nullable=False)
+    year: Mapped[int] = mapped_column(nullable=False)
+    category: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    make_lower: Mapped[str] = mapped_column(String(100), nullable=False)
+    model_lower: Mapped[str] = mapped_column(String(100), nullable=False)
+    cars: Mapped[int] = mapped_column(nullable=False)
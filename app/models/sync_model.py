@@ -0,0 +1,98 @@
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import BigInteger, Boolean, Float, Integer, JSON, String, DateTime
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+from app.core.base import Base
+
+
+class SyncState(Base):
+    """Persisted progress of a named background sync (e.g. Back4App cars)."""
+    __tablename__ = "sync_state"
+
+    name: Mapped[str] = mapped_column(String(50), primary_key=True)
+    # Highest source `updatedAt` already stored locally
+    watermark: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    # Checkpoint of an unfinished run: last committed objectId plus the filter
+    # and watermark of that run, so a restarted task can resume where it stopped.
+    checkpoint_object_id: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
+    checkpoint_since: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    checkpoint_watermark: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    # Highest watermark the run may save: its start time, or just below the
+    # earliest `updatedAt` of a record that failed, so those are fetched again.
+    checkpoint_watermark_cap: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    checkpoint_full: Mapped[bool] = mapped_column(Boolean, server_default="false", nullable=False)
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
+    )
+
+
+class SyncSeenId(Base):
+    """
+    Staging set of Back4App objectIds seen by the current full sync.
+    Logged, unlike the COPY staging table: it must survive a crash so a full
+    run resumed from its checkpoint still knows every car it saw before,
+    otherwise deletion reconciliation would remove them.
+    """
+    __tablename__ = "sync_seen_ids"
+
+    external_id: Mapped[str] = mapped_column(String(50), primary_key=True)
+
+
+class SyncCarStaging(Base):
+    """
+    Unlogged landing table for the COPY sync mode: normalized Back4App
+    records are streamed in with COPY FROM STDIN, then merged into
+    makes / car_models / cars with set-based SQL.
+    """
+    __tablename__ = "sync_car_staging"
+    __table_args__ = {"prefixes": ["UNLOGGED"]}
+
+    external_id: Mapped[str] = mapped_column(String(50), primary_key=True)
+    make: Mapped[str] = mapped_column(String(100), nullable=False)
+    model: Mapped[str] = mapped_column(String(100), nullable=False)
+    year: Mapped[int] = mapped_column(Integer, nullable=False)
+    category: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    source_hash: Mapped[str] = mapped_column(String(32), nullable=False)
+
+
+class SyncRun(Base):
+    """Telemetry for one execution of the Back4App sync."""
+    __tablename__ = "sync_runs"
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    name: Mapped[str] = mapped_column(String(50), nullable=False)
+    mode: Mapped[str] = mapped_column(String(10), nullable=False)
+    full: Mapped[bool] = mapped_column(Boolean, nullable=False)
+    status: Mapped[str] = mapped_column(String(10), nullable=False)  # running | success | failed
+
+    started_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False, index=True
+    )
+    finished_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    # Seconds spent per phase
+    fetch_seconds: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    normalize_seconds: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    postgres_seconds: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    neo4j_seconds: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    total_seconds: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+
+    # Record counts by outcome
+    fetched: Mapped[int] = mapped_column(Integer, server_default="0", nullable=False)
+    inserted: Mapped[int] = mapped_column(Integer, server_default="0", nullable=False)
+    updated: Mapped[int] = mapped_column(Integer, server_default="0", nullable=False)
+    skipped: Mapped[int] = mapped_column(Integer, server_default="0", nullable=False)
+    deleted: Mapped[int] = mapped_column(Integer, server_default="0", nullable=False)
+    errors: Mapped[int] = mapped_column(Integer, server_default="0", nullable=False)
+
+    # Peak Python heap (tracemalloc), when tracing is enabled
+    peak_memory_bytes: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)
+    error_message: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
+    error_samples: Mapped[Optional[list]] = mapped_column(JSON, nullable=True)
+    # Neo4j batch count, rows and min/max/p95/total seconds, for tuning NEO4J_BATCH_SIZE
+    graph_timings: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
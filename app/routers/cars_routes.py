@@ -5,16 +5,30 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 
-from app.core.async_db import get_async_db, get_neo4j_service, Neo4jService
+from app.core.async_db import get_async_db, get_neo4j_service, Neo4jService, redis_async_client
 from app.deps.auth import get_current_user
-from app.schemas.car_schema import CarCreate, CarUpdate, CarRead
-from app.utils.cursor_pagination import cursor_paginate, CursorPage
+from app.deps.catalog import get_catalog
+from app.schemas.car_schema import (
+    CarBulkCreate,
+    CarBulkDelete,
+    CarBulkResult,
+    CarBulkUpdate,
+    CarCreate,
+    CarRead,
+    CarUpdate,
+)
+from app.utils.catalog import Catalog, publish_catalog_changes
+from app.utils.cursor_pagination import cursor_paginate, CursorPage, InvalidCursor, TotalMode
 from app.utils.services import (
-    fetch_car_async,
     get_user_car_async,
     create_car_with_model_async,
-    update_car_data_async,
-    delete_car_async,
+    resolve_car_model_async,
+    update_user_car_async,
+    delete_user_car_async,
+    bulk_create_cars_async,
+    bulk_update_cars_async,
+    bulk_delete_cars_async,
+    complete_catalog_async,
 )
 
 #  Import the async versions
@@ -22,6 +36,9 @@ from app.utils.neo4j_service import (
     create_car_node_async,
     update_car_node_async,
     delete_car_node_async,
+    write_car_nodes_async,
+    update_car_nodes_async,
+    delete_car_nodes_async,
 )
 
 from app.models.car_model import Car, CarModel
@@ -30,6 +47,7 @@ from app.models.car_model import Car, CarModel
 DBSession = Annotated[AsyncSession, Depends(get_async_db)]
 Neo4jDep = Annotated[Neo4jService, Depends(get_neo4j_service)]
 CurrentUser = Annotated[dict, Depends(get_current_user)]
+CatalogDep = Annotated[Catalog, Depends(get_catalog)]
 
 router = APIRouter(prefix="/cars", tags=["Cars"])
 
@@ -40,6 +58,7 @@ async def create_car(
     db: DBSession,
     neo4j: Neo4jDep,
     user: CurrentUser,
+    catalog: CatalogDep,
 ):
     """Create a new car in PostgreSQL and mirror in Neo4j."""
     try:
@@ -52,21 +71,22 @@ async def create_car(
             make_id=payload.make_id,
             user_id=int(user["sub"]),
             category=payload.category,
+            catalog=catalog,
         )
         await db.commit()
-        car_data = await fetch_car_async(db, car.id)
+        await publish_catalog_changes(db, redis_async_client)
 
         # Neo4j
         await neo4j.write(
             create_car_node_async,
-            car_id=car_data.id,
-            name=car_data.name,
-            year=car_data.year,
-            category=car_data.category,
+            car_id=car["id"],
+            name=car["name"],
+            year=car["year"],
+            category=car["category"],
             make_id=payload.make_id,
             user_id=int(user["sub"]),
         )
-        return car_data
+        return car
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -76,18 +96,102 @@ async def list_cars(
     db: DBSession,
     user: CurrentUser,
     limit: int = 10,
-    cursor: Optional[int] = None,
+    cursor: Optional[str] = None,
+    include_total: TotalMode = "exact",
 ):
     """List cars owned by the current user with pagination."""
     query = (
         select(Car)
         .where(Car.user_id == int(user["sub"]))
         .options(selectinload(Car.car_model).selectinload(CarModel.make))
-        .order_by(Car.id)
-    )
-    return await cursor_paginate(
-        query, db, schema=CarRead, limit=limit, cursor=cursor
     )
+    try:
+        return await cursor_paginate(
+            query, db, schema=CarRead, limit=limit, cursor=cursor, include_total=include_total
+        )
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+def _bulk_result(results: list) -> dict:
+    failed = sum(1 for result in results if result["status"] == "error")
+    return {"succeeded": len(results) - failed, "failed": failed, "results": results}
+
+
+def _graph_rows(results: list, user_id: int) -> list:
+    return [
+        {
+            "car_id": result["id"],
+            "name": result["car"]["name"],
+            "year": result["car"]["year"],
+            "category": result["car"]["category"],
+            "make_id": result["car"]["car_model"].make_id,
+            "user_id": user_id,
+        }
+        for result in results
+        if result["status"] != "error"
+    ]
+
+
+@router.post("/bulk", response_model=CarBulkResult)
+async def bulk_create_cars(
+    payload: CarBulkCreate,
+    db: DBSession,
+    neo4j: Neo4jDep,
+    user: CurrentUser,
+    catalog: CatalogDep,
+):
+    """Create many cars in one transaction; invalid items are reported, not written."""
+    user_id = int(user["sub"])
+    results = await bulk_create_cars_async(db, [car.model_dump() for car in payload.cars], user_id, catalog)
+    await db.commit()
+    await publish_catalog_changes(db, redis_async_client)
+
+    # Neo4j
+    rows = _graph_rows(results, user_id)
+    if rows:
+        await neo4j.write(write_car_nodes_async, rows=rows)
+    return _bulk_result(results)
+
+
+@router.patch("/bulk", response_model=CarBulkResult)
+async def bulk_patch_cars(
+    payload: CarBulkUpdate,
+    db: DBSession,
+    neo4j: Neo4jDep,
+    user: CurrentUser,
+    catalog: CatalogDep,
+):
+    """Partially update many of the user's cars in one transaction."""
+    user_id = int(user["sub"])
+    items = [car.model_dump(exclude_unset=True) for car in payload.cars]
+    results = await bulk_update_cars_async(db, items, user_id, catalog)
+    await db.commit()
+    await publish_catalog_changes(db, redis_async_client)
+
+    # Neo4j
+    rows = _graph_rows(results, user_id)
+    if rows:
+        await neo4j.write(update_car_nodes_async, rows=rows)
+    return _bulk_result(results)
+
+
+@router.delete("/bulk", response_model=CarBulkResult)
+async def bulk_delete_cars(
+    payload: CarBulkDelete,
+    db: DBSession,
+    neo4j: Neo4jDep,
+    user: CurrentUser,
+):
+    """Delete many of the user's cars in one transaction."""
+    results = await bulk_delete_cars_async(db, payload.ids, int(user["sub"]))
+    await db.commit()
+
+    # Neo4j
+    deleted = [result["id"] for result in results if result["status"] == "deleted"]
+    if deleted:
+        await neo4j.write(delete_car_nodes_async, car_ids=deleted)
+    return _bulk_result(results)
 
 
 @router.get("/{car_id}", response_model=CarRead)
@@ -95,10 +199,11 @@ async def get_car(
     car_id: int,
     db: DBSession,
     user: CurrentUser,
+    catalog: CatalogDep,
 ):
     """Fetch a single car if owned by the user."""
     try:
-        return await get_user_car_async(db, car_id, int(user["sub"]))
+        return await get_user_car_async(db, car_id, int(user["sub"]), catalog)
     except ValueError:
         raise HTTPException(status_code=404, detail="Car not found")
 
@@ -110,17 +215,18 @@ async def patch_car(
     db: DBSession,
     neo4j: Neo4jDep,
     user: CurrentUser,
+    catalog: CatalogDep,
 ):
     """Partially update a car (only provided fields)."""
     update_data = payload.dict(exclude_unset=True)
+    fields = {k: v for k, v in update_data.items() if k in ("name", "year", "category")}
     try:
-        car = await get_user_car_async(db, car_id, int(user["sub"]))
-        car = await update_car_data_async(db, car, update_data)
+        car = await update_user_car_async(db, car_id, int(user["sub"]), fields, catalog)
         await db.commit()
 
         # Neo4j
         if update_data:
-            await neo4j.write(update_car_node_async, car_id=car.id, updates=update_data)
+            await neo4j.write(update_car_node_async, car_id=car["id"], updates=update_data)
 
         return car
     except ValueError as e:
@@ -134,6 +240,7 @@ async def put_car(
     db: DBSession,
     neo4j: Neo4jDep,
     user: CurrentUser,
+    catalog: CatalogDep,
 ):
     """Replace a car with new data (PUT)."""
     update_data = {
@@ -143,21 +250,26 @@ async def put_car(
         "make_id": payload.make_id,
     }
 
-    car_model_name = payload.car_model_name
     if payload.car_model_id:
-        car_model = await db.get(CarModel, payload.car_model_id)
-        if not car_model:
+        # The worker's catalog may predate the model; only 404 if PostgreSQL lacks it too.
+        await complete_catalog_async(db, catalog, [payload.make_id], [payload.car_model_id])
+        if payload.car_model_id not in catalog.models_by_id:
             raise HTTPException(status_code=404, detail="CarModel not found")
-        car_model_name = None
 
     try:
-        car = await get_user_car_async(db, car_id, int(user["sub"]))
-        car = await update_car_data_async(db, car, update_data, car_model_name, payload.make_id)
+        fields = {k: v for k, v in update_data.items() if k != "make_id"}
+        if payload.car_model_id or payload.car_model_name:
+            model = await resolve_car_model_async(
+                db, catalog, payload.make_id, payload.car_model_id, payload.car_model_name
+            )
+            fields["car_model_id"] = model.id
+        car = await update_user_car_async(db, car_id, int(user["sub"]), fields, catalog)
         await db.commit()
+        await publish_catalog_changes(db, redis_async_client)
 
         # Neo4j
         if update_data:
-            await neo4j.write(update_car_node_async, car_id=car.id, updates=update_data)
+            await neo4j.write(update_car_node_async, car_id=car["id"], updates=update_data)
 
         return car
     except ValueError as e:
@@ -173,12 +285,10 @@ async def delete_car_route(
 ):
     """Delete a car from PostgreSQL and Neo4j."""
     try:
-        car = await get_user_car_async(db, car_id, int(user["sub"]))
-        await delete_car_async(db, car)
+        await delete_user_car_async(db, car_id, int(user["sub"]))
         await db.commit()
 
         # Neo4j
-        await neo4j.write(delete_car_node_async, car_id=car.id)
+        await neo4j.write(delete_car_node_async, car_id=car_id)
     except ValueError:
         raise HTTPException(status_code=404, detail="Car not found")
-
@@ -1,20 +1,29 @@
 from datetime import datetime
 from typing import Annotated, Optional
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
+from pydantic_core import to_json
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.async_db import get_async_db
+from app.core.async_db import get_async_db, redis_async_client
+from app.core.config import config
 from app.deps.auth import get_current_user
-from app.schemas.car_schema import CarReportRead, CarSearchQuery
-from app.utils.cursor_pagination import cursor_paginate, CursorPage
-from app.utils.services import build_car_reports_query, car_to_report_dict
+from app.models.report_model import CarReport
+from app.schemas.car_schema import CarReportRead, CarSearchQuery, ReportFacetsRead, ReportSort, ReportsCacheStatsRead
+from app.utils.cache import cache_stats, filters_cache_key, get_or_build
+from app.utils.cursor_pagination import cursor_paginate_rows, decode_cursor, CursorPage, InvalidCursor, TotalMode
+from app.utils.report_export import EXPORT_MEDIA_TYPES, ExportFormat, encode_export, stream_report_rows
+from app.utils.services import build_car_reports_query, get_report_facets_async, report_keyset
 
 DBSession = Annotated[AsyncSession, Depends(get_async_db)]
 CurrentUser = Annotated[dict, Depends(get_current_user)]
 
 router = APIRouter(prefix="/reports", tags=["Reports"])
 
+REPORTS_CACHE_NAMESPACE = "reports:page"
+REPORTS_FACETS_CACHE_NAMESPACE = "reports:facets"
+
 
 @router.get("/", response_model=CursorPage[CarReportRead])
 async def search_reports(
@@ -26,13 +35,18 @@ async def search_reports(
     date_from: Optional[datetime] = Query(None, description="Filter reports created on or after this date"),
     date_to: Optional[datetime] = Query(None, description="Filter reports created on or before this date"),
     limit: int = Query(10, ge=1, le=100),
-    cursor: Optional[int] = Query(None, description="Pagination cursor (last seen car id)"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from next_cursor / prev_cursor"),
+    sort: ReportSort = Query("id", description="Sort key, '-' prefix for descending"),
+    include_total: TotalMode = Query(
+        "exact", description="Total: exact count (cached until the next sync), planner estimate, or omitted"
+    ),
 ):
     """
     Search car registration reports synced from Back4App.
 
     Authenticated users can filter by make, model, year, and registration date.
-    Results are paginated using cursor-based pagination.
+    Results are paginated with keyset cursors in the chosen sort order; every
+    page, forward or backward, is an index range seek.
     """
     search = CarSearchQuery(
         make=make,
@@ -42,21 +56,102 @@ async def search_reports(
         date_to=date_to,
         limit=limit,
         cursor=cursor,
+        sort=sort,
+        include_total=include_total,
     )
+    keyset = report_keyset(search.sort)
+    if search.cursor:
+        try:
+            decode_cursor(keyset, search.cursor)
+        except InvalidCursor as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    async def build_page() -> bytes:
+        query = build_car_reports_query(
+            make=search.make,
+            model=search.model,
+            year=search.year,
+            date_from=search.date_from,
+            date_to=search.date_to,
+        )
+        page = await cursor_paginate_rows(
+            query,
+            db,
+            keyset=keyset,
+            limit=search.limit,
+            cursor=search.cursor,
+            include_total=search.include_total,
+            total_cache_key="reports:" + filters_cache_key(search.model_dump(exclude={"limit", "cursor", "sort", "include_total"})),
+        )
+        # Rows already have the CarReportRead shape; serialize them without
+        # building (and re-validating) a model per row.
+        return to_json(page)
+
+    # Pages are cached per normalized search until the next sync changes data
+    body, hit = await get_or_build(redis_async_client, REPORTS_CACHE_NAMESPACE, filters_cache_key(search.model_dump()), build_page)
+    return Response(content=body, media_type="application/json", headers={"X-Cache": "HIT" if hit else "MISS"})
+
 
+@router.get("/export")
+async def export_reports(
+    user: CurrentUser,
+    format: ExportFormat = Query("csv", description="csv or ndjson"),
+    gzip: bool = Query(False, description="gzip-compress the stream (Content-Encoding: gzip)"),
+    make: Optional[str] = Query(None, description="Filter by car make (partial match)"),
+    model: Optional[str] = Query(None, description="Filter by car model (partial match)"),
+    year: Optional[int] = Query(None, ge=2012, le=2022, description="Filter by manufacturing year"),
+    date_from: Optional[datetime] = Query(None, description="Filter reports created on or after this date"),
+    date_to: Optional[datetime] = Query(None, description="Filter reports created on or before this date"),
+):
+    """
+    Stream every report matching the filters as CSV or NDJSON, ordered by id.
+    Rows are read through a server-side cursor and sent in chunks, so the
+    export size does not affect memory use.
+    """
+    search = CarSearchQuery(make=make, model=model, year=year, date_from=date_from, date_to=date_to)
     query = build_car_reports_query(
         make=search.make,
         model=search.model,
         year=search.year,
         date_from=search.date_from,
         date_to=search.date_to,
-    )
+    ).order_by(CarReport.id)
 
-    return await cursor_paginate(
-        query,
-        db,
-        schema=CarReportRead,
-        limit=search.limit,
-        cursor=search.cursor,
-        item_mapper=car_to_report_dict,
+    headers = {"Content-Disposition": f'attachment; filename="reports.{format}"'}
+    if gzip:
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(
+        encode_export(stream_report_rows(query, config.REPORTS_EXPORT_BATCH_SIZE), format, compress=gzip),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers=headers,
     )
+
+
+@router.get("/facets", response_model=ReportFacetsRead)
+async def report_facets(
+    db: DBSession,
+    user: CurrentUser,
+    make: Optional[str] = Query(None, description="Filter by car make (partial match)"),
+    model: Optional[str] = Query(None, description="Filter by car model (partial match)"),
+    year: Optional[int] = Query(None, ge=2012, le=2022, description="Filter by manufacturing year"),
+    date_from: Optional[datetime] = Query(None, description="Filter reports created on or after this date"),
+    date_to: Optional[datetime] = Query(None, description="Filter reports created on or before this date"),
+):
+    """
+    Report counts by make, year and category under the current filters.
+    Served from the rollup the sync rebuilds; date filters are grouped live.
+    """
+    search = CarSearchQuery(make=make, model=model, year=year, date_from=date_from, date_to=date_to)
+    filters = search.model_dump(exclude={"limit", "cursor", "sort", "include_total"})
+
+    async def build_facets() -> bytes:
+        return to_json(await get_report_facets_async(db, **filters))
+
+    body, hit = await get_or_build(redis_async_client, REPORTS_FACETS_CACHE_NAMESPACE, filters_cache_key(filters), build_facets)
+    return Response(content=body, media_type="application/json", headers={"X-Cache": "HIT" if hit else "MISS"})
+
+
+@router.get("/cache", response_model=ReportsCacheStatsRead, response_model_exclude_none=True)
+async def reports_cache_stats(user: CurrentUser):
+    """Hit/miss counters of the /reports response cache and the current sync generation."""
+    return await cache_stats(redis_async_client, REPORTS_CACHE_NAMESPACE)
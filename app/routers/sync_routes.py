@@ -0,0 +1,50 @@
+from typing import Annotated, List
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.async_db import get_async_db
+from app.core.sync_db import redis_client
+from app.deps.auth import get_current_user
+from app.schemas.sync_schema import SyncRunRead, SyncTaskRead, SyncTriggerCreate
+from app.utils.services import list_sync_runs_async
+from car_tasks.celery_app import celery
+from car_tasks.sync_cars import SYNC_LOCK_KEY, sync_car_data
+
+DBSession = Annotated[AsyncSession, Depends(get_async_db)]
+CurrentUser = Annotated[dict, Depends(get_current_user)]
+
+router = APIRouter(prefix="/sync", tags=["Sync"])
+
+
+@router.get("/runs", response_model=List[SyncRunRead])
+async def list_sync_runs(
+    db: DBSession,
+    user: CurrentUser,
+    limit: int = Query(20, ge=1, le=100),
+):
+    """Recent Back4App sync runs, newest first, with per-phase timings and counts."""
+    return await list_sync_runs_async(db, limit=limit)
+
+
+# Celery and the sync Redis client block, so these routes run in the threadpool.
+@router.post("/tasks", response_model=SyncTaskRead, status_code=status.HTTP_202_ACCEPTED)
+def trigger_sync(payload: SyncTriggerCreate, user: CurrentUser):
+    """Queue a Back4App sync now. Rejected while another sync holds the lock."""
+    if redis_client.exists(SYNC_LOCK_KEY):
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="A sync is already running")
+
+    task = sync_car_data.apply_async(kwargs={"mode": payload.mode, "full": payload.full})
+    return SyncTaskRead(task_id=task.id, state=task.state)
+
+
+@router.get("/tasks/{task_id}", response_model=SyncTaskRead)
+def get_sync_task(task_id: str, user: CurrentUser):
+    """Poll a sync task: live progress (pages fetched, rows written) while running, summary when done."""
+    task = celery.AsyncResult(task_id)
+    info = task.info if isinstance(task.info, dict) else None
+    if task.state == "PROGRESS":
+        return SyncTaskRead(task_id=task_id, state=task.state, progress=info)
+    if task.state == "SUCCESS":
+        return SyncTaskRead(task_id=task_id, state=task.state, result=info)
+    return SyncTaskRead(task_id=task_id, state=task.state)
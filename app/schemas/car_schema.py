@@ -1,10 +1,13 @@
 from __future__ import annotations
-from typing import Optional, List
+from typing import Literal, Optional, List, Union
 from datetime import datetime
 from pydantic import BaseModel, Field
 
 from pydantic.fields import computed_field
 
+from app.core.config import config
+from app.utils.cursor_pagination import TotalMode
+
 
 class CarBase(BaseModel):
     name: Optional[str] = None
@@ -28,6 +31,23 @@ class CarUpdate(CarBase):
     pass
 
 
+class CarBulkCreate(BaseModel):
+    cars: List[CarCreate] = Field(..., min_length=1, max_length=config.CARS_BULK_MAX_ITEMS)
+
+
+class CarBulkUpdateItem(CarUpdate):
+    id: int = Field(..., description="ID of the car to update")
+
+
+class CarBulkUpdate(BaseModel):
+    """Partial updates; only the fields set on an item change."""
+    cars: List[CarBulkUpdateItem] = Field(..., min_length=1, max_length=config.CARS_BULK_MAX_ITEMS)
+
+
+class CarBulkDelete(BaseModel):
+    ids: List[int] = Field(..., min_length=1, max_length=config.CARS_BULK_MAX_ITEMS)
+
+
 class MakeRead(BaseModel):
     id: int
     name: str
@@ -63,6 +83,21 @@ class CarRead(BaseModel):
         return f"{make_name} {model_name} {self.year}"
 
 
+class CarBulkItemResult(BaseModel):
+    index: int = Field(..., description="Position of the item in the request")
+    status: Literal["created", "updated", "deleted", "error"]
+    id: Optional[int] = None
+    car: Optional[CarRead] = None
+    error: Optional[str] = None
+
+
+class CarBulkResult(BaseModel):
+    """Per-item outcome of a bulk request; successful items share one transaction."""
+    succeeded: int
+    failed: int
+    results: List[CarBulkItemResult]
+
+
 class CarSimplifiedRead(BaseModel):
     id: int
     name: str
@@ -81,6 +116,9 @@ class CarReportRead(CarSimplifiedRead):
     pass
 
 
+ReportSort = Literal["id", "-id", "created_at", "-created_at", "year", "-year", "make", "-make"]
+
+
 class CarSearchQuery(BaseModel):
     """Validated query parameters for searching car registration reports."""
     make: Optional[str] = Field(None, max_length=100)
@@ -89,7 +127,32 @@ class CarSearchQuery(BaseModel):
     date_from: Optional[datetime] = None
     date_to: Optional[datetime] = None
     limit: int = Field(10, ge=1, le=100)
-    cursor: Optional[int] = Field(None, ge=1)
+    cursor: Optional[str] = Field(None, max_length=512)
+    sort: ReportSort = "id"
+    include_total: TotalMode = "exact"
+
+
+class FacetCount(BaseModel):
+    value: Optional[Union[int, str]] = None
+    count: int
+
+
+class ReportFacetsRead(BaseModel):
+    """Report counts per facet value under the current filters."""
+    make: List[FacetCount]
+    year: List[FacetCount]
+    category: List[FacetCount]
+    source: Literal["rollup", "live"]
+
+
+class ReportsCacheStatsRead(BaseModel):
+    """Counters of the /reports response cache; only `available` is set while Redis is down."""
+    available: bool = True
+    generation: Optional[int] = None
+    hits: Optional[int] = None
+    misses: Optional[int] = None
+    hit_ratio: Optional[float] = None
+
 
 class PaginatedCars(BaseModel):
     total: int
@@ -0,0 +1,63 @@
+from typing import Any, Dict, Optional, List, Literal
+from datetime import datetime
+from pydantic import BaseModel, Field
+
+
+class SyncErrorSample(BaseModel):
+    external_id: Optional[str] = None
+    error: str
+
+
+class SyncGraphTimings(BaseModel):
+    """Neo4j batches of a run: how many, how many rows and how long they took."""
+    batches: int
+    rows: int
+    seconds: float
+    min_seconds: float
+    max_seconds: float
+    p95_seconds: float
+
+
+class SyncRunRead(BaseModel):
+    """One execution of the Back4App sync, with timings and outcome counts."""
+    id: int
+    name: str
+    mode: str
+    full: bool
+    status: str
+    started_at: datetime
+    finished_at: Optional[datetime] = None
+
+    fetch_seconds: Optional[float] = None
+    normalize_seconds: Optional[float] = None
+    postgres_seconds: Optional[float] = None
+    neo4j_seconds: Optional[float] = None
+    total_seconds: Optional[float] = None
+
+    fetched: int
+    inserted: int
+    updated: int
+    skipped: int
+    deleted: int
+    errors: int
+
+    peak_memory_bytes: Optional[int] = None
+    error_message: Optional[str] = None
+    error_samples: Optional[List[SyncErrorSample]] = None
+    graph_timings: Optional[SyncGraphTimings] = None
+
+    model_config = {"from_attributes": True}
+
+
+class SyncTriggerCreate(BaseModel):
+    """Request to queue a sync run."""
+    full: bool = Field(False, description="Re-read the whole year window instead of changes only")
+    mode: Optional[Literal["bulk", "copy", "orm"]] = Field(None, description="Write path (defaults to SYNC_MODE)")
+
+
+class SyncTaskRead(BaseModel):
+    """State of a queued or running sync task."""
+    task_id: str
+    state: str
+    progress: Optional[Dict[str, Any]] = None
+    result: Optional[Dict[str, Any]] = None
@@ -0,0 +1,96 @@
+"""
+Per-row cost of serving a /reports page: ORM entities versus column rows.
+
+Loads `--rows` generated reports into an in-memory SQLite copy of the
+`car_reports` table and times, per row, the two ways of turning a page into
+a JSON response body:
+
+- entity: select(CarReport) -> ORM instances -> CarReportRead.model_validate
+  -> CursorPage -> JSON (what FastAPI does with a response_model)
+- rows:   select(*REPORT_COLUMNS) -> dict rows -> JSON
+
+    python -m app.utils.benchmark_reports --rows 100 --iterations 500
+"""
+import argparse
+import time
+from datetime import datetime, timedelta, timezone
+
+from pydantic import TypeAdapter
+from pydantic_core import to_json
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import Session
+
+from app.models.report_model import CarReport
+from app.schemas.car_schema import CarReportRead
+from app.utils.cursor_pagination import CursorPage
+from app.utils.services import REPORT_COLUMNS
+
+
+def _seed(session: Session, rows: int) -> None:
+    stamp = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    session.execute(
+        insert(CarReport),
+        [
+            {
+                "id": i,
+                "name": "Toyota Corolla",
+                "year": 2012 + i % 11,
+                "make": "Toyota",
+                "model": "Corolla",
+                "category": "Sedan",
+                "created_at": stamp + timedelta(hours=i),
+                "updated_at": stamp + timedelta(days=i),
+                "make_lower": "toyota",
+                "model_lower": "corolla",
+            }
+            for i in range(1, rows + 1)
+        ],
+    )
+    session.commit()
+
+
+def _entity_page(session: Session, adapter: TypeAdapter) -> bytes:
+    cars = session.execute(select(CarReport).order_by(CarReport.id)).scalars().all()
+    page = CursorPage[CarReportRead](
+        total=len(cars),
+        items=[CarReportRead.model_validate(car) for car in cars],
+        next_cursor=cars[-1].id,
+    )
+    return adapter.dump_json(page)
+
+
+def _rows_page(session: Session) -> bytes:
+    items = [dict(row) for row in session.execute(select(*REPORT_COLUMNS).order_by(CarReport.id)).mappings()]
+    return to_json({"total": len(items), "items": items, "next_cursor": items[-1]["id"]})
+
+
+def _time_per_row(fn, iterations: int, rows: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - started) / (iterations * rows) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare per-row cost of ORM and column-row report pages.")
+    parser.add_argument("--rows", type=int, default=100, help="rows per page")
+    parser.add_argument("--iterations", type=int, default=500)
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://")
+    CarReport.__table__.create(engine)
+    adapter = TypeAdapter(CursorPage[CarReportRead])
+
+    with Session(engine) as session:
+        _seed(session, args.rows)
+        # Fresh session state per page, as in a request
+        entity_us = _time_per_row(lambda: (_entity_page(session, adapter), session.expunge_all()), args.iterations, args.rows)
+        rows_us = _time_per_row(lambda: _rows_page(session), args.iterations, args.rows)
+
+    print(f"{args.rows} rows/page x {args.iterations} pages")
+    print(f"  entity: {entity_us:6.2f} us/row")
+    print(f"  rows:   {rows_us:6.2f} us/row ({entity_us / rows_us:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
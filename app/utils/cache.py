@@ -0,0 +1,103 @@
+import hashlib
+import json
+import logging
+from datetime import date, datetime
+from typing import Awaitable, Callable, Iterable
+
+from redis.exceptions import RedisError
+
+from app.core.config import config
+
+logger = logging.getLogger(__name__)
+
+SYNC_GENERATION_KEY = "sync:generation"
+
+
+def filters_cache_key(filters: dict, case_insensitive: Iterable[str] = ("make", "model")) -> str:
+    """
+    Stable key for a set of search filters. Empty filters are dropped and
+    strings trimmed; `case_insensitive` ones are lower-cased too, matching how
+    the partial-match filters are applied (cursors must keep their case).
+    """
+    normalized = {}
+    for name, value in filters.items():
+        if value is None or value == "":
+            continue
+        if isinstance(value, str):
+            value = value.strip()
+            if name in case_insensitive:
+                value = value.lower()
+        elif isinstance(value, (datetime, date)):
+            value = value.isoformat()
+        normalized[name] = value
+    payload = json.dumps(normalized, sort_keys=True, separators=(",", ":"))
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+async def get_sync_generation(redis) -> int:
+    """Current sync generation; bumped whenever a sync changes the data."""
+    value = await redis.get(SYNC_GENERATION_KEY)
+    return int(value) if value is not None else 0
+
+
+def bump_sync_generation_sync(redis) -> int:
+    """Invalidate everything cached against the previous generation (Celery)."""
+    return redis.incr(SYNC_GENERATION_KEY)
+
+
+async def get_or_build(redis, namespace: str, key: str, build: Callable[[], Awaitable[bytes]]) -> tuple[bytes, bool]:
+    """
+    Serve a serialized response from `namespace:<generation>:key`, building and
+    storing it on a miss. Returns `(body, hit)` and counts hits and misses per
+    namespace. The sync refreshes data before bumping the generation, so an
+    entry stored under the current generation never predates it. Redis
+    failures fall back to building the response.
+    """
+    try:
+        generation = await get_sync_generation(redis)
+        redis_key = f"{namespace}:{generation}:{key}"
+        cached = await redis.get(redis_key)
+    except RedisError:
+        logger.warning("Response cache unavailable for %s", namespace, exc_info=True)
+        return await build(), False
+
+    if cached is not None:
+        await _count(redis, f"{namespace}:hits")
+        return cached, True
+
+    body = await build()
+    try:
+        await redis.set(redis_key, body, ex=config.REPORTS_CACHE_TTL)
+    except RedisError:
+        logger.warning("Could not cache %s", redis_key, exc_info=True)
+    await _count(redis, f"{namespace}:misses")
+    return body, False
+
+
+async def _count(redis, key: str) -> None:
+    try:
+        await redis.incr(key)
+    except RedisError:
+        pass
+
+
+async def cache_stats(redis, namespace: str) -> dict:
+    """
+    Hit/miss counters of a response cache namespace and the current generation,
+    or just `{"available": False}` while Redis is unreachable.
+    """
+    try:
+        generation = await get_sync_generation(redis)
+        hits, misses = await redis.mget(f"{namespace}:hits", f"{namespace}:misses")
+    except RedisError:
+        logger.warning("Cache stats unavailable for %s", namespace, exc_info=True)
+        return {"available": False}
+    hits, misses = int(hits or 0), int(misses or 0)
+    lookups = hits + misses
+    return {
+        "available": True,
+        "generation": generation,
+        "hits": hits,
+        "misses": misses,
+        "hit_ratio": hits / lookups if lookups else 0.0,
+    }
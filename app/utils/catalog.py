@@ -0,0 +1,160 @@
+"""
+Per-worker, in-memory copy of the make/model catalog.
+
+The catalog is small and only changes when a sync or a user write adds makes
+or models, so each API worker keeps it in memory and serves `/makes` and
+model-name resolution without touching PostgreSQL. Writers bump
+`catalog:version` in Redis after committing; workers compare it on every
+lookup (one Redis GET) and reload the catalog when it moved.
+"""
+import asyncio
+import bisect
+import logging
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from redis.exceptions import RedisError
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.car_model import CarModel, Make
+
+logger = logging.getLogger(__name__)
+
+CATALOG_VERSION_KEY = "catalog:version"
+# Set in `session.info` by writes that add makes or models.
+CATALOG_CHANGED = "catalog_changed"
+
+
+@dataclass(frozen=True)
+class MakeEntry:
+    id: int
+    name: str
+
+
+@dataclass(frozen=True)
+class ModelEntry:
+    id: int
+    name: str
+    make_id: int
+    make: MakeEntry
+
+
+@dataclass
+class Catalog:
+    """Makes and models by id and by name; entries read like `MakeRead` / `CarModelRead`."""
+
+    version: Optional[bytes] = None
+    makes: List[MakeEntry] = field(default_factory=list)  # by name
+    makes_by_id: Dict[int, MakeEntry] = field(default_factory=dict)
+    make_ids: Dict[str, int] = field(default_factory=dict)
+    models_by_id: Dict[int, ModelEntry] = field(default_factory=dict)
+    model_ids: Dict[Tuple[int, str], int] = field(default_factory=dict)
+    models_by_make: Dict[int, List[ModelEntry]] = field(default_factory=dict)  # by name
+
+    @classmethod
+    def from_rows(
+        cls,
+        makes: List[Tuple[int, str]],
+        models: List[Tuple[int, str, int]],
+        version: Optional[bytes] = None,
+    ) -> "Catalog":
+        """Build from `(id, name)` make rows and `(id, name, make_id)` model rows."""
+        catalog = cls(version=version)
+        for make_id, name in sorted(makes, key=lambda row: row[1]):
+            make = MakeEntry(make_id, name)
+            catalog.makes.append(make)
+            catalog.makes_by_id[make_id] = make
+            catalog.make_ids[name] = make_id
+        for model_id, name, make_id in sorted(models, key=lambda row: row[1]):
+            model = ModelEntry(model_id, name, make_id, catalog.makes_by_id[make_id])
+            catalog.models_by_id[model_id] = model
+            catalog.model_ids[(make_id, name)] = model_id
+            catalog.models_by_make.setdefault(make_id, []).append(model)
+        return catalog
+
+    def models_for(self, make_id: int) -> Optional[List[ModelEntry]]:
+        """Models of a make by name, or None if the make does not exist."""
+        if make_id not in self.makes_by_id:
+            return None
+        return self.models_by_make.get(make_id, [])
+
+    def model_id(self, make_id: int, name: str) -> Optional[int]:
+        return self.model_ids.get((make_id, name))
+
+    def add_make(self, make_id: int, name: str) -> MakeEntry:
+        """Add a make this copy missed (it was loaded before the make was created)."""
+        if make_id in self.makes_by_id:
+            return self.makes_by_id[make_id]
+        make = MakeEntry(make_id, name)
+        bisect.insort(self.makes, make, key=lambda entry: entry.name)
+        self.makes_by_id[make_id] = make
+        self.make_ids[name] = make_id
+        return make
+
+    def add_model(self, model_id: int, name: str, make_id: int, make_name: str) -> ModelEntry:
+        """Add a model (and its make) this copy missed."""
+        if model_id in self.models_by_id:
+            return self.models_by_id[model_id]
+        model = ModelEntry(model_id, name, make_id, self.add_make(make_id, make_name))
+        self.models_by_id[model_id] = model
+        self.model_ids[(make_id, name)] = model_id
+        bisect.insort(self.models_by_make.setdefault(make_id, []), model, key=lambda entry: entry.name)
+        return model
+
+
+async def load_catalog_async(session: AsyncSession, version: Optional[bytes] = None) -> Catalog:
+    makes = (await session.execute(select(Make.id, Make.name))).all()
+    models = (await session.execute(select(CarModel.id, CarModel.name, CarModel.make_id))).all()
+    return Catalog.from_rows(makes, models, version)
+
+
+class CatalogCache:
+    """Holds this worker's catalog and reloads it when the Redis version changes."""
+
+    def __init__(self, load: Callable[[AsyncSession, Optional[bytes]], Awaitable[Catalog]] = load_catalog_async):
+        self._load = load
+        self._catalog: Optional[Catalog] = None
+        self._lock = asyncio.Lock()
+        self.reloads = 0
+
+    async def get(self, session: AsyncSession, redis) -> Catalog:
+        try:
+            version = await redis.get(CATALOG_VERSION_KEY)
+        except RedisError:
+            # Without the version nothing says the copy is current; read through.
+            logger.warning("Catalog version unavailable; loading from PostgreSQL", exc_info=True)
+            return await self._load(session, None)
+
+        catalog = self._catalog
+        if catalog is not None and catalog.version == version:
+            return catalog
+        async with self._lock:
+            if self._catalog is None or self._catalog.version != version:
+                # Stamped with the version read *before* loading, so a bump
+                # that lands mid-load triggers another reload next time.
+                self._catalog = await self._load(session, version)
+                self.reloads += 1
+            return self._catalog
+
+    def clear(self) -> None:
+        self._catalog = None
+
+
+catalog_cache = CatalogCache()
+
+
+async def publish_catalog_changes(session: AsyncSession, redis) -> None:
+    """Bump the catalog version if the committed transaction added makes or models."""
+    if not session.info.pop(CATALOG_CHANGED, False):
+        return
+    try:
+        await redis.incr(CATALOG_VERSION_KEY)
+    except RedisError:
+        # Other workers keep serving their copy without the new entries until the next bump.
+        logger.warning("Could not bump the catalog version", exc_info=True)
+
+
+def bump_catalog_version_sync(redis) -> int:
+    """Make every API worker reload its catalog (Celery)."""
+    return redis.incr(CATALOG_VERSION_KEY)
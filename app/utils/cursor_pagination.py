@@ -1,50 +1,257 @@
-from typing import Generic, List, TypeVar, Optional, Type, Callable
+import base64
+import binascii
+import json
+import logging
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Generic, List, Literal, Sequence, TypeVar, Optional, Type, Callable, get_args
 from pydantic import BaseModel
+from redis.exceptions import RedisError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select, func, tuple_
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+from app.core.async_db import redis_async_client
+from app.core.config import config
+from app.utils.cache import get_sync_generation
+
+logger = logging.getLogger(__name__)
 
 T = TypeVar("T", bound=BaseModel)
 
+# exact: count(*) (cached per filter set when a cache key is given)
+# estimated: the planner's row estimate, no scan
+# none: total is omitted
+TotalMode = Literal["exact", "estimated", "none"]
+TOTAL_MODES = get_args(TotalMode)
+
 
 class CursorPage(BaseModel, Generic[T]):
     """Generic schema for cursor-based pagination."""
-    total: int
+    total: Optional[int] = None
     items: List[T]
-    next_cursor: Optional[int] = None
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
+
+
+class InvalidCursor(ValueError):
+    """A cursor that is malformed or was issued for a different sort."""
+
+
+@dataclass(frozen=True)
+class Keyset:
+    """
+    Sort key for keyset pagination. `columns` end with a unique tie-breaker
+    (the id) and share one direction, so "after this row" is a single row
+    comparison, `(a, id) > (:a, :id)`, that an index on `(a, id)` serves as a
+    range seek in either direction.
+    """
+    columns: tuple
+    descending: bool = False
+
+    @property
+    def name(self) -> str:
+        return ("-" if self.descending else "") + ",".join(column.key for column in self.columns)
+
+    def values_of(self, row) -> list:
+        return [getattr(row, column.key) for column in self.columns]
+
+
+def id_keyset(query, model_id_field: str = "id") -> Keyset:
+    """Ascending id order on the query's first entity (the historical default)."""
+    model = query.column_descriptions[0]["entity"]
+    return Keyset((getattr(model, model_id_field),))
+
+
+def _dump_value(value: Any) -> Any:
+    return value.isoformat() if isinstance(value, (datetime, date)) else value
+
+
+def _load_value(column, value: Any) -> Any:
+    python_type = column.type.python_type
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is date:
+        return date.fromisoformat(value)
+    return value
+
+
+def encode_cursor(keyset: Keyset, values: Sequence, backward: bool = False) -> str:
+    """Opaque cursor: the sort key of a boundary row and the paging direction."""
+    payload = {"k": keyset.name, "v": [_dump_value(v) for v in values]}
+    if backward:
+        payload["b"] = 1
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(keyset: Keyset, cursor: str) -> tuple[list, bool]:
+    """Return `(key values, backward)`; plain integer cursors mean "id greater than"."""
+    if cursor.isdigit() and len(keyset.columns) == 1 and not keyset.descending:
+        return [int(cursor)], False
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        values = payload["v"]
+        name = payload["k"]
+    except (ValueError, TypeError, KeyError, binascii.Error):
+        raise InvalidCursor("Malformed cursor")
+    if name != keyset.name or len(values) != len(keyset.columns):
+        raise InvalidCursor("Cursor was issued for a different sort order")
+    try:
+        loaded = [_load_value(column, value) for column, value in zip(keyset.columns, values)]
+    except (ValueError, TypeError):
+        raise InvalidCursor("Malformed cursor")
+    return loaded, bool(payload.get("b"))
+
+
+class Explain(Executable, ClauseElement):
+    """`EXPLAIN` of a statement, compiled with its bound parameters."""
+
+    inherit_cache = False
+
+    def __init__(self, statement, format: Optional[str] = None):
+        self.statement = statement
+        self.format = format
+
+
+@compiles(Explain)
+def _compile_explain(element: Explain, compiler, **kw) -> str:
+    options = f"(FORMAT {element.format}) " if element.format else ""
+    return f"EXPLAIN {options}" + compiler.process(element.statement, **kw)
+
+
+def build_page_query(query, keyset: Optional[Keyset] = None, limit: int = 10, cursor: Optional[str] = None):
+    """
+    Seek past the cursor in keyset order (reversed for a backward cursor) and
+    fetch `limit + 1` rows; the extra row tells whether another page follows.
+    Any ordering already on `query` is replaced by the keyset order.
+    """
+    keyset = keyset or id_keyset(query)
+    values, backward = decode_cursor(keyset, cursor) if cursor else (None, False)
+    descending = keyset.descending != backward
+
+    if values is not None:
+        key = tuple_(*keyset.columns) if len(keyset.columns) > 1 else keyset.columns[0]
+        bound = tuple_(*values) if len(values) > 1 else values[0]
+        query = query.where(key < bound if descending else key > bound)
+    order = [column.desc() if descending else column.asc() for column in keyset.columns]
+    return query.order_by(None).order_by(*order).limit(limit + 1)
+
+
+def _slice_page(keyset: Keyset, fetched: list, limit: int, cursor: Optional[str]) -> tuple[list, Optional[str], Optional[str]]:
+    """Trim the look-ahead row, restore display order and build both cursors."""
+    backward = decode_cursor(keyset, cursor)[1] if cursor else False
+    more = len(fetched) > limit
+    rows = fetched[:limit]
+    if backward:
+        rows.reverse()
+    if not rows:
+        return rows, None, None
+
+    # Going forward, a previous page exists iff we came from a cursor; going
+    # backward, a next page always exists and a previous one iff `more`.
+    has_next = True if backward else more
+    has_prev = more if backward else cursor is not None
+    next_cursor = encode_cursor(keyset, keyset.values_of(rows[-1])) if has_next else None
+    prev_cursor = encode_cursor(keyset, keyset.values_of(rows[0]), backward=True) if has_prev else None
+    return rows, next_cursor, prev_cursor
+
+
+def build_count_query(query):
+    """Count all rows matching the base query filters."""
+    return select(func.count()).select_from(query.order_by(None).subquery())
+
+
+def plan_rows(explain_json) -> int:
+    """Top-level row estimate from `EXPLAIN (FORMAT JSON)` output."""
+    if isinstance(explain_json, str):
+        explain_json = json.loads(explain_json)
+    return int(explain_json[0]["Plan"]["Plan Rows"])
+
+
+async def estimate_total(query, session: AsyncSession) -> int:
+    """Planner estimate of the rows matching `query`; never scans the table."""
+    result = await session.execute(Explain(query.order_by(None), format="JSON"))
+    return plan_rows(result.scalar())
+
+
+async def exact_total(query, session: AsyncSession, cache_key: Optional[str] = None) -> int:
+    """
+    count(*) over the base query. With a `cache_key` (a normalized filter set)
+    the count is cached in Redis under the current sync generation, so paging
+    through one search counts once and the next sync invalidates it.
+    """
+    redis_key = None
+    if cache_key:
+        try:
+            generation = await get_sync_generation(redis_async_client)
+            redis_key = f"total:{generation}:{cache_key}"
+            cached = await redis_async_client.get(redis_key)
+            if cached is not None:
+                return int(cached)
+        except RedisError:
+            logger.warning("Total cache unavailable; counting", exc_info=True)
+            redis_key = None
+
+    total_result = await session.execute(build_count_query(query))
+    total = total_result.scalar() or 0
+
+    if redis_key:
+        try:
+            await redis_async_client.set(redis_key, total, ex=config.REPORTS_CACHE_TTL)
+        except RedisError:
+            logger.warning("Could not cache total for %s", cache_key, exc_info=True)
+    return total
+
+
+async def page_total(
+    query,
+    session: AsyncSession,
+    page_rows: int,
+    limit: int,
+    cursor: Optional[str],
+    include_total: TotalMode,
+    cache_key: Optional[str] = None,
+) -> Optional[int]:
+    """Total for a page according to the `include_total` mode."""
+    if include_total not in TOTAL_MODES:
+        raise ValueError(f"Unknown include_total mode: {include_total}")
+    if include_total == "none":
+        return None
+    if include_total == "estimated":
+        return await estimate_total(query, session)
+    if cursor is None and page_rows < limit:
+        return page_rows  # the first page already holds every match
+    return await exact_total(query, session, cache_key)
 
 
 async def cursor_paginate(
     query,
     session: AsyncSession,
     schema: Type[T],
-    model_id_field: str = "id",
+    keyset: Optional[Keyset] = None,
     limit: int = 10,
-    cursor: Optional[int] = None,
+    cursor: Optional[str] = None,
     item_mapper: Optional[Callable] = None,
+    include_total: TotalMode = "exact",
+    total_cache_key: Optional[str] = None,
 ) -> CursorPage[T]:
     """
     Cursor-based pagination helper.
 
-    Applies optional cursor filter, returns a page of validated schema items,
-    and counts total rows matching the base query filters.
+    Seeks past an opaque cursor in `keyset` order (ascending id by default)
+    and returns a page of validated schema items with cursors to the next and
+    previous pages. `include_total` selects how the total matching the base
+    query filters is reported: an exact count, the planner's estimate, or not
+    at all.
     """
-    model = query.column_descriptions[0]["entity"]
-    id_column = getattr(model, model_id_field)
-
-    filtered_query = query
-    if cursor:
-        filtered_query = filtered_query.where(id_column > cursor)
-
+    keyset = keyset or id_keyset(query)
     result = await session.execute(
-        filtered_query.order_by(id_column).limit(limit)
+        build_page_query(query, keyset, limit, cursor)
     )
-    rows = result.scalars().all()
-
-    count_query = select(func.count()).select_from(query.subquery())
-    total_result = await session.execute(count_query)
-    total = total_result.scalar() or 0
-
-    next_cursor = getattr(rows[-1], model_id_field) if rows else None
+    rows, next_cursor, prev_cursor = _slice_page(keyset, list(result.scalars().all()), limit, cursor)
+    total = await page_total(query, session, len(rows), limit, cursor, include_total, total_cache_key)
 
     if item_mapper:
         items = [schema.model_validate(item_mapper(row)) for row in rows]
@@ -55,4 +262,37 @@ async def cursor_paginate(
         total=total,
         items=items,
         next_cursor=next_cursor,
+        prev_cursor=prev_cursor,
     )
+
+
+async def cursor_paginate_rows(
+    query,
+    session: AsyncSession,
+    keyset: Optional[Keyset] = None,
+    limit: int = 10,
+    cursor: Optional[str] = None,
+    include_total: TotalMode = "exact",
+    total_cache_key: Optional[str] = None,
+) -> dict:
+    """
+    Cursor pagination for column projections (`select(Model.a, Model.b, ...)`).
+
+    Rows come back as plain dicts: no ORM identity map, no schema instances.
+    The projection must include the keyset columns. The caller is responsible
+    for it matching the response schema, typically by serializing the page
+    straight to JSON.
+    """
+    keyset = keyset or id_keyset(query)
+    result = await session.execute(
+        build_page_query(query, keyset, limit, cursor)
+    )
+    rows, next_cursor, prev_cursor = _slice_page(keyset, list(result.all()), limit, cursor)
+    total = await page_total(query, session, len(rows), limit, cursor, include_total, total_cache_key)
+
+    return {
+        "total": total,
+        "items": [row._asdict() for row in rows],
+        "next_cursor": next_cursor,
+        "prev_cursor": prev_cursor,
+    }
@@ -1,4 +1,5 @@
-from typing import Any, Dict, List
+import time
+from typing import Any, Dict, List, Optional
 from neo4j import GraphDatabase, AsyncGraphDatabase, AsyncManagedTransaction
 from app.core.config import config
 
@@ -13,6 +14,38 @@ MERGE (m:Make {id: $make_id})
 MERGE (c)-[:BELONGS_TO]->(m)
 """
 
+# Batched variant of CAR_NODE_QUERY: one transaction for many cars.
+CAR_NODES_BATCH_QUERY = """
+UNWIND $rows AS row
+MERGE (u:User {id: row.user_id})
+MERGE (c:Car {id: row.car_id})
+SET c.name = row.name, c.year = row.year, c.category = row.category
+MERGE (u)-[:OWNS]->(c)
+WITH c, row
+MERGE (m:Make {id: row.make_id})
+MERGE (c)-[:BELONGS_TO]->(m)
+"""
+
+# Batched update: properties plus the BELONGS_TO make, replacing a stale one.
+UPDATE_CAR_NODES_BATCH_QUERY = """
+UNWIND $rows AS row
+MATCH (c:Car {id: row.car_id})
+SET c.name = row.name, c.year = row.year, c.category = row.category
+WITH c, row
+OPTIONAL MATCH (c)-[r:BELONGS_TO]->(old:Make)
+WHERE old.id <> row.make_id
+DELETE r
+WITH DISTINCT c, row
+MERGE (m:Make {id: row.make_id})
+MERGE (c)-[:BELONGS_TO]->(m)
+"""
+
+DELETE_CAR_NODES_BATCH_QUERY = """
+UNWIND $ids AS id
+MATCH (c:Car {id: id})
+DETACH DELETE c
+"""
+
 USER_NODE_QUERY = """
 MERGE (u:User {id: $id})
 SET u.username = $username,
@@ -75,7 +108,7 @@ async def update_car_node_async(
     if not updates:
         return
 
-    node_updates = {k: v for k in updates if k in {"name", "year", "category"}}
+    node_updates = {k: v for k, v in updates.items() if k in {"name", "year", "category"}}
     if node_updates:
         set_clauses = [f"c.{k} = ${k}" for k in node_updates.keys()]
         query = f"""
@@ -101,6 +134,18 @@ async def delete_car_node_async(tx: AsyncManagedTransaction, car_id: int) -> Non
     """Delete a Car node in Neo4j (async)."""
     await tx.run("MATCH (c:Car {id: $car_id}) DETACH DELETE c", car_id=car_id)
 
+async def write_car_nodes_async(tx: AsyncManagedTransaction, rows: List[Dict[str, Any]]) -> None:
+    """Create or update many Car nodes in one transaction (async); rows as for `write_car_nodes_sync`."""
+    await (await tx.run(CAR_NODES_BATCH_QUERY, rows=rows)).consume()
+
+async def update_car_nodes_async(tx: AsyncManagedTransaction, rows: List[Dict[str, Any]]) -> None:
+    """Update many Car nodes and their make in one transaction (async)."""
+    await (await tx.run(UPDATE_CAR_NODES_BATCH_QUERY, rows=rows)).consume()
+
+async def delete_car_nodes_async(tx: AsyncManagedTransaction, car_ids: List[int]) -> None:
+    """Delete many Car nodes in one transaction (async)."""
+    await (await tx.run(DELETE_CAR_NODES_BATCH_QUERY, ids=car_ids)).consume()
+
 async def get_user_cars_async(tx: AsyncManagedTransaction, user_id: int) -> List[Dict[str, Any]]:
     """Fetch all cars owned by a user (async)."""
     query = """
@@ -180,3 +225,39 @@ def update_car_node_sync(car_id: int, updates: Dict[str, Any]) -> None:
             """
             session.write_transaction(lambda tx: tx.run(query, car_id=car_id, make_id=updates["make_id"]))
 
+
+def write_car_nodes_sync(rows: List[Dict[str, Any]], batch_size: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Create or update many Car nodes (sync), `batch_size` rows per transaction.
+
+    Each row carries car_id, name, year, category, make_id and user_id.
+    Returns one {"rows", "seconds"} timing per batch for tuning.
+    """
+    batch_size = batch_size or config.NEO4J_BATCH_SIZE
+    timings: List[Dict[str, Any]] = []
+    if not rows:
+        return timings
+
+    with driver_sync.session() as session:
+        for start in range(0, len(rows), batch_size):
+            batch = rows[start:start + batch_size]
+            started = time.perf_counter()
+            session.execute_write(lambda tx: tx.run(CAR_NODES_BATCH_QUERY, rows=batch).consume())
+            timings.append({"rows": len(batch), "seconds": round(time.perf_counter() - started, 4)})
+    return timings
+
+
+def delete_car_nodes_sync(car_ids: List[int], batch_size: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Delete many Car nodes (sync), `batch_size` ids per transaction; returns per-batch timings."""
+    batch_size = batch_size or config.NEO4J_BATCH_SIZE
+    timings: List[Dict[str, Any]] = []
+    if not car_ids:
+        return timings
+
+    with driver_sync.session() as session:
+        for start in range(0, len(car_ids), batch_size):
+            batch = car_ids[start:start + batch_size]
+            started = time.perf_counter()
+            session.execute_write(lambda tx: tx.run(DELETE_CAR_NODES_BATCH_QUERY, ids=batch).consume())
+            timings.append({"rows": len(batch), "seconds": round(time.perf_counter() - started, 4)})
+    return timings
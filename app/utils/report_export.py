@@ -0,0 +1,70 @@
+import csv
+import io
+import zlib
+from typing import AsyncIterator, Iterable, Literal, Sequence
+
+from pydantic_core import to_json
+
+from app.core.async_db import AsyncSessionLocal
+from app.utils.services import REPORT_COLUMNS
+
+ExportFormat = Literal["csv", "ndjson"]
+
+EXPORT_MEDIA_TYPES = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+}
+
+EXPORT_FIELDS = [column.key for column in REPORT_COLUMNS]
+
+
+async def stream_report_rows(query, batch_size: int) -> AsyncIterator[Sequence[dict]]:
+    """
+    Yield the rows of a report query in batches through a server-side cursor,
+    so memory stays bounded by `batch_size` whatever the result size. Opens its
+    own session: a streaming response outlives the request's dependencies.
+    """
+    async with AsyncSessionLocal() as session:
+        result = await session.stream(query.execution_options(yield_per=batch_size))
+        async for batch in result.mappings().partitions():
+            yield batch
+
+
+def _encode_csv(rows: Iterable[dict], header: bool) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_FIELDS, lineterminator="\n")
+    if header:
+        writer.writeheader()
+    for row in rows:
+        writer.writerow({k: v.isoformat() if hasattr(v, "isoformat") else v for k, v in row.items()})
+    return buffer.getvalue().encode()
+
+
+def _encode_ndjson(rows: Iterable[dict]) -> bytes:
+    return b"".join(to_json(dict(row)) + b"\n" for row in rows)
+
+
+async def encode_export(
+    batches: AsyncIterator[Sequence[dict]],
+    fmt: ExportFormat,
+    compress: bool = False,
+) -> AsyncIterator[bytes]:
+    """
+    Encode row batches as CSV (with a header, also for an empty export) or
+    NDJSON, one chunk per batch, optionally as a single gzip stream.
+    """
+    gzipper = zlib.compressobj(6, zlib.DEFLATED, 31) if compress else None  # wbits 31: gzip container
+
+    def emit(data: bytes) -> bytes:
+        return gzipper.compress(data) if gzipper else data
+
+    if fmt == "csv":
+        chunk = emit(_encode_csv([], header=True))
+        if chunk:
+            yield chunk
+    async for batch in batches:
+        chunk = emit(_encode_csv(batch, header=False) if fmt == "csv" else _encode_ndjson(batch))
+        if chunk:
+            yield chunk
+    if gzipper:
+        yield gzipper.flush()
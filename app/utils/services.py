@@ -1,11 +1,18 @@
-from typing import Optional, Dict
+import io
+from typing import Any, Optional, Dict, Iterable, List, Tuple, Union, get_args
 from datetime import datetime
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, selectinload
-from sqlalchemy import select, and_, func
+from sqlalchemy import select, and_, delete, exists, func, insert, literal_column, text, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from app.models.car_model import Car, CarModel, Make
+from app.models.report_model import CarReport, CarReportRollup
+from app.models.sync_model import SyncState, SyncSeenId, SyncCarStaging, SyncRun
+from app.schemas.car_schema import ReportSort
+from app.utils.catalog import CATALOG_CHANGED, Catalog, MakeEntry, ModelEntry
+from app.utils.cursor_pagination import Keyset
 
 # -------------------- ASYNC FUNCTIONS (for FastAPI) -------------------- #
 
@@ -18,11 +25,22 @@ async def fetch_car_async(session: AsyncSession, car_id: int) -> Optional[Car]:
     return result.scalars().first()
 
 
-async def get_user_car_async(session: AsyncSession, car_id: int, user_id: int) -> Car:
-    car = await fetch_car_async(session, car_id)
-    if not car or car.user_id != user_id:
+# Columns a write RETURNs; with the catalog's model entry they make a `CarRead`.
+CAR_READ_COLUMNS = (Car.id, Car.name, Car.year, Car.category, Car.car_model_id, Car.created_at, Car.updated_at)
+
+
+async def _car_read_async(session: AsyncSession, catalog: Catalog, row) -> Dict:
+    if row is None:
         raise ValueError("Car not found or not owned by user")
-    return car
+    models = await _catalog_models_async(session, catalog, {row.car_model_id})
+    return _car_read(row, models[row.car_model_id])
+
+
+async def get_user_car_async(session: AsyncSession, car_id: int, user_id: int, catalog: Catalog) -> Dict:
+    row = (
+        await session.execute(select(*CAR_READ_COLUMNS).where(Car.id == car_id, Car.user_id == user_id))
+    ).first()
+    return await _car_read_async(session, catalog, row)
 
 
 async def get_or_create_make_async(session: AsyncSession, name: str) -> Make:
@@ -31,6 +49,7 @@ async def get_or_create_make_async(session: AsyncSession, name: str) -> Make:
         make = Make(name=name)
         session.add(make)
         await session.flush()
+        session.info[CATALOG_CHANGED] = True
     return make
 
 
@@ -44,66 +63,459 @@ async def get_or_create_model_async(session: AsyncSession, name: str, make_id: i
         car_model = CarModel(name=name, make_id=make_id)
         session.add(car_model)
         await session.flush()
+        session.info[CATALOG_CHANGED] = True
     return car_model
 
 
+async def resolve_car_model_async(
+    session: AsyncSession,
+    catalog: Catalog,
+    make_id: Optional[int],
+    car_model_id: Optional[int] = None,
+    car_model_name: Optional[str] = None,
+) -> ModelEntry:
+    """The catalog entry for a car's model; an unknown name within the make is created."""
+    await complete_catalog_async(session, catalog, [make_id], [car_model_id])
+    ref = _catalog_model_ref(catalog, make_id, car_model_id, car_model_name)
+    if ref is None:
+        raise ValueError("Either car_model_id or car_model_name must be provided")
+    if isinstance(ref, tuple):
+        ref = (await create_missing_models_async(session, [ref], catalog))[ref]
+    return ref
+
+
 async def create_car_with_model_async(
     session: AsyncSession,
     name: str,
     year: int,
     make_id: int,
+    catalog: Catalog,
     car_model_id: Optional[int] = None,
     car_model_name: Optional[str] = None,
     category: Optional[str] = None,
     user_id: Optional[int] = None,
-) -> Car:
-    if car_model_id:
-        car_model = await session.get(CarModel, car_model_id)
-        if not car_model:
-            raise ValueError("CarModel with given ID not found")
-    elif car_model_name:
-        car_model = await get_or_create_model_async(session, car_model_name, make_id)
+) -> Dict:
+    """Insert a car with INSERT ... RETURNING; returns it as a `CarRead`-shaped dict."""
+    model = await resolve_car_model_async(session, catalog, make_id, car_model_id, car_model_name)
+    row = (
+        await session.execute(
+            insert(Car)
+            .values(car_model_id=model.id, name=name, year=year, category=category, user_id=user_id)
+            .returning(*CAR_READ_COLUMNS)
+        )
+    ).one()
+    return _car_read(row, model)
+
+
+async def update_user_car_async(
+    session: AsyncSession,
+    car_id: int,
+    user_id: int,
+    data: Dict,
+    catalog: Catalog,
+) -> Dict:
+    """
+    Update the name, year, category and car_model_id present in `data` with a
+    single UPDATE ... RETURNING that only matches the user's own car.
+    """
+    values = {field: data[field] for field in ("name", "year", "category", "car_model_id") if field in data}
+    if values:
+        statement = (
+            update(Car)
+            .where(Car.id == car_id, Car.user_id == user_id)
+            .values(**values, updated_at=func.now())
+            .returning(*CAR_READ_COLUMNS)
+            .execution_options(synchronize_session=False)
+        )
     else:
-        raise ValueError("Either car_model_id or car_model_name must be provided")
+        statement = select(*CAR_READ_COLUMNS).where(Car.id == car_id, Car.user_id == user_id)
+    row = (await session.execute(statement)).first()
+    return await _car_read_async(session, catalog, row)
 
-    car = Car(
-        car_model_id=car_model.id,
-        name=name,
-        year=year,
-        category=category,
-        user_id=user_id,
+
+async def delete_user_car_async(session: AsyncSession, car_id: int, user_id: int) -> None:
+    deleted = (
+        await session.execute(
+            delete(Car).where(Car.id == car_id, Car.user_id == user_id).returning(Car.id)
+        )
+    ).scalar()
+    if deleted is None:
+        raise ValueError("Car not found or not owned by user")
+
+
+async def list_sync_runs_async(session: AsyncSession, limit: int = 20) -> List[SyncRun]:
+    """Most recent sync runs first."""
+    result = await session.execute(
+        select(SyncRun).order_by(SyncRun.started_at.desc(), SyncRun.id.desc()).limit(limit)
     )
-    session.add(car)
-    await session.flush()
-    return car
+    return list(result.scalars().all())
+
+
+# -------------------- BULK CAR WRITES (for FastAPI) -------------------- #
+
+BulkResult = Dict[str, Any]
+
+BULK_UPDATE_CARS_SQL = text("""
+UPDATE cars AS c SET
+    name = CASE WHEN u.set_name THEN u.name ELSE c.name END,
+    year = CASE WHEN u.set_year THEN u.year ELSE c.year END,
+    category = CASE WHEN u.set_category THEN u.category ELSE c.category END,
+    car_model_id = COALESCE(u.car_model_id, c.car_model_id),
+    updated_at = now()
+FROM unnest(
+    CAST(:ids AS integer[]),
+    CAST(:names AS text[]), CAST(:set_names AS boolean[]),
+    CAST(:years AS integer[]), CAST(:set_years AS boolean[]),
+    CAST(:categories AS text[]), CAST(:set_categories AS boolean[]),
+    CAST(:car_model_ids AS integer[])
+) AS u(id, name, set_name, year, set_year, category, set_category, car_model_id)
+WHERE c.id = u.id AND c.user_id = :user_id
+RETURNING c.id, c.name, c.year, c.category, c.car_model_id, c.created_at, c.updated_at
+""")
+
 
+def _error(index: int, message: str, car_id: Optional[int] = None) -> BulkResult:
+    return {"index": index, "status": "error", "id": car_id, "error": message}
 
-async def update_car_data_async(
+
+async def complete_catalog_async(
     session: AsyncSession,
-    car: Car,
-    data: Dict,
-    car_model_name: Optional[str] = None,
-    make_id: Optional[int] = None,
-) -> Car:
-    fields_to_update = ("name", "year", "category")
-    for field in fields_to_update:
-        if field in data:
-            setattr(car, field, data[field])
+    catalog: Catalog,
+    make_ids: Iterable[Optional[int]] = (),
+    model_ids: Iterable[Optional[int]] = (),
+) -> None:
+    """
+    Look up make and model ids this worker's catalog does not know: it can be
+    stale when another worker created them or a `catalog:version` bump was
+    lost. Rows found are added to the catalog, and the write that uses them
+    publishes a version bump so every worker reloads; ids still missing are
+    really invalid.
+    """
+    model_ids = {model_id for model_id in model_ids if model_id} - set(catalog.models_by_id)
+    make_ids = {make_id for make_id in make_ids if make_id is not None} - set(catalog.makes_by_id)
+    found = False
+    if model_ids:
+        rows = (
+            await session.execute(
+                select(CarModel.id, CarModel.name, CarModel.make_id, Make.name)
+                .join(CarModel.make)
+                .where(CarModel.id.in_(model_ids))
+            )
+        ).all()
+        for model_id, name, make_id, make_name in rows:
+            catalog.add_model(model_id, name, make_id, make_name)
+            found = True
+        make_ids -= set(catalog.makes_by_id)
+    if make_ids:
+        rows = (await session.execute(select(Make.id, Make.name).where(Make.id.in_(make_ids)))).all()
+        for make_id, name in rows:
+            catalog.add_make(make_id, name)
+            found = True
+    if found:
+        session.info[CATALOG_CHANGED] = True
 
+
+def _catalog_model_ref(
+    catalog: Catalog,
+    make_id: Optional[int],
+    car_model_id: Optional[int],
+    car_model_name: Optional[str],
+) -> Union[ModelEntry, Tuple[int, str], None]:
+    """
+    The model an item points at: a catalog entry, or a (make_id, name) pair
+    the catalog does not know yet. Raises ValueError for invalid references;
+    call `complete_catalog_async` first so a stale catalog is not one.
+    """
+    if car_model_id:
+        model = catalog.models_by_id.get(car_model_id)
+        if model is None:
+            raise ValueError("CarModel with given ID not found")
+        if make_id is not None and model.make_id != make_id:
+            raise ValueError("CarModel does not belong to the given make")
+        return model
     if car_model_name:
-        car_model = await get_or_create_model_async(session, car_model_name, make_id)
-        car.car_model_id = car_model.id
+        if make_id is None:
+            raise ValueError("make_id is required with car_model_name")
+        if make_id not in catalog.makes_by_id:
+            raise ValueError("Make not found")
+        model_id = catalog.model_id(make_id, car_model_name)
+        return catalog.models_by_id[model_id] if model_id is not None else (make_id, car_model_name)
+    return None
+
+
+async def create_missing_models_async(
+    session: AsyncSession,
+    pairs: Iterable[Tuple[int, str]],
+    catalog: Catalog,
+) -> Dict[Tuple[int, str], ModelEntry]:
+    """
+    Resolve (make_id, name) pairs missing from the catalog in one pass: pick
+    up rows created since it was loaded, insert the rest with one multi-row
+    INSERT ... RETURNING.
+    """
+    missing = set(pairs)
+    if not missing:
+        return {}
 
-    await session.flush()
-    return await fetch_car_async(session, car.id)
+    resolved: Dict[Tuple[int, str], int] = {}
+    rows = (
+        await session.execute(
+            select(CarModel.id, CarModel.make_id, CarModel.name).where(
+                tuple_(CarModel.make_id, CarModel.name).in_(list(missing))
+            )
+        )
+    ).all()
+    resolved.update({(make_id, name): model_id for model_id, make_id, name in rows})
+
+    to_create = sorted(missing - set(resolved))
+    if to_create:
+        created = (
+            await session.execute(
+                pg_insert(CarModel)
+                .values([{"make_id": make_id, "name": name} for make_id, name in to_create])
+                .on_conflict_do_nothing(index_elements=[CarModel.make_id, CarModel.name])
+                .returning(CarModel.id, CarModel.make_id, CarModel.name)
+            )
+        ).all()
+        resolved.update({(make_id, name): model_id for model_id, make_id, name in created})
+        session.info[CATALOG_CHANGED] = True
+
+        # Rows skipped by ON CONFLICT were created concurrently; pick them up.
+        raced = set(to_create) - set(resolved)
+        if raced:
+            rows = (
+                await session.execute(
+                    select(CarModel.id, CarModel.make_id, CarModel.name).where(
+                        tuple_(CarModel.make_id, CarModel.name).in_(list(raced))
+                    )
+                )
+            ).all()
+            resolved.update({(make_id, name): model_id for model_id, make_id, name in rows})
 
+    return {
+        (make_id, name): ModelEntry(model_id, name, make_id, catalog.makes_by_id[make_id])
+        for (make_id, name), model_id in resolved.items()
+    }
 
-async def delete_car_async(session: AsyncSession, car: Car) -> None:
-    await session.delete(car)
-    await session.flush()
 
+async def _catalog_models_async(session: AsyncSession, catalog: Catalog, model_ids: Iterable[int]) -> Dict[int, ModelEntry]:
+    """Catalog entries for model ids, reading the few it may not know yet in one query."""
+    models = {model_id: catalog.models_by_id[model_id] for model_id in model_ids if model_id in catalog.models_by_id}
+    unknown = set(model_ids) - set(models)
+    if unknown:
+        rows = (
+            await session.execute(
+                select(CarModel.id, CarModel.name, CarModel.make_id, Make.name)
+                .join(CarModel.make)
+                .where(CarModel.id.in_(unknown))
+            )
+        ).all()
+        for model_id, name, make_id, make_name in rows:
+            models[model_id] = ModelEntry(model_id, name, make_id, MakeEntry(make_id, make_name))
+    return models
 
-def build_car_reports_query(
+
+def _car_read(row, model: ModelEntry) -> Dict:
+    return {
+        "id": row.id,
+        "name": row.name,
+        "year": row.year,
+        "category": row.category,
+        "car_model": model,
+        "created_at": row.created_at,
+        "updated_at": row.updated_at,
+    }
+
+
+def _car_result(index: int, status: str, row, model: ModelEntry) -> BulkResult:
+    return {"index": index, "status": status, "id": row.id, "car": _car_read(row, model), "error": None}
+
+
+async def bulk_create_cars_async(
+    session: AsyncSession,
+    items: List[Dict],
+    user_id: int,
+    catalog: Catalog,
+) -> List[BulkResult]:
+    """
+    Create many cars: models are resolved in one pass (new ones inserted
+    together) and cars written with one multi-row INSERT ... RETURNING.
+    Invalid items get an error result and are skipped; the caller commits.
+    """
+    results: List[Optional[BulkResult]] = [None] * len(items)
+    refs: Dict[int, Union[ModelEntry, Tuple[int, str]]] = {}
+    await complete_catalog_async(
+        session, catalog, [item["make_id"] for item in items], [item.get("car_model_id") for item in items]
+    )
+    for index, item in enumerate(items):
+        try:
+            ref = _catalog_model_ref(catalog, item["make_id"], item.get("car_model_id"), item.get("car_model_name"))
+        except ValueError as exc:
+            results[index] = _error(index, str(exc))
+            continue
+        if ref is None:
+            results[index] = _error(index, "Either car_model_id or car_model_name must be provided")
+            continue
+        refs[index] = ref
+
+    created_models = await create_missing_models_async(
+        session, {ref for ref in refs.values() if isinstance(ref, tuple)}, catalog
+    )
+    models = {index: created_models[ref] if isinstance(ref, tuple) else ref for index, ref in refs.items()}
+
+    if models:
+        rows = (
+            await session.execute(
+                insert(Car).returning(
+                    Car.id, Car.name, Car.year, Car.category, Car.created_at, Car.updated_at,
+                    sort_by_parameter_order=True,
+                ),
+                [
+                    {
+                        "name": items[index]["name"],
+                        "year": items[index]["year"],
+                        "category": items[index].get("category"),
+                        "car_model_id": model.id,
+                        "user_id": user_id,
+                    }
+                    for index, model in models.items()
+                ],
+            )
+        ).all()
+        for (index, model), row in zip(models.items(), rows):
+            results[index] = _car_result(index, "created", row, model)
+    return results
+
+
+async def bulk_update_cars_async(
+    session: AsyncSession,
+    items: List[Dict],
+    user_id: int,
+    catalog: Catalog,
+) -> List[BulkResult]:
+    """
+    Partially update many of a user's cars with a single UPDATE ... FROM
+    unnest(...) RETURNING; ownership is part of its WHERE clause. Only keys
+    present in an item change; the caller commits.
+    """
+    results: List[Optional[BulkResult]] = [None] * len(items)
+    pending: Dict[int, Tuple[Dict, Optional[ModelEntry]]] = {}
+    seen = set()
+    refs: Dict[int, Union[ModelEntry, Tuple[int, str]]] = {}
+    await complete_catalog_async(
+        session, catalog, [item.get("make_id") for item in items], [item.get("car_model_id") for item in items]
+    )
+    for index, item in enumerate(items):
+        car_id = item["id"]
+        if car_id in seen:
+            results[index] = _error(index, "Duplicate id in request", car_id)
+            continue
+        seen.add(car_id)
+        if any(field in item and item[field] is None for field in ("name", "year")):
+            results[index] = _error(index, "name and year cannot be null", car_id)
+            continue
+        try:
+            ref = _catalog_model_ref(catalog, item.get("make_id"), item.get("car_model_id"), item.get("car_model_name"))
+        except ValueError as exc:
+            results[index] = _error(index, str(exc), car_id)
+            continue
+        if ref is not None:
+            refs[index] = ref
+        pending[index] = item
+
+    created_models = await create_missing_models_async(
+        session, {ref for ref in refs.values() if isinstance(ref, tuple)}, catalog
+    )
+    model_ids = {
+        index: (created_models[ref] if isinstance(ref, tuple) else ref).id for index, ref in refs.items()
+    }
+
+    if pending:
+        indexes = list(pending)
+        rows = (
+            await session.execute(
+                BULK_UPDATE_CARS_SQL,
+                {
+                    "user_id": user_id,
+                    "ids": [pending[i]["id"] for i in indexes],
+                    "names": [pending[i].get("name") for i in indexes],
+                    "set_names": ["name" in pending[i] for i in indexes],
+                    "years": [pending[i].get("year") for i in indexes],
+                    "set_years": ["year" in pending[i] for i in indexes],
+                    "categories": [pending[i].get("category") for i in indexes],
+                    "set_categories": ["category" in pending[i] for i in indexes],
+                    "car_model_ids": [model_ids.get(i) for i in indexes],
+                },
+            )
+        ).all()
+        updated = {row.id: row for row in rows}
+        models = await _catalog_models_async(session, catalog, {row.car_model_id for row in rows})
+        for index in indexes:
+            row = updated.get(pending[index]["id"])
+            if row is None:
+                results[index] = _error(index, "Car not found or not owned by user", pending[index]["id"])
+            else:
+                results[index] = _car_result(index, "updated", row, models[row.car_model_id])
+    return results
+
+
+async def bulk_delete_cars_async(session: AsyncSession, car_ids: List[int], user_id: int) -> List[BulkResult]:
+    """Delete many of a user's cars with one DELETE ... RETURNING; the caller commits."""
+    deleted = set()
+    if car_ids:
+        result = await session.execute(
+            delete(Car).where(Car.id.in_(set(car_ids)), Car.user_id == user_id).returning(Car.id)
+        )
+        deleted = set(result.scalars().all())
+
+    results: List[BulkResult] = []
+    seen = set()
+    for index, car_id in enumerate(car_ids):
+        if car_id in seen:
+            results.append(_error(index, "Duplicate id in request", car_id))
+        elif car_id in deleted:
+            results.append({"index": index, "status": "deleted", "id": car_id, "error": None})
+        else:
+            results.append(_error(index, "Car not found or not owned by user", car_id))
+        seen.add(car_id)
+    return results
+
+
+def contains_pattern(value: str) -> str:
+    """Lowercased LIKE pattern for a partial match, with wildcards in `value` escaped."""
+    escaped = value.strip().lower().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+# The CarReportRead fields, in order; reports are served as plain rows
+REPORT_COLUMNS = (
+    CarReport.id,
+    CarReport.name,
+    CarReport.year,
+    CarReport.make,
+    CarReport.model,
+    CarReport.category,
+    CarReport.created_at,
+    CarReport.updated_at,
+)
+
+
+# Report sort orders; each is backed by a (column, id) index on car_reports
+REPORT_SORTS = get_args(ReportSort)
+
+
+def report_keyset(sort: str = "id") -> Keyset:
+    """Keyset for a report sort: the sort column, then id as tie-breaker."""
+    if sort not in REPORT_SORTS:
+        raise ValueError(f"Unknown sort: {sort}")
+    name = sort.lstrip("-")
+    columns = (CarReport.id,) if name == "id" else (getattr(CarReport, name), CarReport.id)
+    return Keyset(columns, descending=sort.startswith("-"))
+
+
+def apply_report_filters(
+    query,
+    source,
     make: Optional[str] = None,
     model: Optional[str] = None,
     year: Optional[int] = None,
@@ -111,43 +523,82 @@ def build_car_reports_query(
     date_to: Optional[datetime] = None,
 ):
     """
-    Build a query for synced registration reports (Back4App data only).
-    Supports filtering by make, model, year, and registration date range.
+    Apply the report search filters to a query over `source`: `CarReport` or a
+    rollup with the same `make_lower` / `model_lower` / `year` columns
+    (date filters need `created_at`).
     """
-    query = (
-        select(Car)
-        .join(Car.car_model)
-        .join(CarModel.make)
-        .where(Car.external_id.isnot(None))
-        .options(selectinload(Car.car_model).selectinload(CarModel.make))
-    )
-
+    # make_lower / model_lower carry trigram GIN indexes
     if make:
-        query = query.where(func.lower(Make.name).like(f"%{make.strip().lower()}%"))
+        query = query.where(source.make_lower.like(contains_pattern(make), escape="\\"))
     if model:
-        query = query.where(func.lower(CarModel.name).like(f"%{model.strip().lower()}%"))
+        query = query.where(source.model_lower.like(contains_pattern(model), escape="\\"))
     if year is not None:
-        query = query.where(Car.year == year)
+        query = query.where(source.year == year)
     if date_from:
-        query = query.where(Car.created_at >= date_from)
+        query = query.where(source.created_at >= date_from)
     if date_to:
-        query = query.where(Car.created_at <= date_to)
-
+        query = query.where(source.created_at <= date_to)
     return query
 
 
-def car_to_report_dict(car: Car) -> dict:
-    """Map a Car ORM instance to a flat report response dict."""
-    return {
-        "id": car.id,
-        "name": car.name,
-        "year": car.year,
-        "make": car.car_model.make.name if car.car_model and car.car_model.make else "",
-        "model": car.car_model.name if car.car_model else "",
-        "category": car.category,
-        "created_at": car.created_at,
-        "updated_at": car.updated_at,
-    }
+def build_car_reports_query(
+    make: Optional[str] = None,
+    model: Optional[str] = None,
+    year: Optional[int] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+):
+    """
+    Build a query for synced registration reports (Back4App data only).
+    Supports filtering by make, model, year, and registration date range.
+    Reads the flattened `car_reports` view, so no joins run per request, and
+    selects only the report columns so rows skip ORM hydration.
+    """
+    return apply_report_filters(select(*REPORT_COLUMNS), CarReport, make, model, year, date_from, date_to)
+
+
+REPORT_FACETS = ("make", "year", "category")
+
+
+def build_report_facet_query(
+    facet: str,
+    make: Optional[str] = None,
+    model: Optional[str] = None,
+    year: Optional[int] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+):
+    """
+    Count reports per value of `facet` under the given filters, largest first.
+    Reads the `car_report_rollup` table the sync rebuilds unless a date filter
+    is set; the rollup has no dates, so those group `car_reports` live.
+    Returns `(query, source)` with source "rollup" or "live".
+    """
+    if facet not in REPORT_FACETS:
+        raise ValueError(f"Unknown facet: {facet}")
+
+    if date_from is None and date_to is None:
+        source, count, origin = CarReportRollup, func.sum(CarReportRollup.cars), "rollup"
+    else:
+        source, count, origin = CarReport, func.count(), "live"
+
+    column = getattr(source, facet)
+    query = (
+        select(column.label("value"), count.label("count"))
+        .group_by(column)
+        .order_by(count.desc(), column)
+    )
+    return apply_report_filters(query, source, make, model, year, date_from, date_to), origin
+
+
+async def get_report_facets_async(session: AsyncSession, **filters) -> dict:
+    """Counts per make, year and category under the report search filters."""
+    facets, origin = {}, "rollup"
+    for facet in REPORT_FACETS:
+        query, origin = build_report_facet_query(facet, **filters)
+        result = await session.execute(query)
+        facets[facet] = [{"value": row.value, "count": int(row.count)} for row in result]
+    return {**facets, "source": origin}
 
 
 # -------------------- SYNC FUNCTIONS (for Celery) -------------------- #
@@ -225,3 +676,357 @@ def delete_car_sync(session: Session, car: Car) -> None:
     session.delete(car)
     session.flush()
 
+
+# -------------------- BULK SYNC FUNCTIONS (for Celery) -------------------- #
+
+def resolve_make_ids_sync(
+    session: Session,
+    names: Iterable[str],
+    cache: Dict[str, int],
+) -> Dict[str, int]:
+    """
+    Resolve make names to ids for a whole batch, creating missing makes.
+    `cache` is updated in place so later batches skip known names.
+    """
+    missing = {name for name in names if name not in cache}
+    if not missing:
+        return cache
+
+    rows = session.execute(select(Make.id, Make.name).where(Make.name.in_(missing))).all()
+    cache.update({name: make_id for make_id, name in rows})
+
+    to_create = sorted(missing - set(cache))
+    if to_create:
+        created = session.execute(
+            pg_insert(Make)
+            .values([{"name": name} for name in to_create])
+            .on_conflict_do_nothing(index_elements=[Make.name])
+            .returning(Make.id, Make.name)
+        ).all()
+        cache.update({name: make_id for make_id, name in created})
+
+        # Rows skipped by ON CONFLICT were created concurrently; pick them up.
+        raced = set(to_create) - set(cache)
+        if raced:
+            rows = session.execute(select(Make.id, Make.name).where(Make.name.in_(raced))).all()
+            cache.update({name: make_id for make_id, name in rows})
+
+    return cache
+
+
+def resolve_model_ids_sync(
+    session: Session,
+    pairs: Iterable[Tuple[int, str]],
+    cache: Dict[Tuple[int, str], int],
+) -> Dict[Tuple[int, str], int]:
+    """
+    Resolve (make_id, model name) pairs to car model ids for a whole batch,
+    creating missing models. `cache` is updated in place.
+    """
+    missing = {pair for pair in pairs if pair not in cache}
+    if not missing:
+        return cache
+
+    rows = session.execute(
+        select(CarModel.id, CarModel.make_id, CarModel.name).where(
+            tuple_(CarModel.make_id, CarModel.name).in_(list(missing))
+        )
+    ).all()
+    cache.update({(make_id, name): model_id for model_id, make_id, name in rows})
+
+    to_create = sorted(missing - set(cache))
+    if to_create:
+        created = session.execute(
+            pg_insert(CarModel)
+            .values([{"make_id": make_id, "name": name} for make_id, name in to_create])
+            .on_conflict_do_nothing(index_elements=[CarModel.make_id, CarModel.name])
+            .returning(CarModel.id, CarModel.make_id, CarModel.name)
+        ).all()
+        cache.update({(make_id, name): model_id for model_id, make_id, name in created})
+
+        # Rows skipped by ON CONFLICT were created concurrently; pick them up.
+        raced = set(to_create) - set(cache)
+        if raced:
+            rows = session.execute(
+                select(CarModel.id, CarModel.make_id, CarModel.name).where(
+                    tuple_(CarModel.make_id, CarModel.name).in_(list(raced))
+                )
+            ).all()
+            cache.update({(make_id, name): model_id for model_id, make_id, name in rows})
+
+    return cache
+
+
+def bulk_upsert_cars_sync(session: Session, rows: List[Dict]) -> List:
+    """
+    Upsert synced cars with a single INSERT ... ON CONFLICT (external_id) DO UPDATE.
+
+    Each row needs external_id, name, year, category, car_model_id, created_at,
+    updated_at and source_hash; external_ids must be unique within `rows`.
+    Existing rows are only rewritten when their source fingerprint differs, so
+    the returned (id, external_id, inserted) rows cover inserted and updated
+    cars only.
+    """
+    if not rows:
+        return []
+
+    stmt = pg_insert(Car).values(rows)
+    excluded = stmt.excluded
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[Car.external_id],
+        set_={
+            "name": excluded.name,
+            "year": excluded.year,
+            "category": excluded.category,
+            "car_model_id": excluded.car_model_id,
+            "updated_at": excluded.updated_at,
+            "source_hash": excluded.source_hash,
+        },
+        where=Car.source_hash.is_distinct_from(excluded.source_hash),
+    ).returning(
+        Car.id,
+        Car.external_id,
+        literal_column("(xmax = 0)").label("inserted"),
+    )
+    return session.execute(stmt).all()
+
+
+def get_sync_state_sync(session: Session, name: str) -> Optional[SyncState]:
+    """Return the stored state (watermark and checkpoint) of a named sync."""
+    return session.get(SyncState, name)
+
+
+def save_sync_checkpoint_sync(
+    session: Session,
+    name: str,
+    object_id: str,
+    since: Optional[datetime],
+    watermark: Optional[datetime],
+    full: bool,
+    watermark_cap: Optional[datetime] = None,
+) -> None:
+    """Record the last objectId written by an unfinished run."""
+    checkpoint = {
+        "checkpoint_object_id": object_id,
+        "checkpoint_since": since,
+        "checkpoint_watermark": watermark,
+        "checkpoint_watermark_cap": watermark_cap,
+        "checkpoint_full": full,
+    }
+    stmt = pg_insert(SyncState).values(name=name, **checkpoint)
+    stmt = stmt.on_conflict_do_update(index_elements=[SyncState.name], set_=checkpoint)
+    session.execute(stmt)
+
+
+def finish_sync_sync(
+    session: Session,
+    name: str,
+    watermark: Optional[datetime],
+    watermark_cap: Optional[datetime] = None,
+) -> None:
+    """
+    Mark a named sync as complete: clear its checkpoint and advance the
+    watermark. It only moves forward, except that a run that synced records
+    never leaves it above `watermark_cap`, even if that moves it back.
+    """
+    capped = watermark is not None and watermark_cap is not None
+    if capped:
+        watermark = min(watermark, watermark_cap)
+    stmt = pg_insert(SyncState).values(name=name, watermark=watermark)
+    advanced = func.coalesce(
+        func.greatest(SyncState.watermark, stmt.excluded.watermark),
+        SyncState.watermark,
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[SyncState.name],
+        set_={
+            "watermark": func.least(advanced, watermark_cap) if capped else advanced,
+            "checkpoint_object_id": None,
+            "checkpoint_since": None,
+            "checkpoint_watermark": None,
+            "checkpoint_watermark_cap": None,
+            "checkpoint_full": False,
+        },
+    )
+    session.execute(stmt)
+
+
+def start_sync_run_sync(session: Session, name: str, mode: str, full: bool) -> int:
+    """Insert a `running` sync_runs row and return its id."""
+    run = SyncRun(name=name, mode=mode, full=full, status="running")
+    session.add(run)
+    session.flush()
+    return run.id
+
+
+def finish_sync_run_sync(
+    session: Session,
+    run_id: int,
+    status: str,
+    stats: Dict,
+    peak_memory_bytes: Optional[int] = None,
+    error_message: Optional[str] = None,
+) -> None:
+    """Store the outcome, phase timings and counters of a sync run."""
+    run = session.get(SyncRun, run_id)
+    if not run:
+        return
+    timings = stats.get("timings", {})
+    run.status = status
+    run.finished_at = func.now()
+    for phase in ("fetch", "normalize", "postgres", "neo4j", "total"):
+        setattr(run, f"{phase}_seconds", timings.get(phase))
+    for counter in ("fetched", "inserted", "updated", "skipped", "deleted", "errors"):
+        setattr(run, counter, stats.get(counter, 0))
+    run.peak_memory_bytes = peak_memory_bytes
+    run.error_message = error_message[:500] if error_message else None
+    run.error_samples = stats.get("error_samples") or None
+    run.graph_timings = stats.get("graph_timings")
+    session.flush()
+
+
+def reset_seen_external_ids_sync(session: Session) -> None:
+    """Empty the staging set before a fresh full sync."""
+    session.execute(text(f"TRUNCATE {SyncSeenId.__tablename__}"))
+
+
+def stage_seen_external_ids_sync(session: Session, external_ids: Iterable[str]) -> None:
+    """Add fetched objectIds to the staging set."""
+    values = [{"external_id": external_id} for external_id in set(external_ids)]
+    if values:
+        session.execute(pg_insert(SyncSeenId).values(values).on_conflict_do_nothing())
+
+
+def delete_unseen_synced_cars_sync(session: Session) -> List[int]:
+    """
+    Delete synced cars whose objectId is not in the staging set, using one
+    anti-join DELETE. Returns the ids of the deleted cars.
+    """
+    # Fresh statistics let the planner pick a hash anti-join over the staged set.
+    session.execute(text(f"ANALYZE {SyncSeenId.__tablename__}"))
+    stmt = (
+        delete(Car)
+        .where(Car.external_id.isnot(None))
+        .where(~exists().where(SyncSeenId.external_id == Car.external_id))
+        .returning(Car.id)
+    )
+    return list(session.execute(stmt).scalars())
+
+
+def refresh_car_reports_sync(session: Session) -> None:
+    """Rebuild the `car_reports` read model; readers keep the old rows until it commits."""
+    session.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY car_reports"))
+
+
+REBUILD_REPORT_ROLLUP_SQL = text(
+    """
+    INSERT INTO car_report_rollup (make, model, year, category, make_lower, model_lower, cars)
+    SELECT make, model, year, category, make_lower, model_lower, count(*)
+    FROM car_reports
+    GROUP BY make, model, year, category, make_lower, model_lower
+    """
+)
+
+
+def rebuild_report_rollup_sync(session: Session) -> None:
+    """
+    Recount `car_report_rollup` from the refreshed `car_reports`. Delete and
+    insert share the caller's transaction, so readers see the old counts until
+    commit. Run after `refresh_car_reports_sync`.
+    """
+    session.execute(delete(CarReportRollup))
+    session.execute(REBUILD_REPORT_ROLLUP_SQL)
+
+
+# -------------------- COPY SYNC FUNCTIONS (for Celery) -------------------- #
+
+STAGING_COLUMNS = ("external_id", "make", "model", "year", "category", "created_at", "updated_at", "source_hash")
+
+MERGE_STAGED_MAKES_SQL = text("""
+INSERT INTO makes (name)
+SELECT DISTINCT s.make FROM sync_car_staging s
+ON CONFLICT (name) DO NOTHING
+""")
+
+MERGE_STAGED_MODELS_SQL = text("""
+INSERT INTO car_models (name, make_id)
+SELECT DISTINCT s.model, m.id
+FROM sync_car_staging s
+JOIN makes m ON m.name = s.make
+ON CONFLICT (make_id, name) DO NOTHING
+""")
+
+MERGE_STAGED_CARS_SQL = text("""
+WITH resolved AS (
+    SELECT DISTINCT ON (s.external_id)
+        s.external_id, s.model AS name, s.year, s.category, cm.id AS car_model_id,
+        s.created_at, s.updated_at, s.source_hash
+    FROM sync_car_staging s
+    JOIN makes m ON m.name = s.make
+    JOIN car_models cm ON cm.make_id = m.id AND cm.name = s.model
+    ORDER BY s.external_id, cm.id
+), upserted AS (
+    INSERT INTO cars (external_id, name, year, category, car_model_id, created_at, updated_at, source_hash)
+    SELECT external_id, name, year, category, car_model_id, created_at, updated_at, source_hash
+    FROM resolved
+    ON CONFLICT (external_id) DO UPDATE SET
+        name = EXCLUDED.name,
+        year = EXCLUDED.year,
+        category = EXCLUDED.category,
+        car_model_id = EXCLUDED.car_model_id,
+        updated_at = EXCLUDED.updated_at,
+        source_hash = EXCLUDED.source_hash
+    WHERE cars.source_hash IS DISTINCT FROM EXCLUDED.source_hash
+    RETURNING id, external_id, name, year, category, car_model_id, (xmax = 0) AS inserted
+)
+SELECT u.id, u.external_id, u.name, u.year, u.category, cm.make_id, u.inserted
+FROM upserted u
+JOIN car_models cm ON cm.id = u.car_model_id
+""")
+
+
+def _copy_csv_field(value: Any) -> str:
+    """
+    One CSV field for COPY: NULL is an unquoted \\N and strings are always
+    quoted, so a value that happens to read "\\N" is never loaded as NULL.
+    """
+    if value is None:
+        return "\\N"
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, str):
+        return '"' + value.replace('"', '""') + '"'
+    return str(value)
+
+
+def copy_cars_to_staging_sync(session: Session, records: Iterable[Dict]) -> None:
+    """
+    Replace the staging table contents with `records` using COPY FROM STDIN
+    on the session's own connection (same transaction).
+    """
+    buffer = io.StringIO()
+    for record in records:
+        buffer.write(",".join(_copy_csv_field(record[column]) for column in STAGING_COLUMNS))
+        buffer.write("\n")
+    buffer.seek(0)
+
+    table = SyncCarStaging.__tablename__
+    session.execute(text(f"TRUNCATE {table}"))
+    dbapi_connection = session.connection().connection
+    with dbapi_connection.cursor() as cursor:
+        cursor.copy_expert(
+            f"COPY {table} ({', '.join(STAGING_COLUMNS)}) FROM STDIN WITH (FORMAT csv, NULL '\\N')",
+            buffer,
+        )
+
+
+def merge_staged_cars_sync(session: Session) -> List:
+    """
+    Merge the staging table into makes, car_models and cars with three
+    set-based statements. Cars are only rewritten when their source hash
+    changed; returns (id, external_id, name, year, category, make_id, inserted)
+    for inserted and updated cars.
+    """
+    session.execute(MERGE_STAGED_MAKES_SQL)
+    session.execute(MERGE_STAGED_MODELS_SQL)
+    return session.execute(MERGE_STAGED_CARS_SQL).all()
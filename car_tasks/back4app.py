@@ -0,0 +1,119 @@
+import json
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from app.core.config import config
+
+# Only the columns the sync stores; Parse omits everything else from the payload.
+RECORD_KEYS = ("objectId", "Make", "Model", "Year", "Category", "createdAt", "updatedAt")
+
+
+class Back4AppClient:
+    """
+    Pooled, concurrent pager for the Back4App (Parse) car models class.
+
+    All requests share one keep-alive `requests.Session`. `iter_pages` keeps up
+    to `concurrency` `skip`/`limit` requests in flight and yields pages in
+    order, stopping at the first short page.
+    """
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        concurrency: Optional[int] = None,
+        page_size: Optional[int] = None,
+        retries: Optional[int] = None,
+        backoff: Optional[float] = None,
+        timeout: float = 60,
+    ):
+        self.base_url = (base_url or config.PARSE_API_URL).split("?")[0]
+        self.concurrency = max(1, concurrency or config.SYNC_FETCH_CONCURRENCY)
+        self.page_size = page_size or config.SYNC_PAGE_SIZE
+        self.timeout = timeout
+
+        retry = Retry(
+            total=config.SYNC_FETCH_RETRIES if retries is None else retries,
+            backoff_factor=config.SYNC_FETCH_BACKOFF if backoff is None else backoff,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=("GET",),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=self.concurrency,
+            max_retries=retry,
+        )
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update(
+            {
+                "X-Parse-Application-Id": config.PARSE_APP_ID,
+                "X-Parse-REST-API-Key": config.PARSE_REST_API_KEY,
+                "Accept-Encoding": "gzip",
+            }
+        )
+
+        self._lock = threading.Lock()
+        self.stats = {"requests": 0, "records": 0, "seconds": 0.0}
+
+    def close(self) -> None:
+        self.session.close()
+
+    def __enter__(self) -> "Back4AppClient":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def fetch_page(self, where: dict, skip: int, limit: int) -> list[dict]:
+        """Fetch one page of records matching `where`."""
+        params = {
+            "where": json.dumps(where),
+            "keys": ",".join(RECORD_KEYS),
+            "order": "objectId",
+            "skip": skip,
+            "limit": limit,
+        }
+        started = time.perf_counter()
+        response = self.session.get(self.base_url, params=params, timeout=self.timeout)
+        response.raise_for_status()
+        results = response.json().get("results", [])
+
+        with self._lock:
+            self.stats["requests"] += 1
+            self.stats["records"] += len(results)
+            self.stats["seconds"] += time.perf_counter() - started
+        return results
+
+    def iter_pages(self, where: dict) -> Iterator[list[dict]]:
+        """Yield every page matching `where`, in `skip` order."""
+        limit = self.page_size
+        pool = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="back4app")
+        pending: deque = deque()
+        next_skip = 0
+
+        def submit() -> None:
+            nonlocal next_skip
+            pending.append(pool.submit(self.fetch_page, where, next_skip, limit))
+            next_skip += limit
+
+        try:
+            for _ in range(self.concurrency):
+                submit()
+            while pending:
+                page = pending.popleft().result()
+                if page:
+                    yield page
+                if len(page) < limit:
+                    break
+                submit()
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
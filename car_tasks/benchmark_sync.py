@@ -0,0 +1,126 @@
+"""
+Sync throughput benchmark against the local fake Back4App server.
+
+Starts `car_tasks.fake_back4app` in a subprocess (so its dataset does not
+count towards our memory), runs the full sync against it and reports
+records/sec, peak RSS and time per phase. Writes go to the configured
+PostgreSQL and Neo4j, so point them at scratch databases:
+
+    POSTGRES_DB=car_app_bench python -m car_tasks.benchmark_sync --records 50000 --runs 2
+
+The second run exercises the "nothing changed" path. Runs hold the sync lock
+like the Celery task, never delete cars missing from the fake dataset and do
+not refresh read models or bump API cache versions.
+"""
+import argparse
+import socket
+import subprocess
+import sys
+import time
+from typing import Optional
+
+from app.core.config import config
+from car_tasks.fake_back4app import CLASS_PATH
+from car_tasks.sync_cars import SYNC_LOCK_KEY, SYNC_MODES, SYNC_PHASES, _run_sync, sync_lock
+
+BENCHMARK_STATE_NAME = "benchmark"
+
+
+def _peak_rss_mb() -> Optional[float]:
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_fake_server(records: int, seed: int) -> tuple[subprocess.Popen, str]:
+    """Launch the fake server and wait until it accepts connections."""
+    port = _free_port()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "car_tasks.fake_back4app", "--records", str(records), "--port", str(port), "--seed", str(seed)],
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    # The server prints one line once the dataset is generated and the socket is bound.
+    line = process.stdout.readline()
+    if not line.startswith("Serving"):
+        process.kill()
+        raise RuntimeError("Fake Back4App server failed to start")
+    return process, f"http://127.0.0.1:{port}{CLASS_PATH}"
+
+
+def format_report(run: int, stats: dict, elapsed: float) -> str:
+    timings = stats["timings"]
+    rate = stats["fetched"] / elapsed if elapsed else 0.0
+    rss = _peak_rss_mb()
+    lines = [
+        f"Run {run}: {stats['fetched']} records in {elapsed:.2f}s ({rate:,.0f} records/s)",
+        f"  inserted={stats['inserted']} updated={stats['updated']} skipped={stats['skipped']} deleted={stats['deleted']} errors={stats['errors']}",
+        "  phases: " + ", ".join(f"{phase}={timings.get(phase, 0.0):.2f}s" for phase in SYNC_PHASES),
+        f"  peak RSS: {rss:.1f} MiB" if rss is not None else "  peak RSS: n/a",
+    ]
+    graph = stats.get("graph_timings")
+    if graph:
+        lines.append(
+            f"  neo4j batches: {graph['batches']} ({graph['rows']} rows), "
+            f"min={graph['min_seconds']:.3f}s p95={graph['p95_seconds']:.3f}s max={graph['max_seconds']:.3f}s"
+        )
+    if stats.get("peak_memory_bytes") is not None:
+        lines.append(f"  peak Python heap (tracemalloc): {stats['peak_memory_bytes'] / (1024 * 1024):.1f} MiB")
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark sync_car_data against a local fake Back4App.")
+    parser.add_argument("--records", type=int, default=20_000)
+    parser.add_argument("--runs", type=int, default=1)
+    parser.add_argument("--mode", choices=SYNC_MODES, default=config.SYNC_MODE)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--trace-memory",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Record the peak Python heap with tracemalloc (slows allocation)",
+    )
+    args = parser.parse_args()
+    config.SYNC_TRACE_MEMORY = args.trace_memory
+
+    with sync_lock() as lock:
+        if lock is None:
+            print(f"A sync is running ({SYNC_LOCK_KEY} is held); try again later.")
+            sys.exit(1)
+
+        process, url = start_fake_server(args.records, args.seed)
+        config.PARSE_API_URL = url
+        try:
+            for run in range(1, args.runs + 1):
+                started = time.perf_counter()
+                stats = _run_sync(
+                    args.mode,
+                    full=True,
+                    state_name=BENCHMARK_STATE_NAME,
+                    reconcile=False,
+                    publish=False,
+                    heartbeat=lock.reacquire,
+                )
+                elapsed = time.perf_counter() - started
+                if stats is None:
+                    print(f"Run {run} failed; see log output.")
+                    sys.exit(1)
+                print(format_report(run, stats, elapsed), flush=True)
+        finally:
+            process.terminate()
+            process.wait(timeout=10)
+
+
+if __name__ == "__main__":
+    main()
@@ -12,7 +12,8 @@ celery = Celery(
     include=["car_tasks.sync_cars"],
 )
 
-# --- Beat schedule: sync once per day (challenge requirement) ---
+# --- Beat schedule: incremental sync once per day (challenge requirement),
+# plus a weekly full resync that ignores the updatedAt watermark ---
 celery.conf.beat_schedule = {
     "sync_car_data_daily": {
         "task": "car_tasks.sync_cars.sync_car_data",
@@ -20,7 +21,15 @@ celery.conf.beat_schedule = {
             hour=config.CELERY_SYNC_HOUR,
             minute=config.CELERY_SYNC_MINUTE,
         ),
-    }
+    },
+    "sync_car_data_full_weekly": {
+        "task": "car_tasks.sync_cars.sync_car_data_full",
+        "schedule": crontab(
+            day_of_week=config.CELERY_FULL_SYNC_DAY_OF_WEEK,
+            hour=config.CELERY_SYNC_HOUR,
+            minute=config.CELERY_SYNC_MINUTE,
+        ),
+    },
 }
 celery.conf.timezone = "UTC"
 
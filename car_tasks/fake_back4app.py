@@ -0,0 +1,211 @@
+"""
+Local stand-in for the Back4App `classes/Carmodels_Car_Model_List` endpoint.
+
+Serves a configurable number of generated records and honours the parts of
+the Parse REST API the sync uses: `where` (comparison operators on Year,
+updatedAt, objectId, ...), `skip`, `limit`, `keys`, `order` and gzip.
+
+    python -m car_tasks.fake_back4app --records 100000 --port 8765
+"""
+import argparse
+import gzip
+import json
+import random
+import threading
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import parse_qs, urlparse
+
+CLASS_PATH = "/classes/Carmodels_Car_Model_List"
+
+MAKES = {
+    "Toyota": ["Corolla", "Camry", "RAV4", "Prius", "Tacoma", "Highlander"],
+    "Ford": ["Focus", "Fiesta", "F-150", "Mustang", "Escape", "Explorer"],
+    "Honda": ["Civic", "Accord", "CR-V", "Fit", "Pilot"],
+    "Chevrolet": ["Malibu", "Impala", "Silverado", "Equinox", "Camaro"],
+    "BMW": ["3 Series", "5 Series", "X3", "X5", "i3"],
+    "Audi": ["A3", "A4", "A6", "Q5", "Q7"],
+    "Nissan": ["Altima", "Sentra", "Rogue", "Leaf", "Frontier"],
+    "Hyundai": ["Elantra", "Sonata", "Tucson", "Santa Fe"],
+    "Kia": ["Rio", "Optima", "Sportage", "Sorento"],
+    "Volkswagen": ["Golf", "Jetta", "Passat", "Tiguan"],
+    "Subaru": ["Impreza", "Outback", "Forester", "Legacy"],
+    "Mazda": ["Mazda3", "Mazda6", "CX-5", "MX-5 Miata"],
+}
+CATEGORIES = ["Sedan", "SUV", "Pickup", "Coupe", "Hatchback", "Convertible", "Wagon", "Van/Minivan"]
+
+_BASE_TIME = datetime(2020, 1, 1, tzinfo=timezone.utc)
+
+
+def _iso(value: datetime) -> str:
+    return value.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+
+
+def generate_records(count: int, seed: int = 42, year_min: int = 2008, year_max: int = 2024) -> list[dict]:
+    """
+    Generate `count` deterministic Parse-style records, ordered by objectId.
+    Years deliberately extend beyond the default sync window.
+    """
+    rng = random.Random(seed)
+    makes = list(MAKES)
+    records = []
+    for index in range(count):
+        make = rng.choice(makes)
+        created = _BASE_TIME + timedelta(minutes=index)
+        updated = created + timedelta(days=rng.randint(0, 365))
+        records.append(
+            {
+                "objectId": f"{index:010d}",
+                "Make": make,
+                "Model": rng.choice(MAKES[make]),
+                "Year": rng.randint(year_min, year_max),
+                "Category": rng.choice(CATEGORIES),
+                "createdAt": _iso(created),
+                "updatedAt": _iso(updated),
+                # Columns the sync never reads; `keys` should strip them.
+                "ACL": {"*": {"read": True}},
+                "Description": "Generated record " * 4,
+            }
+        )
+    return records
+
+
+def _decode(value):
+    """Parse `Date` values compare as ISO strings, like the stored fields."""
+    if isinstance(value, dict) and value.get("__type") == "Date":
+        return value["iso"]
+    return value
+
+
+_OPERATORS = {
+    "$gt": lambda a, b: a > b,
+    "$gte": lambda a, b: a >= b,
+    "$lt": lambda a, b: a < b,
+    "$lte": lambda a, b: a <= b,
+    "$ne": lambda a, b: a != b,
+    "$in": lambda a, b: a in b,
+    "$nin": lambda a, b: a not in b,
+}
+
+
+def matches(record: dict, where: dict) -> bool:
+    """Evaluate a Parse `where` clause against one record."""
+    for field, condition in where.items():
+        value = record.get(field)
+        if isinstance(condition, dict) and "__type" not in condition:
+            for op, operand in condition.items():
+                compare = _OPERATORS.get(op)
+                if compare is None:
+                    raise ValueError(f"Unsupported operator {op}")
+                operand = [_decode(o) for o in operand] if op in ("$in", "$nin") else _decode(operand)
+                if value is None or not compare(value, operand):
+                    return False
+        elif value != _decode(condition):
+            return False
+    return True
+
+
+class FakeBack4App:
+    """Generated dataset plus a cache of filtered/sorted views per query."""
+
+    def __init__(self, records: list[dict]):
+        self.records = records
+        self._views: dict = {}
+        self._lock = threading.Lock()
+
+    def query(self, where: dict, order: Optional[str], skip: int, limit: int, keys: Optional[list[str]]) -> list[dict]:
+        cache_key = (json.dumps(where, sort_keys=True), order)
+        with self._lock:
+            view = self._views.get(cache_key)
+            if view is None:
+                view = [r for r in self.records if matches(r, where)]
+                if order:
+                    for field in reversed(order.split(",")):
+                        descending = field.startswith("-")
+                        view.sort(key=lambda r, f=field.lstrip("-"): r.get(f), reverse=descending)
+                self._views[cache_key] = view
+
+        page = view[skip:skip + limit]
+        if keys:
+            wanted = set(keys) | {"objectId", "createdAt", "updatedAt"}
+            page = [{k: v for k, v in r.items() if k in wanted} for r in page]
+        return page
+
+
+def make_handler(dataset: FakeBack4App):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            if url.path.rstrip("/") != CLASS_PATH:
+                self._send(404, {"error": "not found"})
+                return
+
+            params = {k: v[0] for k, v in parse_qs(url.query).items()}
+            try:
+                results = dataset.query(
+                    where=json.loads(params.get("where", "{}")),
+                    order=params.get("order"),
+                    skip=int(params.get("skip", 0)),
+                    limit=int(params.get("limit", 100)),
+                    keys=params["keys"].split(",") if params.get("keys") else None,
+                )
+            except ValueError as exc:
+                self._send(400, {"error": str(exc)})
+                return
+            self._send(200, {"results": results})
+
+        def _send(self, status: int, payload: dict) -> None:
+            body = json.dumps(payload).encode()
+            gzipped = "gzip" in self.headers.get("Accept-Encoding", "")
+            if gzipped:
+                body = gzip.compress(body, compresslevel=1)
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            if gzipped:
+                self.send_header("Content-Encoding", "gzip")
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+def make_server(records: int, host: str = "127.0.0.1", port: int = 0, seed: int = 42) -> ThreadingHTTPServer:
+    """Build (but do not start) a fake Back4App server; port 0 picks a free port."""
+    dataset = FakeBack4App(generate_records(records, seed=seed))
+    server = ThreadingHTTPServer((host, port), make_handler(dataset))
+    server.daemon_threads = True
+    return server
+
+
+def server_url(server: ThreadingHTTPServer) -> str:
+    host, port = server.server_address[:2]
+    return f"http://{host}:{port}{CLASS_PATH}"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve a local fake of the Back4App car models class.")
+    parser.add_argument("--records", type=int, default=50_000)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    server = make_server(args.records, args.host, args.port, args.seed)
+    print(f"Serving {args.records} records at {server_url(server)}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
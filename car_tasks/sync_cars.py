@@ -1,127 +1,327 @@
-import json
+import hashlib
 import logging
-import urllib.parse
+import math
+import queue
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
 
 import requests
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Iterable, Iterator, Optional
+from redis.exceptions import LockError, RedisError
+from redis.lock import Lock
 from sqlalchemy.orm import Session
 
 from app.core.config import config
-from app.core.sync_db import SessionLocal
-from app.models.car_model import Car
+from app.core.sync_db import SessionLocal, redis_client
+from app.models.car_model import Car, CarModel, Make
+from app.utils.cache import bump_sync_generation_sync
+from app.utils.catalog import bump_catalog_version_sync
+from car_tasks.back4app import Back4AppClient
 from car_tasks.celery_app import celery
 from app.utils.services import (
     get_or_create_make_sync,
     get_or_create_model_sync,
     create_car_with_model_sync,
     update_car_data_sync,
+    resolve_make_ids_sync,
+    resolve_model_ids_sync,
+    bulk_upsert_cars_sync,
+    get_sync_state_sync,
+    save_sync_checkpoint_sync,
+    finish_sync_sync,
+    reset_seen_external_ids_sync,
+    stage_seen_external_ids_sync,
+    delete_unseen_synced_cars_sync,
+    copy_cars_to_staging_sync,
+    merge_staged_cars_sync,
+    start_sync_run_sync,
+    finish_sync_run_sync,
+    refresh_car_reports_sync,
+    rebuild_report_rollup_sync,
 )
-from app.utils.neo4j_service import create_car_node_sync
+from app.utils.neo4j_service import create_car_node_sync, write_car_nodes_sync, delete_car_nodes_sync
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-HEADERS = {
-    "X-Parse-Application-Id": config.PARSE_APP_ID,
-    "X-Parse-REST-API-Key": config.PARSE_REST_API_KEY,
-    "Content-Type": "application/json",
-}
+SYNC_STATE_NAME = "back4app_cars"
+
+
+def _parse_date(value: datetime) -> dict:
+    """Encode a datetime as a Parse `Date` query value."""
+    iso = value.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+    return {"__type": "Date", "iso": iso}
 
 
-def _fetch_all_records() -> list[dict]:
-    """Fetch all Back4App records for years 2012-2022 with pagination."""
+def _record_filter(
+    updated_after: Optional[datetime] = None,
+    after_object_id: Optional[str] = None,
+) -> dict:
+    """
+    Parse `where` clause for the configured year window.
+    With `updated_after`, only records changed since that instant match;
+    with `after_object_id`, only records past that checkpoint (pages are
+    ordered by objectId).
+    """
     where = {
         "Year": {"$gte": config.SYNC_YEAR_MIN, "$lte": config.SYNC_YEAR_MAX},
     }
-    where_encoded = urllib.parse.quote_plus(json.dumps(where))
-    skip = 0
-    limit = 1000
-    all_results: list[dict] = []
+    if updated_after is not None:
+        where["updatedAt"] = {"$gt": _parse_date(updated_after)}
+    if after_object_id is not None:
+        where["objectId"] = {"$gt": after_object_id}
+    return where
+
 
-    while True:
-        base_url = config.PARSE_API_URL.split("?")[0]
-        url = f"{base_url}?limit={limit}&skip={skip}&where={where_encoded}"
-        response = requests.get(url, headers=HEADERS, timeout=60)
-        response.raise_for_status()
-        batch = response.json().get("results", [])
-        if not batch:
-            break
-        all_results.extend(batch)
-        if len(batch) < limit:
-            break
-        skip += limit
+def _iter_record_pages(
+    updated_after: Optional[datetime] = None,
+    after_object_id: Optional[str] = None,
+    client: Optional[Back4AppClient] = None,
+) -> Iterator[list[dict]]:
+    """Yield matching Back4App records one page at a time."""
+    where = _record_filter(updated_after, after_object_id)
+    if client is not None:
+        yield from client.iter_pages(where)
+        return
+    with Back4AppClient() as owned:
+        yield from owned.iter_pages(where)
 
-    return all_results
 
+_PAGES_DONE = object()
 
-@celery.task(name="car_tasks.sync_cars.sync_car_data")
-def sync_car_data() -> None:
+
+def _prefetch(pages: Iterator[list[dict]], max_inflight: int) -> Iterator[list[dict]]:
     """
-    Periodic background task: pull car registration data from Back4App
-    and upsert into PostgreSQL (+ Neo4j). Existing records are updated in place.
+    Drive `pages` from a background thread so the next page downloads while
+    the current one is written. At most `max_inflight` pages are buffered,
+    which keeps memory flat regardless of dataset size. Errors raised by the
+    producer are re-raised in the consumer. When the consumer stops early,
+    the producer gives up its pending put and closes `pages` (releasing the
+    Back4App session) from its own thread.
     """
-    session: Session = SessionLocal()
+    if max_inflight < 1:
+        yield from pages
+        return
 
-    try:
+    buffer: queue.Queue = queue.Queue(maxsize=max_inflight)
+    stop = threading.Event()
+
+    def put(item) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
         try:
-            results = _fetch_all_records()
-        except requests.RequestException as exc:
-            status = getattr(getattr(exc, "response", None), "status_code", "N/A")
-            logger.error("Back4App request failed (status=%s): %s", status, exc)
-            return
+            for page in pages:
+                if not put(page):
+                    return
+        except BaseException as exc:
+            put(exc)
+        else:
+            put(_PAGES_DONE)
+        finally:
+            # Generators can only be closed by the thread driving them.
+            close = getattr(pages, "close", None)
+            if close is not None:
+                close()
 
-        if not results:
-            logger.info("No records fetched from Back4App.")
-            return
+    producer = threading.Thread(target=produce, name="back4app-prefetch", daemon=True)
+    producer.start()
+    try:
+        while True:
+            item = buffer.get()
+            if item is _PAGES_DONE:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        stop.set()
+        producer.join(timeout=5)
+        if producer.is_alive():
+            logger.warning("Back4App prefetch thread still busy after the sync stopped reading.")
 
-        logger.info("Fetched %d records from Back4App.", len(results))
 
-        for item in results:
-            external_id = item.get("objectId")
-            try:
-                make_name = item["Make"]
-                model_name = item["Model"]
-                year = item["Year"]
-                category = item.get("Category")
-                source_created_at = datetime.fromisoformat(
-                    item["createdAt"].replace("Z", "+00:00")
-                )
-                source_updated_at = datetime.fromisoformat(
-                    item["updatedAt"].replace("Z", "+00:00")
-                )
+def _parse_timestamp(value: str) -> datetime:
+    """Parse a Parse API ISO-8601 timestamp (with trailing 'Z')."""
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def _fingerprint(make: str, model: str, year: int, category: Optional[str]) -> str:
+    """Compact hash of the source fields a synced car is built from."""
+    payload = "\x1f".join((make, model, str(year), category or ""))
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+# Column limits, checked per record: one bad value would otherwise abort the
+# multi-row INSERT or COPY of its whole batch.
+EXTERNAL_ID_MAX = Car.__table__.c.external_id.type.length
+MAKE_MAX = Make.__table__.c.name.type.length
+MODEL_MAX = CarModel.__table__.c.name.type.length
+CATEGORY_MAX = Car.__table__.c.category.type.length
+YEAR_RANGE = (1, 9999)
+
+
+def _text_field(item: dict, name: str, max_length: int, required: bool = True) -> Optional[str]:
+    value = item[name] if required else item.get(name)
+    if value is None and not required:
+        return None
+    if not isinstance(value, str) or (required and not value):
+        raise ValueError(f"{name} must be a non-empty string, got {value!r}")
+    if len(value) > max_length:
+        raise ValueError(f"{name} is longer than {max_length} characters")
+    return value
+
+
+def _year_field(item: dict) -> int:
+    value = item["Year"]
+    if isinstance(value, bool) or not isinstance(value, int) or not YEAR_RANGE[0] <= value <= YEAR_RANGE[1]:
+        raise ValueError(f"Year must be an integer in {YEAR_RANGE}, got {value!r}")
+    return value
+
+
+def _normalize_record(item: dict) -> dict:
+    """
+    Map a raw Back4App record to the fields stored for a synced car.
+    Raises KeyError/ValueError for records the cars table would reject.
+    """
+    record = {
+        "external_id": _text_field(item, "objectId", EXTERNAL_ID_MAX),
+        "make": _text_field(item, "Make", MAKE_MAX),
+        "model": _text_field(item, "Model", MODEL_MAX),
+        "year": _year_field(item),
+        "category": _text_field(item, "Category", CATEGORY_MAX, required=False),
+        "created_at": _parse_timestamp(item["createdAt"]),
+        "updated_at": _parse_timestamp(item["updatedAt"]),
+    }
+    record["source_hash"] = _fingerprint(
+        record["make"], record["model"], record["year"], record["category"]
+    )
+    return record
+
+
+def _records_watermark(records: Iterable[dict]) -> Optional[datetime]:
+    """
+    Return the highest `updated_at` of normalized records. Only records that
+    were written or skipped as unchanged count; `_watermark_cap` keeps the
+    saved watermark below the ones that failed.
+    """
+    return max((record["updated_at"] for record in records), default=None)
+
+
+def _item_updated_at(item: dict) -> Optional[datetime]:
+    """`updatedAt` of a raw record, or None if it is missing or malformed."""
+    try:
+        return _parse_timestamp(item["updatedAt"])
+    except (AttributeError, KeyError, TypeError, ValueError):
+        return None
+
+
+# Parse timestamps have millisecond precision.
+WATERMARK_STEP = timedelta(milliseconds=1)
+
+
+def _watermark_cap(run_cap: Optional[datetime], stats: dict) -> Optional[datetime]:
+    """
+    Highest watermark a run may save: `run_cap` (its start time, as records
+    updated while it ran may sit on pages it already read), lowered to just
+    below the earliest `updatedAt` of a record that failed, so the next
+    incremental run fetches that record again.
+    """
+    failed = stats.get("earliest_failure")
+    if failed is None:
+        return run_cap
+    below_failed = failed - WATERMARK_STEP
+    return below_failed if run_cap is None else min(run_cap, below_failed)
+
 
-                make = get_or_create_make_sync(session, make_name)
-                car_model = get_or_create_model_sync(session, model_name, make.id)
+def _chunks(items: list, size: int) -> Iterator[list]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
 
+
+SYNC_MODES = ("bulk", "copy", "orm")
+SYNC_PHASES = ("fetch", "normalize", "postgres", "neo4j")
+
+
+def _new_stats() -> dict:
+    return {
+        "pages": 0,
+        "fetched": 0,
+        "inserted": 0,
+        "updated": 0,
+        "skipped": 0,
+        "deleted": 0,
+        "errors": 0,
+        "commits": 0,
+        "graph_batches": [],
+        "error_samples": [],
+        "timings": {phase: 0.0 for phase in SYNC_PHASES},
+    }
+
+
+ERROR_SAMPLE_LIMIT = 10
+
+
+def _record_error(
+    stats: dict,
+    external_id: Optional[str],
+    exc: Exception,
+    updated_at: Optional[datetime] = None,
+) -> None:
+    """
+    Count a per-record failure and keep the first few for the run history.
+    `updated_at` of the record feeds `_watermark_cap`.
+    """
+    stats["errors"] += 1
+    if updated_at is not None:
+        earliest = stats.get("earliest_failure")
+        stats["earliest_failure"] = updated_at if earliest is None else min(earliest, updated_at)
+    if len(stats["error_samples"]) < ERROR_SAMPLE_LIMIT:
+        stats["error_samples"].append({"external_id": external_id, "error": f"{type(exc).__name__}: {exc}"[:200]})
+    logger.error("Failed to sync record %s: %s", external_id, exc)
+
+
+@contextmanager
+def _timed(stats: dict, phase: str) -> Iterator[None]:
+    """Add the wall time of the block to `stats["timings"][phase]`."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        stats["timings"][phase] += time.perf_counter() - started
+
+
+def _sync_batch_orm(session: Session, items: list[dict], stats: dict) -> Optional[datetime]:
+    """
+    Per-row ORM sync: one lookup and flush per record.
+    Slow, but every step is visible in the SQL log, which helps debugging.
+    Returns the watermark of the records that did not fail.
+    """
+    synced: list[dict] = []
+    for item in items:
+        external_id = item.get("objectId")
+        try:
+            with _timed(stats, "normalize"):
+                record = _normalize_record(item)
+            with _timed(stats, "postgres"):
                 car = session.query(Car).filter_by(external_id=external_id).first()
-                if car:
-                    car = update_car_data_sync(
-                        session,
-                        car,
-                        data={
-                            "name": model_name,
-                            "year": year,
-                            "category": category,
-                        },
-                        car_model_name=model_name,
-                        make_id=make.id,
-                    )
-                    car.updated_at = source_updated_at
-                else:
-                    car = create_car_with_model_sync(
-                        session,
-                        name=model_name,
-                        year=year,
-                        make_id=make.id,
-                        car_model_name=model_name,
-                        category=category,
-                        user_id=None,
-                    )
-                    car.external_id = external_id
-                    car.created_at = source_created_at
-                    car.updated_at = source_updated_at
-                    session.flush()
+            if car and car.source_hash == record["source_hash"]:
+                stats["skipped"] += 1
+                synced.append(record)
+                continue
 
+            with _timed(stats, "postgres"):
+                car, make = _write_car_orm(session, car, record, stats)
+            with _timed(stats, "neo4j"):
                 create_car_node_sync(
                     car_id=car.id,
                     name=car.name,
@@ -130,15 +330,568 @@ def sync_car_data() -> None:
                     make_id=make.id,
                     user_id=0,
                 )
+            synced.append(record)
 
-            except Exception as exc:
-                logger.error("Failed to sync record %s: %s", external_id, exc)
+        except Exception as exc:
+            _record_error(stats, external_id, exc, _item_updated_at(item))
+    return _records_watermark(synced)
 
-        session.commit()
-        logger.info("Sync completed successfully.")
 
+def _write_car_orm(session: Session, car: Optional[Car], record: dict, stats: dict) -> tuple:
+    """Insert or update one synced car through the ORM; returns (car, make)."""
+    make = get_or_create_make_sync(session, record["make"])
+    if car:
+        car = update_car_data_sync(
+            session,
+            car,
+            data={
+                "name": record["model"],
+                "year": record["year"],
+                "category": record["category"],
+            },
+            car_model_name=record["model"],
+            make_id=make.id,
+        )
+        car.updated_at = record["updated_at"]
+        car.source_hash = record["source_hash"]
+        stats["updated"] += 1
+    else:
+        car = create_car_with_model_sync(
+            session,
+            name=record["model"],
+            year=record["year"],
+            make_id=make.id,
+            car_model_name=record["model"],
+            category=record["category"],
+            user_id=None,
+        )
+        car.external_id = record["external_id"]
+        car.created_at = record["created_at"]
+        car.updated_at = record["updated_at"]
+        car.source_hash = record["source_hash"]
+        session.flush()
+        stats["inserted"] += 1
+    return car, make
+
+
+def _normalize_items(items: list[dict], stats: dict) -> dict[str, dict]:
+    """Normalize raw records keyed by objectId; invalid records count as errors."""
+    records: dict[str, dict] = {}
+    with _timed(stats, "normalize"):
+        for item in items:
+            try:
+                record = _normalize_record(item)
+            except (AttributeError, KeyError, TypeError, ValueError) as exc:
+                _record_error(stats, item.get("objectId"), exc, _item_updated_at(item))
+                continue
+            # ON CONFLICT cannot touch the same row twice in one statement.
+            records[record["external_id"]] = record
+    return records
+
+
+def _sync_batch_bulk(
+    session: Session,
+    items: list[dict],
+    stats: dict,
+    make_ids: dict,
+    model_ids: dict,
+    graph_rows: list[dict],
+) -> Optional[datetime]:
+    """
+    Set-based sync of one batch: resolve makes and models in memory,
+    then write all cars with a single INSERT ... ON CONFLICT DO UPDATE.
+    Graph rows for inserted/updated cars are queued on `graph_rows`.
+    Returns the watermark of the records that normalized.
+    """
+    records = _normalize_items(items, stats)
+    if not records:
+        return None
+
+    with _timed(stats, "postgres"):
+        resolve_make_ids_sync(session, {r["make"] for r in records.values()}, make_ids)
+        resolve_model_ids_sync(
+            session,
+            {(make_ids[r["make"]], r["model"]) for r in records.values()},
+            model_ids,
+        )
+
+    rows = [
+        {
+            "external_id": r["external_id"],
+            "name": r["model"],
+            "year": r["year"],
+            "category": r["category"],
+            "car_model_id": model_ids[(make_ids[r["make"]], r["model"])],
+            "user_id": None,
+            "created_at": r["created_at"],
+            "updated_at": r["updated_at"],
+            "source_hash": r["source_hash"],
+        }
+        for r in records.values()
+    ]
+    with _timed(stats, "postgres"):
+        written = bulk_upsert_cars_sync(session, rows)
+
+    inserted = sum(1 for row in written if row.inserted)
+    stats["inserted"] += inserted
+    stats["updated"] += len(written) - inserted
+    stats["skipped"] += len(records) - len(written)
+
+    for row in written:
+        record = records[row.external_id]
+        graph_rows.append(
+            {
+                "car_id": row.id,
+                "name": record["model"],
+                "year": record["year"],
+                "category": record["category"] or "",
+                "make_id": make_ids[record["make"]],
+                "user_id": 0,
+            }
+        )
+    return _records_watermark(records.values())
+
+
+def _sync_batch_copy(session: Session, records: dict[str, dict], stats: dict, graph_rows: list[dict]) -> None:
+    """
+    COPY one batch of normalized records into the unlogged staging table,
+    then merge it into makes / car_models / cars with set-based SQL.
+    """
+    if not records:
+        return
+
+    with _timed(stats, "postgres"):
+        copy_cars_to_staging_sync(session, records.values())
+        written = merge_staged_cars_sync(session)
+
+    inserted = sum(1 for row in written if row.inserted)
+    stats["inserted"] += inserted
+    stats["updated"] += len(written) - inserted
+    stats["skipped"] += len(records) - len(written)
+
+    graph_rows.extend(
+        {
+            "car_id": row.id,
+            "name": row.name,
+            "year": row.year,
+            "category": row.category or "",
+            "make_id": row.make_id,
+            "user_id": 0,
+        }
+        for row in written
+    )
+    records.clear()
+
+
+def _flush_graph_rows(graph_rows: list[dict], stats: dict, force: bool = False) -> None:
+    """Write queued Car nodes to Neo4j once a full batch is ready (or on `force`)."""
+    if not graph_rows or (not force and len(graph_rows) < config.NEO4J_BATCH_SIZE):
+        return
+    with _timed(stats, "neo4j"):
+        timings = write_car_nodes_sync(graph_rows, config.NEO4J_BATCH_SIZE)
+    stats["graph_batches"].extend(timings)
+    for timing in timings:
+        logger.debug("Neo4j batch: %d cars in %.3fs", timing["rows"], timing["seconds"])
+    graph_rows.clear()
+
+
+def _summarize_graph_batches(timings: list[dict]) -> Optional[dict]:
+    """Batch count, rows and min/max/p95/total seconds of a run's Neo4j batches (sync_runs)."""
+    if not timings:
+        return None
+    seconds = sorted(timing["seconds"] for timing in timings)
+    return {
+        "batches": len(seconds),
+        "rows": sum(timing["rows"] for timing in timings),
+        "seconds": round(sum(seconds), 3),
+        "min_seconds": seconds[0],
+        "max_seconds": seconds[-1],
+        "p95_seconds": seconds[math.ceil(0.95 * len(seconds)) - 1],
+    }
+
+
+def _reconcile_deletions(session: Session, stats: dict, heartbeat: Optional[Callable[[], None]] = None) -> None:
+    """
+    Remove synced cars that a full run did not see upstream: one anti-join
+    DELETE against the staged objectIds, then batched Neo4j node deletes.
+    """
+    with _timed(stats, "postgres"):
+        deleted_ids = delete_unseen_synced_cars_sync(session)
+    stats["deleted"] = len(deleted_ids)
+    if deleted_ids:
+        if heartbeat:
+            heartbeat()
+        with _timed(stats, "neo4j"):
+            stats["graph_batches"].extend(delete_car_nodes_sync(deleted_ids, config.NEO4J_BATCH_SIZE))
+        logger.info("Removed %d cars no longer present upstream.", len(deleted_ids))
+
+
+def _execute_sync(
+    mode: str,
+    full: bool,
+    state_name: str,
+    stats: dict,
+    on_progress: Optional[Callable[[dict], None]] = None,
+    reconcile: bool = True,
+    heartbeat: Optional[Callable[[], None]] = None,
+) -> Optional[dict]:
+    """
+    Pull car registration data from Back4App and upsert into PostgreSQL (+ Neo4j).
+
+    Runs incrementally: only records whose `updatedAt` is newer than the stored
+    watermark are fetched; `full=True` re-reads the whole year window. Work is
+    committed every `SYNC_COMMIT_SIZE` records together with a checkpoint (the
+    last objectId written), and a run that finds a checkpoint resumes after it.
+    The watermark only advances once a run completes, and never past the run's
+    start or a record that failed (see `_watermark_cap`). Full runs also stage every
+    fetched objectId and, on completion, delete synced cars missing upstream;
+    `reconcile=False` skips both, leaving the shared staging set alone.
+    `state_name` selects
+    the sync_state row, so benchmarks do not disturb the production watermark.
+    `heartbeat` is called after every page and between the finalization steps,
+    which can run long after the last page on large runs.
+    """
+    session: Session = SessionLocal()
+    make_ids: dict = {}
+    model_ids: dict = {}
+    graph_rows: list[dict] = []
+    copy_records: dict[str, dict] = {}
+    started = time.perf_counter()
+    run_cap = datetime.now(timezone.utc)
+
+    try:
+        state = get_sync_state_sync(session, state_name)
+        if state and state.checkpoint_object_id and (not full or state.checkpoint_full):
+            full = state.checkpoint_full
+            since = state.checkpoint_since
+            last_object_id = state.checkpoint_object_id
+            new_watermark = state.checkpoint_watermark
+            # Failures and the start time of the interrupted run still apply.
+            run_cap = state.checkpoint_watermark_cap or run_cap
+            stats["resumed_after"] = last_object_id
+            logger.info("Resuming %s sync after objectId %s.", "full" if full else "incremental", last_object_id)
+        else:
+            since = None if full else (state.watermark if state else None)
+            last_object_id = None
+            new_watermark = since
+            if since:
+                logger.info("Incremental sync: records updated after %s.", since.isoformat())
+            if full and reconcile:
+                reset_seen_external_ids_sync(session)
+
+        def commit_chunk() -> None:
+            _sync_batch_copy(session, copy_records, stats, graph_rows)
+            _flush_graph_rows(graph_rows, stats, force=True)
+            with _timed(stats, "postgres"):
+                save_sync_checkpoint_sync(
+                    session, state_name, last_object_id, since, new_watermark, full, _watermark_cap(run_cap, stats)
+                )
+                session.commit()
+            stats["commits"] += 1
+
+        uncommitted = 0
+        try:
+            pages = _prefetch(
+                _iter_record_pages(updated_after=since, after_object_id=last_object_id),
+                config.SYNC_MAX_INFLIGHT_PAGES,
+            )
+            try:
+                while True:
+                    # Only time spent waiting on the network counts as fetch time.
+                    with _timed(stats, "fetch"):
+                        page = next(pages, None)
+                    if page is None:
+                        break
+
+                    stats["fetched"] += len(page)
+                    if full and reconcile:
+                        with _timed(stats, "postgres"):
+                            stage_seen_external_ids_sync(
+                                session, [item["objectId"] for item in page if item.get("objectId")]
+                            )
+                    if mode == "orm":
+                        page_watermark = _sync_batch_orm(session, page, stats)
+                    elif mode == "copy":
+                        records = _normalize_items(page, stats)
+                        page_watermark = _records_watermark(records.values())
+                        copy_records.update(records)
+                        if len(copy_records) >= config.SYNC_BATCH_SIZE:
+                            _sync_batch_copy(session, copy_records, stats, graph_rows)
+                            _flush_graph_rows(graph_rows, stats)
+                    else:
+                        batch_watermarks = [
+                            _sync_batch_bulk(session, batch, stats, make_ids, model_ids, graph_rows)
+                            for batch in _chunks(page, config.SYNC_BATCH_SIZE)
+                        ]
+                        page_watermark = max(filter(None, batch_watermarks), default=None)
+                        _flush_graph_rows(graph_rows, stats)
+                    if page_watermark and (new_watermark is None or page_watermark > new_watermark):
+                        new_watermark = page_watermark
+
+                    last_object_id = page[-1].get("objectId") or last_object_id
+                    uncommitted += len(page)
+                    if uncommitted >= config.SYNC_COMMIT_SIZE:
+                        commit_chunk()
+                        uncommitted = 0
+
+                    stats["pages"] += 1
+                    if heartbeat:
+                        heartbeat()
+                    if on_progress:
+                        on_progress(stats)
+            finally:
+                pages.close()
+        except requests.RequestException as exc:
+            session.rollback()
+            status = getattr(getattr(exc, "response", None), "status_code", "N/A")
+            logger.error(
+                "Back4App request failed (status=%s): %s; checkpoint kept at objectId %s.",
+                status,
+                exc,
+                last_object_id,
+            )
+            raise
+
+        if stats["fetched"]:
+            logger.info("Fetched %d records from Back4App.", stats["fetched"])
+        else:
+            logger.info("No records fetched from Back4App.")
+
+        _sync_batch_copy(session, copy_records, stats, graph_rows)
+        if heartbeat:
+            heartbeat()
+        _flush_graph_rows(graph_rows, stats, force=True)
+        if full and reconcile and (stats["fetched"] or "resumed_after" in stats):
+            if heartbeat:
+                heartbeat()
+            _reconcile_deletions(session, stats, heartbeat)
+        with _timed(stats, "postgres"):
+            finish_sync_sync(session, state_name, new_watermark, _watermark_cap(run_cap, stats))
+            session.commit()
+        stats["commits"] += 1
+        stats.pop("earliest_failure", None)
+
+        stats["timings"]["total"] = time.perf_counter() - started
+        stats["timings"] = {phase: round(seconds, 3) for phase, seconds in stats["timings"].items()}
+        logger.info(
+            "Sync completed (%s): %d inserted, %d updated, %d skipped unchanged, %d deleted, "
+            "%d errors in %d commits.",
+            mode,
+            stats["inserted"],
+            stats["updated"],
+            stats["skipped"],
+            stats["deleted"],
+            stats["errors"],
+            stats["commits"],
+        )
+        logger.info("Sync timings (s): %s", stats["timings"])
+        return stats
+
+    except requests.RequestException:
+        raise
     except Exception as exc:
         session.rollback()
+        stats["failure"] = str(exc)
         logger.error("Failed to commit sync changes: %s", exc)
+        return None
     finally:
         session.close()
+
+
+def _start_run(state_name: str, mode: str, full: bool) -> Optional[int]:
+    session: Session = SessionLocal()
+    try:
+        run_id = start_sync_run_sync(session, state_name, mode, full)
+        session.commit()
+        return run_id
+    except Exception as exc:
+        session.rollback()
+        logger.warning("Could not record sync run start: %s", exc)
+        return None
+    finally:
+        session.close()
+
+
+def _finish_run(run_id: Optional[int], status: str, stats: dict, peak_memory: Optional[int], error: Optional[str]) -> None:
+    if run_id is None:
+        return
+    session: Session = SessionLocal()
+    try:
+        finish_sync_run_sync(session, run_id, status, stats, peak_memory, error)
+        session.commit()
+    except Exception as exc:
+        session.rollback()
+        logger.warning("Could not record sync run %s: %s", run_id, exc)
+    finally:
+        session.close()
+
+
+def _publish_changes(stats: dict, heartbeat: Optional[Callable[[], None]] = None) -> None:
+    """
+    Make a run's writes visible to the API: refresh the `car_reports` read
+    model and the facet rollup, then bump the sync generation so caches
+    keyed on it are dropped, and the catalog version so API workers reload
+    makes and models.
+    Runs for failed runs too, since committed chunks are already in `cars`.
+    """
+    session: Session = SessionLocal()
+    try:
+        with _timed(stats, "postgres"):
+            if heartbeat:
+                heartbeat()
+            refresh_car_reports_sync(session)
+            if heartbeat:
+                heartbeat()
+            rebuild_report_rollup_sync(session)
+            session.commit()
+    except Exception as exc:
+        session.rollback()
+        logger.warning("Could not refresh report read models: %s", exc)
+    finally:
+        session.close()
+
+    try:
+        bump_sync_generation_sync(redis_client)
+    except RedisError:
+        logger.warning("Could not bump the sync generation; cached totals stay until their TTL", exc_info=True)
+    try:
+        bump_catalog_version_sync(redis_client)
+    except RedisError:
+        logger.warning("Could not bump the catalog version; API workers keep their makes and models", exc_info=True)
+
+
+def _run_sync(
+    mode: Optional[str],
+    full: bool,
+    state_name: str = SYNC_STATE_NAME,
+    on_progress: Optional[Callable[[dict], None]] = None,
+    reconcile: bool = True,
+    publish: bool = True,
+    heartbeat: Optional[Callable[[], None]] = None,
+) -> Optional[dict]:
+    """
+    Run one sync and record it in `sync_runs`: phase timings, counts by outcome,
+    errors and, with `SYNC_TRACE_MEMORY`, the peak Python heap from tracemalloc.
+    The history is written through its own sessions so failed runs are kept too.
+    `reconcile=False` never deletes cars missing upstream and `publish=False`
+    leaves the read models and API caches untouched (benchmarks). `heartbeat`
+    is called between long steps so the caller can renew its lock.
+    """
+    mode = mode or config.SYNC_MODE
+    if mode not in SYNC_MODES:
+        raise ValueError(f"Unknown sync mode: {mode}")
+
+    stats = _new_stats()
+    run_id = _start_run(state_name, mode, full)
+    owns_tracing = config.SYNC_TRACE_MEMORY and not tracemalloc.is_tracing()
+    if owns_tracing:
+        tracemalloc.start()
+
+    status, error = "failed", None
+    try:
+        result = _execute_sync(mode, full, state_name, stats, on_progress, reconcile, heartbeat)
+        if result is not None:
+            status = "success"
+        else:
+            error = stats.get("failure")
+        return result
+    except Exception as exc:
+        error = str(exc)
+        raise
+    finally:
+        peak_memory = tracemalloc.get_traced_memory()[1] if tracemalloc.is_tracing() else None
+        if owns_tracing:
+            tracemalloc.stop()
+        if publish and (stats["inserted"] or stats["updated"] or stats["deleted"]):
+            _publish_changes(stats, heartbeat)
+        stats["peak_memory_bytes"] = peak_memory
+        stats["graph_timings"] = _summarize_graph_batches(stats["graph_batches"])
+        _finish_run(run_id, status, stats, peak_memory, error)
+
+
+SYNC_LOCK_KEY = "lock:sync_car_data"
+
+
+def progress_meta(stats: dict) -> dict:
+    """Live progress published to the Celery task state."""
+    return {
+        "pages": stats["pages"],
+        "fetched": stats["fetched"],
+        "written": stats["inserted"] + stats["updated"],
+        "inserted": stats["inserted"],
+        "updated": stats["updated"],
+        "skipped": stats["skipped"],
+        "errors": stats["errors"],
+    }
+
+
+@contextmanager
+def sync_lock() -> Iterator[Optional[Lock]]:
+    """
+    Hold `SYNC_LOCK_KEY` for the block, or yield None if another sync has it.
+    Holders renew it with `lock.reacquire()`, so a crashed worker frees it
+    within `SYNC_LOCK_TIMEOUT` seconds.
+    """
+    lock = redis_client.lock(SYNC_LOCK_KEY, timeout=config.SYNC_LOCK_TIMEOUT, blocking=False)
+    if not lock.acquire():
+        yield None
+        return
+    try:
+        yield lock
+    finally:
+        try:
+            lock.release()
+        except LockError:
+            logger.warning("Sync lock %s expired before release.", SYNC_LOCK_KEY)
+
+
+def _run_exclusive(task, mode: Optional[str], full: bool) -> Optional[dict]:
+    """
+    Run the sync under a Redis lock so only one sync touches the databases at
+    a time. A run that finds the lock held exits immediately. The lock TTL is
+    renewed after every page and between the finalization steps.
+    """
+    with sync_lock() as lock:
+        if lock is None:
+            logger.info("Another sync holds %s; skipping this run.", SYNC_LOCK_KEY)
+            return {"status": "locked"}
+
+        def on_progress(stats: dict) -> None:
+            if task.request.id:
+                task.update_state(state="PROGRESS", meta=progress_meta(stats))
+
+        return _run_sync(mode, full, on_progress=on_progress, heartbeat=lock.reacquire)
+
+
+# Failed fetches are retried by Celery; each retry resumes from the last checkpoint.
+SYNC_RETRY_OPTIONS = {
+    "bind": True,
+    "autoretry_for": (requests.RequestException,),
+    "retry_backoff": True,
+    "max_retries": 3,
+}
+
+
+@celery.task(name="car_tasks.sync_cars.sync_car_data", **SYNC_RETRY_OPTIONS)
+def sync_car_data(self, mode: Optional[str] = None, full: bool = False) -> Optional[dict]:
+    """
+    Periodic background task: incremental Back4App sync into PostgreSQL (+ Neo4j).
+    Existing records are updated in place.
+
+    `mode` is "bulk" (set-based upserts, default), "copy" (COPY into a staging
+    table, then merge) or "orm" (per-row, for debugging); it falls back to
+    `config.SYNC_MODE`. Returns a summary of row outcomes.
+    """
+    return _run_exclusive(self, mode, full)
+
+
+@celery.task(name="car_tasks.sync_cars.sync_car_data_full", **SYNC_RETRY_OPTIONS)
+def sync_car_data_full(self, mode: Optional[str] = None) -> Optional[dict]:
+    """Periodic full resync of the whole year window, ignoring the watermark."""
+    return _run_exclusive(self, mode, full=True)
+
+
+@celery.task(name="car_tasks.sync_cars.seed_car_data", **SYNC_RETRY_OPTIONS)
+def seed_car_data(self) -> Optional[dict]:
+    """Initial load of a fresh database: full sync through the COPY staging path."""
+    return _run_exclusive(self, "copy", full=True)
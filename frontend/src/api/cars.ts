@@ -1,7 +1,7 @@
 import { apiRequest, buildQuery } from "./client";
 import type { Car, CursorPage } from "../types";
 
-export async function listCars(limit = 10, cursor?: number): Promise<CursorPage<Car>> {
+export async function listCars(limit = 10, cursor?: string): Promise<CursorPage<Car>> {
   return apiRequest<CursorPage<Car>>(
     `/cars/${buildQuery({ limit, cursor })}`
   );
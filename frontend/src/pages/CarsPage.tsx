@@ -15,7 +15,7 @@ export function CarsPage() {
   const { toast } = useToast();
   const [cars, setCars] = useState<CarType[]>([]);
   const [total, setTotal] = useState(0);
-  const [nextCursor, setNextCursor] = useState<number | null>(null);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
   const [loading, setLoading] = useState(true);
   const [loadingMore, setLoadingMore] = useState(false);
   const [showModal, setShowModal] = useState(false);
@@ -34,7 +34,7 @@ export function CarsPage() {
   const [modelName, setModelName] = useState("");
   const [category, setCategory] = useState("Sedan");
 
-  const loadCars = async (cursor?: number, append = false) => {
+  const loadCars = async (cursor?: string, append = false) => {
     if (append) setLoadingMore(true);
     else setLoading(true);
 
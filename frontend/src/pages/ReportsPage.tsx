@@ -42,7 +42,7 @@ export function ReportsPage() {
   const [filters, setFilters] = useState<ReportFilters>(applied);
   const [items, setItems] = useState<CarReport[]>([]);
   const [total, setTotal] = useState(0);
-  const [nextCursor, setNextCursor] = useState<number | null>(null);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
   const [loading, setLoading] = useState(false);
   const [loadingMore, setLoadingMore] = useState(false);
   const [fetchError, setFetchError] = useState<string | null>(null);
@@ -40,7 +40,8 @@ export interface CarReport {
 export interface CursorPage<T> {
   total: number;
   items: T[];
-  next_cursor: number | null;
+  next_cursor: string | null;
+  prev_cursor: string | null;
 }
 
 export interface ReportFilters {
@@ -50,7 +51,7 @@ export interface ReportFilters {
   date_from?: string;
   date_to?: string;
   limit?: number;
-  cursor?: number;
+  cursor?: string;
 }
 
 export interface Car {
@@ -0,0 +1,98 @@
+from collections.abc import Generator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+import pytest
+from sqlalchemy import delete, event
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import OperationalError
+
+from app.core.base import Base
+from app.core.sync_db import engine
+from app.models.report_model import CarReportRollup
+from app.utils.cursor_pagination import Explain
+from app.utils.services import REBUILD_REPORT_ROLLUP_SQL
+
+
+@pytest.fixture
+def pg_connection() -> Generator[Connection, None, None]:
+    """
+    Connection to the configured PostgreSQL (migrated to head) inside a
+    transaction that is rolled back afterwards. Skips when the database
+    is not reachable.
+    """
+    try:
+        connection = engine.connect()
+    except OperationalError:
+        pytest.skip("PostgreSQL is not reachable")
+    transaction = connection.begin()
+    try:
+        yield connection
+    finally:
+        transaction.rollback()
+        connection.close()
+
+
+SEED_SQL = """
+INSERT INTO makes (name) SELECT 'Plan Make ' || m FROM generate_series(1, 20) AS m;
+INSERT INTO car_models (name, make_id)
+SELECT 'Plan Model ' || mk.id || '-' || n, mk.id
+FROM makes mk, generate_series(1, 10) AS n
+WHERE mk.name LIKE 'Plan Make %';
+INSERT INTO cars (name, year, category, car_model_id, external_id, created_at)
+SELECT 'Plan Car', 2012 + i % 11, 'Sedan', cm.id, 'plan-' || i,
+       timestamptz '2015-01-01' + i * interval '1 hour'
+FROM generate_series(1, 50000) AS i
+JOIN (SELECT id, row_number() OVER (ORDER BY id) - 1 AS rn FROM car_models
+      WHERE name LIKE 'Plan Model %') cm ON cm.rn = i % 200;
+INSERT INTO cars (name, year, category, car_model_id, user_id, created_at)
+SELECT 'User Car', 2012 + i % 11, 'SUV',
+       (SELECT min(id) FROM car_models WHERE name LIKE 'Plan Model %'), 1, now()
+FROM generate_series(1, 20000) AS i;
+REFRESH MATERIALIZED VIEW car_reports;
+ANALYZE car_reports;
+"""
+
+
+@pytest.fixture
+def seeded_connection(pg_connection):
+    """`pg_connection` with 50k synced and 20k user cars, `car_reports` and the rollup rebuilt."""
+    pg_connection.connection.driver_connection.cursor().execute(SEED_SQL)
+    pg_connection.execute(delete(CarReportRollup))
+    pg_connection.execute(REBUILD_REPORT_ROLLUP_SQL)
+    return pg_connection
+
+
+def explain(connection: Connection, statement) -> str:
+    """Return the text plan of a SQLAlchemy statement."""
+    rows = connection.execute(Explain(statement)).scalars().all()
+    return "\n".join(rows)
+
+
+@dataclass
+class QueryCount:
+    statements: list[str] = field(default_factory=list)
+    loaded: int = 0  # ORM instances hydrated
+
+    def __str__(self) -> str:
+        return f"{len(self.statements)} statements, {self.loaded} rows loaded:\n" + "\n".join(self.statements)
+
+
+@contextmanager
+def count_queries(sync_engine) -> Generator[QueryCount, None, None]:
+    """Record SQL statements sent through `sync_engine` (`async_engine.sync_engine` for the API) and ORM loads."""
+    count = QueryCount()
+
+    def on_execute(conn, cursor, statement, parameters, context, executemany):
+        count.statements.append(" ".join(statement.split())[:200])
+
+    def on_load(target, context):
+        count.loaded += 1
+
+    event.listen(sync_engine, "before_cursor_execute", on_execute)
+    event.listen(Base, "load", on_load, propagate=True)
+    try:
+        yield count
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", on_execute)
+        event.remove(Base, "load", on_load)
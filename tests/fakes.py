@@ -0,0 +1,55 @@
+"""Fake async session and catalog shared by the service-level car tests."""
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from sqlalchemy.dialects import postgresql
+
+from app.utils.catalog import Catalog
+
+STAMP = datetime(2020, 1, 1, tzinfo=timezone.utc)
+CATALOG = Catalog.from_rows([(1, "Toyota"), (2, "Audi")], [(10, "Corolla", 1), (20, "A4", 2)])
+
+
+def car_row(car_id, name="Car", year=2020, category=None, car_model_id=10):
+    return SimpleNamespace(
+        id=car_id, name=name, year=year, category=category, car_model_id=car_model_id,
+        created_at=STAMP, updated_at=None,
+    )
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def all(self):
+        return self.rows
+
+    def scalars(self):
+        return SimpleNamespace(all=lambda: self.rows)
+
+    def one(self):
+        (row,) = self.rows
+        return row
+
+    def first(self):
+        return self.rows[0] if self.rows else None
+
+    def scalar(self):
+        return self.rows[0] if self.rows else None
+
+
+class FakeSession:
+    """Answers each statement with the next canned result and records what ran."""
+
+    def __init__(self, *results):
+        self.results = list(results)
+        self.statements = []
+        self.info = {}
+
+    async def execute(self, statement, params=None):
+        self.statements.append((statement, params))
+        return FakeResult(self.results.pop(0))
+
+
+def sql(statement) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
@@ -35,6 +35,21 @@ def test_reports_requires_auth(client: TestClient):
     assert response.status_code == 401
 
 
+def test_reports_cache_stats_requires_auth(client: TestClient):
+    response = client.get("/reports/cache")
+    assert response.status_code == 401
+
+
+def test_reports_export_requires_auth(client: TestClient):
+    response = client.get("/reports/export")
+    assert response.status_code == 401
+
+
+def test_cars_bulk_requires_auth(client: TestClient):
+    response = client.post("/cars/bulk", json={"cars": []})
+    assert response.status_code == 401
+
+
 def test_authenticated_api_flow(client: TestClient):
     suffix = uuid.uuid4().hex[:8]
     user = {
@@ -67,3 +82,13 @@ def test_authenticated_api_flow(client: TestClient):
     makes = client.get("/makes/", headers=headers)
     assert makes.status_code == 200
     assert isinstance(makes.json(), list)
+
+
+def test_sync_runs_requires_auth(client: TestClient):
+    response = client.get("/sync/runs")
+    assert response.status_code == 401
+
+
+def test_sync_trigger_requires_auth(client: TestClient):
+    response = client.post("/sync/tasks", json={})
+    assert response.status_code == 401
@@ -0,0 +1,76 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from car_tasks.back4app import Back4AppClient, RECORD_KEYS
+
+TOTAL_RECORDS = 95
+
+
+class StubParseHandler(BaseHTTPRequestHandler):
+    records = [
+        {"objectId": f"id{i:04d}", "Make": "Ford", "Model": "Focus", "Year": 2015, "Extra": "x"}
+        for i in range(TOTAL_RECORDS)
+    ]
+    requests_seen: list = []
+    fail_next = 0
+
+    def do_GET(self):
+        params = {k: v[0] for k, v in parse_qs(urlparse(self.path).query).items()}
+        type(self).requests_seen.append((params, dict(self.headers)))
+        if type(self).fail_next:
+            type(self).fail_next -= 1
+            self.send_response(503)
+            self.end_headers()
+            return
+
+        skip, limit = int(params["skip"]), int(params["limit"])
+        keys = params["keys"].split(",")
+        page = [{k: r[k] for k in keys if k in r} for r in self.records[skip:skip + limit]]
+        body = json.dumps({"results": page}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_url():
+    StubParseHandler.requests_seen = []
+    StubParseHandler.fail_next = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubParseHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/classes/Carmodels_Car_Model_List"
+    server.shutdown()
+
+
+def test_iter_pages_concurrent_in_order(stub_url):
+    with Back4AppClient(base_url=stub_url, concurrency=4, page_size=10) as client:
+        pages = list(client.iter_pages({"Year": 2015}))
+
+    ids = [r["objectId"] for page in pages for r in page]
+    assert ids == [f"id{i:04d}" for i in range(TOTAL_RECORDS)]
+    assert all("Extra" not in r for page in pages for r in page)
+    assert client.stats["records"] == TOTAL_RECORDS
+
+    params, headers = StubParseHandler.requests_seen[0]
+    assert params["keys"] == ",".join(RECORD_KEYS)
+    assert json.loads(params["where"]) == {"Year": 2015}
+    assert "gzip" in headers["Accept-Encoding"]
+
+
+def test_fetch_page_retries_server_errors(stub_url):
+    StubParseHandler.fail_next = 2
+    with Back4AppClient(base_url=stub_url, concurrency=1, retries=3, backoff=0) as client:
+        page = client.fetch_page({}, skip=0, limit=5)
+
+    assert len(page) == 5
+    assert len(StubParseHandler.requests_seen) == 3
@@ -0,0 +1,109 @@
+import asyncio
+
+from app.schemas.car_schema import CarBulkResult
+from app.utils.catalog import CATALOG_CHANGED
+from app.utils.services import (
+    BULK_UPDATE_CARS_SQL,
+    bulk_create_cars_async,
+    bulk_delete_cars_async,
+    bulk_update_cars_async,
+    create_missing_models_async,
+)
+from tests.fakes import CATALOG, FakeSession, car_row, sql
+
+
+def test_bulk_create_resolves_models_once_and_inserts_together():
+    session = FakeSession(
+        [],  # make 9 is not in PostgreSQL either
+        [],  # no concurrent "Supra"
+        [(11, 1, "Supra")],  # created
+        # RETURNING rows, in the order of the valid items 0, 1 and 3
+        [car_row(100), car_row(101, car_model_id=11), car_row(102, car_model_id=20)],
+    )
+    items = [
+        {"name": "Car", "year": 2020, "make_id": 1, "car_model_id": 10},
+        {"name": "Car", "year": 2020, "make_id": 1, "car_model_name": "Supra"},
+        {"name": "Car", "year": 2020, "make_id": 1, "car_model_id": 20},  # Audi model
+        {"name": "Car", "year": 2020, "make_id": 2, "car_model_name": "A4"},
+        {"name": "Car", "year": 2020, "make_id": 9, "car_model_name": "X"},
+        {"name": "Car", "year": 2020, "make_id": 1},
+    ]
+
+    results = asyncio.run(bulk_create_cars_async(session, items, user_id=7, catalog=CATALOG))
+
+    assert [r["status"] for r in results] == ["created", "created", "error", "created", "error", "error"]
+    assert [r["id"] for r in results] == [100, 101, None, 102, None, None]
+    assert results[2]["error"] == "CarModel does not belong to the given make"
+    assert results[4]["error"] == "Make not found"
+    assert results[1]["car"]["car_model"].name == "Supra"
+    assert results[1]["car"]["car_model"].make.name == "Toyota"
+
+    assert len(session.statements) == 4
+    insert_cars, rows = session.statements[3]
+    assert "RETURNING" in sql(insert_cars)
+    assert [row["car_model_id"] for row in rows] == [10, 11, 20]
+    assert {row["user_id"] for row in rows} == {7}
+    assert session.info[CATALOG_CHANGED] is True
+    CarBulkResult.model_validate({"succeeded": 3, "failed": 3, "results": results})
+
+
+def test_bulk_create_with_known_models_is_one_statement():
+    session = FakeSession([car_row(100)])
+    items = [{"name": "Car", "year": 2020, "make_id": 1, "car_model_name": "Corolla"}]
+
+    results = asyncio.run(bulk_create_cars_async(session, items, user_id=7, catalog=CATALOG))
+
+    assert results[0]["status"] == "created"
+    assert len(session.statements) == 1
+    assert CATALOG_CHANGED not in session.info
+
+
+def test_bulk_update_sends_one_statement_scoped_to_the_owner():
+    session = FakeSession([car_row(1, name="New"), car_row(3, car_model_id=20)])
+    items = [
+        {"id": 1, "name": "New"},
+        {"id": 2, "category": None},  # not the user's car
+        {"id": 3, "car_model_id": 20},
+        {"id": 1, "year": 2019},
+        {"id": 4, "name": None},
+    ]
+
+    results = asyncio.run(bulk_update_cars_async(session, items, user_id=7, catalog=CATALOG))
+
+    assert [r["status"] for r in results] == ["updated", "error", "updated", "error", "error"]
+    assert results[1]["error"] == "Car not found or not owned by user"
+    assert results[3]["error"] == "Duplicate id in request"
+    assert results[2]["car"]["car_model"].make.name == "Audi"
+
+    assert len(session.statements) == 1
+    statement, params = session.statements[0]
+    assert statement is BULK_UPDATE_CARS_SQL
+    assert params["user_id"] == 7
+    assert params["ids"] == [1, 2, 3]
+    assert params["set_names"] == [True, False, False]
+    assert params["set_categories"] == [False, True, False]
+    assert params["car_model_ids"] == [None, None, 20]
+
+
+def test_bulk_delete_reports_each_id():
+    session = FakeSession([1, 3])
+
+    results = asyncio.run(bulk_delete_cars_async(session, [1, 2, 3, 1], user_id=7))
+
+    assert [r["status"] for r in results] == ["deleted", "error", "deleted", "error"]
+    assert len(session.statements) == 1
+    assert "user_id" in sql(session.statements[0][0])
+
+
+def test_models_created_concurrently_are_picked_up():
+    session = FakeSession(
+        [],  # neither exists yet
+        [(11, 1, "Supra")],  # "Yaris" skipped by ON CONFLICT
+        [(12, 1, "Yaris")],
+    )
+
+    models = asyncio.run(create_missing_models_async(session, {(1, "Supra"), (1, "Yaris")}, CATALOG))
+
+    assert {pair: model.id for pair, model in models.items()} == {(1, "Supra"): 11, (1, "Yaris"): 12}
+    assert "ON CONFLICT (make_id, name) DO NOTHING" in sql(session.statements[1][0])
+    assert len(session.statements) == 3
@@ -0,0 +1,117 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from app.routers import cars_routes
+from app.schemas.car_schema import CarCreate, CarRead
+from app.utils.catalog import CATALOG_CHANGED, Catalog
+from app.utils.services import (
+    create_car_with_model_async,
+    delete_user_car_async,
+    get_user_car_async,
+    update_user_car_async,
+)
+from tests.fakes import CATALOG, FakeSession, car_row, sql
+
+
+def test_create_is_one_insert_returning():
+    session = FakeSession([car_row(100)])
+
+    car = asyncio.run(
+        create_car_with_model_async(
+            session, name="Car", year=2020, make_id=1, car_model_name="Corolla", user_id=7, catalog=CATALOG
+        )
+    )
+
+    assert len(session.statements) == 1
+    assert "RETURNING" in sql(session.statements[0][0])
+    assert CarRead.model_validate(car).full_name == "Toyota Corolla 2020"
+
+
+def test_create_rejects_a_model_missing_from_catalog_and_database():
+    session = FakeSession([])
+    with pytest.raises(ValueError, match="CarModel with given ID not found"):
+        asyncio.run(create_car_with_model_async(session, name="Car", year=2020, make_id=1, car_model_id=99, catalog=CATALOG))
+    assert len(session.statements) == 1
+    assert CATALOG_CHANGED not in session.info
+
+
+def test_create_accepts_a_model_missing_from_a_stale_catalog():
+    catalog = Catalog.from_rows([(1, "Toyota")], [(10, "Corolla", 1)])
+    session = FakeSession(
+        [(30, "Yaris", 3, "Kia")],  # created by another worker, with its make
+        [car_row(100, car_model_id=30)],
+    )
+
+    car = asyncio.run(
+        create_car_with_model_async(session, name="Car", year=2020, make_id=3, car_model_id=30, catalog=catalog)
+    )
+
+    assert car["car_model"].name == "Yaris" and car["car_model"].make.name == "Kia"
+    assert len(session.statements) == 2
+    assert [make.name for make in catalog.makes] == ["Kia", "Toyota"]
+    assert catalog.models_for(3) == [catalog.models_by_id[30]]
+    assert session.info[CATALOG_CHANGED] is True
+
+
+@pytest.mark.parametrize("data, verb", [({"year": 2021}, "UPDATE"), ({}, "SELECT")])
+def test_update_is_one_statement_scoped_to_the_owner(data, verb):
+    session = FakeSession([car_row(1, year=2021)])
+
+    car = asyncio.run(update_user_car_async(session, 1, 7, data, CATALOG))
+
+    assert car["year"] == 2021 and car["car_model"].name == "Corolla"
+    assert len(session.statements) == 1
+    statement = sql(session.statements[0][0])
+    assert statement.startswith(verb) and "cars.user_id" in statement
+
+
+def test_missing_or_foreign_car_is_not_found():
+    for call in (
+        lambda session: get_user_car_async(session, 1, 7, CATALOG),
+        lambda session: update_user_car_async(session, 1, 7, {"name": "X"}, CATALOG),
+        lambda session: delete_user_car_async(session, 1, 7),
+    ):
+        session = FakeSession([])
+        with pytest.raises(ValueError, match="not owned"):
+            asyncio.run(call(session))
+        assert len(session.statements) == 1
+        assert "cars.user_id" in sql(session.statements[0][0])
+
+
+class CommitSession(FakeSession):
+    async def commit(self):
+        pass
+
+
+class FakeNeo4j:
+    async def write(self, fn, **kwargs):
+        pass
+
+
+class CountingRedis:
+    def __init__(self):
+        self.bumps = 0
+
+    async def incr(self, key):
+        self.bumps += 1
+
+
+@pytest.mark.parametrize("in_database, status", [(True, 200), (False, 404)])
+def test_put_checks_postgres_before_rejecting_a_model_the_catalog_lacks(monkeypatch, in_database, status):
+    catalog = Catalog.from_rows([(1, "Toyota")], [(10, "Corolla", 1)])
+    redis = CountingRedis()
+    monkeypatch.setattr(cars_routes, "redis_async_client", redis)
+    session = CommitSession([(30, "Yaris", 1, "Toyota")] if in_database else [], [car_row(5, car_model_id=30)])
+    payload = CarCreate(name="Car", year=2020, make_id=1, car_model_id=30)
+
+    try:
+        car = asyncio.run(
+            cars_routes.put_car(5, payload, db=session, neo4j=FakeNeo4j(), user={"sub": "7"}, catalog=catalog)
+        )
+    except HTTPException as exc:
+        assert exc.status_code == status
+    else:
+        assert status == 200 and car["car_model"].name == "Yaris"
+        assert redis.bumps == 1  # other workers reload the catalog too
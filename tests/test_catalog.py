@@ -0,0 +1,102 @@
+import asyncio
+from types import SimpleNamespace
+
+from redis.exceptions import RedisError
+
+from app.schemas.car_schema import CarModelRead, MakeRead
+from app.utils.catalog import (
+    CATALOG_CHANGED,
+    CATALOG_VERSION_KEY,
+    Catalog,
+    CatalogCache,
+    publish_catalog_changes,
+)
+
+MAKES = [(2, "Toyota"), (1, "Audi")]
+MODELS = [(10, "Corolla", 2), (11, "A4", 1), (12, "Camry", 2)]
+
+
+class FakeRedis:
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def incr(self, key):
+        self.data[key] = int(self.data.get(key, 0)) + 1
+        return self.data[key]
+
+
+class BrokenRedis:
+    async def get(self, key):
+        raise RedisError("down")
+
+    async def incr(self, key):
+        raise RedisError("down")
+
+
+def counting_loader():
+    loads = []
+
+    async def load(session, version):
+        loads.append(version)
+        return Catalog.from_rows(MAKES, MODELS, version)
+
+    return load, loads
+
+
+def test_catalog_maps():
+    catalog = Catalog.from_rows(MAKES, MODELS)
+
+    assert [make.name for make in catalog.makes] == ["Audi", "Toyota"]
+    assert catalog.make_ids == {"Audi": 1, "Toyota": 2}
+    assert [model.id for model in catalog.models_for(2)] == [12, 10]
+    assert catalog.models_for(3) is None
+    assert catalog.model_id(2, "Camry") == 12
+    assert catalog.model_id(1, "Camry") is None
+    # Entries serialize like the ORM objects they replace.
+    assert CarModelRead.model_validate(catalog.models_by_id[11]).model_dump() == {
+        "id": 11,
+        "name": "A4",
+        "make": MakeRead(id=1, name="Audi").model_dump(),
+    }
+
+
+def test_cache_reloads_only_when_the_version_moves():
+    redis = FakeRedis()
+    load, loads = counting_loader()
+    cache = CatalogCache(load)
+
+    first = asyncio.run(cache.get(None, redis))
+    assert asyncio.run(cache.get(None, redis)) is first
+    assert loads == [None]
+
+    asyncio.run(redis.incr(CATALOG_VERSION_KEY))
+    assert asyncio.run(cache.get(None, redis)) is not first
+    assert loads == [None, 1]
+
+
+def test_cache_reads_through_without_redis():
+    load, loads = counting_loader()
+    cache = CatalogCache(load)
+
+    asyncio.run(cache.get(None, BrokenRedis()))
+    asyncio.run(cache.get(None, BrokenRedis()))
+    assert len(loads) == 2
+
+
+def test_only_catalog_writes_bump_the_version():
+    redis = FakeRedis()
+    session = SimpleNamespace(info={})
+
+    asyncio.run(publish_catalog_changes(session, redis))
+    assert CATALOG_VERSION_KEY not in redis.data
+
+    session.info[CATALOG_CHANGED] = True
+    asyncio.run(publish_catalog_changes(session, redis))
+    assert redis.data[CATALOG_VERSION_KEY] == 1
+    assert CATALOG_CHANGED not in session.info
+
+    session.info[CATALOG_CHANGED] = True
+    asyncio.run(publish_catalog_changes(session, BrokenRedis()))  # logged, not raised
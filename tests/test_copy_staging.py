@@ -0,0 +1,129 @@
+import csv
+import io
+import uuid
+from datetime import datetime, timezone
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.models.car_model import Car, CarModel, Make
+from app.models.sync_model import SyncCarStaging
+from app.utils.services import STAGING_COLUMNS, copy_cars_to_staging_sync
+from car_tasks.sync_cars import _new_stats, _normalize_items, _sync_batch_bulk, _sync_batch_copy
+
+
+class FakeCursor:
+    def __init__(self, log):
+        self.log = log
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def copy_expert(self, sql, file):
+        self.log.append(("copy", sql, file.read()))
+
+
+class FakeDBAPIConnection:
+    def __init__(self, log):
+        self.log = log
+
+    def cursor(self):
+        return FakeCursor(self.log)
+
+
+class FakeConnection:
+    def __init__(self, log):
+        self.connection = FakeDBAPIConnection(log)
+
+
+class FakeSession:
+    def __init__(self):
+        self.log = []
+
+    def execute(self, statement):
+        self.log.append(("execute", str(statement)))
+
+    def connection(self):
+        return FakeConnection(self.log)
+
+
+def test_copy_cars_to_staging_writes_csv_with_nulls():
+    session = FakeSession()
+    stamp = datetime(2020, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    records = [
+        {
+            "external_id": "abc",
+            "make": "Ford",
+            "model": 'F-150 "Raptor", SVT',
+            "year": 2019,
+            "category": None,
+            "created_at": stamp,
+            "updated_at": stamp,
+            "source_hash": "0" * 32,
+        }
+    ]
+
+    copy_cars_to_staging_sync(session, records)
+
+    assert session.log[0] == ("execute", "TRUNCATE sync_car_staging")
+    kind, sql, payload = session.log[1]
+    assert kind == "copy"
+    assert sql.startswith("COPY sync_car_staging (" + ", ".join(STAGING_COLUMNS) + ") FROM STDIN")
+    row = next(csv.reader(io.StringIO(payload)))
+    assert row == ["abc", "Ford", 'F-150 "Raptor", SVT', "2019", "\\N", stamp.isoformat(), stamp.isoformat(), "0" * 32]
+
+
+def test_copy_merge_matches_the_bulk_path(pg_connection):
+    """Both sync paths give the same counts and rows (PostgreSQL, skipped without it)."""
+    session = Session(bind=pg_connection)
+    prefix = f"copy-{uuid.uuid4().hex[:8]}"
+
+    def items(mode: str, rows: list[tuple]) -> list[dict]:
+        return [
+            {
+                "objectId": f"{prefix}-{mode}-{key}",
+                "Make": f"{prefix} Make",
+                "Model": model,
+                "Year": 2020,
+                "Category": category,
+                "createdAt": "2020-01-01T00:00:00.000Z",
+                "updatedAt": "2021-01-01T00:00:00.000Z",
+            }
+            for key, model, category in rows
+        ]
+
+    def run(rows: list[tuple]) -> dict:
+        """Sync `rows` through both paths; returns their stats by mode."""
+        results = {}
+        for mode in ("bulk", "copy"):
+            stats, graph_rows = _new_stats(), []
+            if mode == "bulk":
+                _sync_batch_bulk(session, items(mode, rows), stats, {}, {}, graph_rows)
+            else:
+                _sync_batch_copy(session, _normalize_items(items(mode, rows), stats), stats, graph_rows)
+            results[mode] = {key: stats[key] for key in ("inserted", "updated", "skipped", "errors")}
+            results[mode]["graph_rows"] = len(graph_rows)
+        return results
+
+    def stored(mode: str) -> dict:
+        rows = session.execute(
+            select(Car.external_id, Car.name, Car.year, Car.category, Make.name)
+            .join(CarModel, CarModel.id == Car.car_model_id)
+            .join(Make, Make.id == CarModel.make_id)
+            .where(Car.external_id.like(f"{prefix}-{mode}-%"))
+        ).all()
+        return {external_id.rsplit("-", 1)[-1]: rest for external_id, *rest in rows}
+
+    first = run([("a", "Corolla", "Sedan"), ("b", "Corolla", None), ("c", "Supra", "Coupe")])
+    assert first["bulk"] == first["copy"] == {"inserted": 3, "updated": 0, "skipped": 0, "errors": 0, "graph_rows": 3}
+
+    second = run([("a", "Corolla", "Sedan"), ("b", "Corolla", "Wagon"), ("d", "Supra", None)])
+    assert second["bulk"] == second["copy"] == {"inserted": 1, "updated": 1, "skipped": 1, "errors": 0, "graph_rows": 2}
+    assert stored("bulk") == stored("copy")
+    assert stored("copy")["b"][2] == "Wagon"
+
+    # The staging table only ever holds the last batch.
+    assert session.execute(select(func.count()).select_from(SyncCarStaging)).scalar_one() == 3
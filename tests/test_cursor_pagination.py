@@ -0,0 +1,178 @@
+import asyncio
+from datetime import datetime, timezone
+from collections import namedtuple
+from types import SimpleNamespace
+
+import pytest
+from pydantic import BaseModel, ConfigDict
+
+from app.utils import cursor_pagination
+from app.utils.cache import filters_cache_key
+from app.schemas.car_schema import CarReportRead
+from app.utils.cursor_pagination import (
+    InvalidCursor,
+    build_page_query,
+    cursor_paginate,
+    cursor_paginate_rows,
+    decode_cursor,
+    encode_cursor,
+    plan_rows,
+)
+from app.utils.services import REPORT_COLUMNS, build_car_reports_query, report_keyset
+
+
+STAMP = datetime(2020, 1, 1, tzinfo=timezone.utc)
+
+
+class Item(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+
+
+class FakeResult:
+    def __init__(self, value):
+        self.value = value
+
+    def scalars(self):
+        return SimpleNamespace(all=lambda: self.value)
+
+    def scalar(self):
+        return self.value
+
+    def all(self):
+        return self.value
+
+
+class FakeSession:
+    """Answers the page query with `rows` and anything else with `scalar`."""
+
+    def __init__(self, rows, scalar=None):
+        self.rows = rows
+        self.scalar = scalar
+        self.statements = []
+
+    async def execute(self, statement):
+        self.statements.append(statement)
+        return FakeResult(self.rows if len(self.statements) == 1 else self.scalar)
+
+
+class FakeRedis:
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = str(value)
+
+
+def paginate(session, **kwargs):
+    query = build_car_reports_query(year=2018)
+    return asyncio.run(cursor_paginate(query, session, schema=Item, limit=2, **kwargs))
+
+
+def rows(*ids):
+    return [SimpleNamespace(id=i) for i in ids]
+
+
+def test_include_total_none_skips_the_count():
+    session = FakeSession(rows(1, 2, 3))
+    page = paginate(session, include_total="none")
+    assert page.total is None
+    assert [item.id for item in page.items] == [1, 2]
+    assert decode_cursor(report_keyset(), page.next_cursor) == ([2], False)
+    assert page.prev_cursor is None
+    assert len(session.statements) == 1
+
+
+def test_short_first_page_is_its_own_total():
+    session = FakeSession(rows(1))
+    assert paginate(session).total == 1
+    assert len(session.statements) == 1
+
+
+def test_exact_total_is_cached_per_filter_set(monkeypatch):
+    redis = FakeRedis()
+    monkeypatch.setattr(cursor_pagination, "redis_async_client", redis)
+
+    first = FakeSession(rows(1, 2, 3), scalar=42)
+    assert paginate(first, total_cache_key="k").total == 42
+    assert len(first.statements) == 2
+
+    later = FakeSession(rows(3, 4), scalar=0)
+    assert paginate(later, cursor="2", total_cache_key="k").total == 42
+    assert len(later.statements) == 1
+
+    redis.data["sync:generation"] = "1"
+    fresh = FakeSession(rows(3, 4), scalar=40)
+    assert paginate(fresh, cursor="2", total_cache_key="k").total == 40
+
+
+def test_estimated_total_reads_the_plan_row_estimate():
+    session = FakeSession(rows(1, 2), scalar='[{"Plan": {"Node Type": "Hash Join", "Plan Rows": 1234}}]')
+    page = paginate(session, include_total="estimated")
+    assert page.total == 1234
+    assert isinstance(session.statements[1], cursor_pagination.Explain)
+
+
+def test_plan_rows_accepts_decoded_json():
+    assert plan_rows([{"Plan": {"Plan Rows": 7}}]) == 7
+
+
+def test_filters_cache_key_normalizes_filters():
+    stamp = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    key = filters_cache_key({"make": " Toyota", "model": None, "year": 2020, "date_from": stamp})
+    assert key == filters_cache_key({"date_from": stamp, "year": 2020, "make": "toyota "})
+    assert key != filters_cache_key({"make": "toyota", "year": 2021, "date_from": stamp})
+    # Cursors are case-sensitive
+    assert filters_cache_key({"cursor": "eyJr"}) != filters_cache_key({"cursor": "eyjr"})
+
+
+def test_report_columns_match_the_response_schema():
+    assert [column.key for column in REPORT_COLUMNS] == list(CarReportRead.model_fields)
+
+
+def test_report_page_query_orders_by_the_projection_id():
+    sql = str(build_page_query(build_car_reports_query(), limit=5, cursor="10"))
+    assert "car_reports.id > " in sql and "ORDER BY car_reports.id ASC" in sql
+
+
+def test_cursor_paginate_rows_returns_plain_dicts():
+    Row = namedtuple("Row", ["id", "name"])
+    session = FakeSession([Row(1, "a"), Row(2, "b"), Row(3, "c")], scalar=5)
+    query = build_car_reports_query(year=2018)
+    page = asyncio.run(cursor_paginate_rows(query, session, limit=2))
+    assert page["items"] == [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}]
+    assert page["total"] == 5
+    assert decode_cursor(report_keyset(), page["next_cursor"]) == ([2], False)
+    assert page["prev_cursor"] is None
+
+
+def test_cursor_round_trips_composite_keys():
+    keyset = report_keyset("-created_at")
+    cursor = encode_cursor(keyset, [STAMP, 7], backward=True)
+    assert decode_cursor(keyset, cursor) == ([STAMP, 7], True)
+
+
+@pytest.mark.parametrize("cursor", ["not-base64!", encode_cursor(report_keyset("year"), [2018, 3])])
+def test_foreign_or_malformed_cursors_are_rejected(cursor):
+    with pytest.raises(InvalidCursor):
+        decode_cursor(report_keyset("-created_at"), cursor)
+
+
+def test_backward_page_seeks_in_reverse_and_restores_order():
+    keyset = report_keyset("-created_at")
+    cursor = encode_cursor(keyset, [STAMP, 7], backward=True)
+    sql = str(build_page_query(build_car_reports_query(), keyset, limit=2, cursor=cursor))
+    assert "(car_reports.created_at, car_reports.id) > " in sql
+    assert "ORDER BY car_reports.created_at ASC, car_reports.id ASC" in sql
+
+    Row = namedtuple("Row", ["id", "created_at"])
+    later = [Row(8, STAMP), Row(9, STAMP), Row(10, STAMP)]  # scan order, one look-ahead row
+    session = FakeSession(later, scalar=0)
+    page = asyncio.run(cursor_paginate_rows(build_car_reports_query(), session, keyset=keyset, limit=2, cursor=cursor, include_total="none"))
+    assert [item["id"] for item in page["items"]] == [9, 8]
+    assert decode_cursor(keyset, page["next_cursor"]) == ([STAMP, 8], False)
+    assert decode_cursor(keyset, page["prev_cursor"]) == ([STAMP, 9], True)
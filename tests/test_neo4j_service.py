@@ -0,0 +1,78 @@
+from app.utils import neo4j_service
+from app.utils.neo4j_service import (
+    CAR_NODES_BATCH_QUERY,
+    DELETE_CAR_NODES_BATCH_QUERY,
+    delete_car_nodes_sync,
+    write_car_nodes_sync,
+)
+
+
+class FakeResult:
+    def consume(self):
+        return None
+
+
+class FakeTx:
+    def __init__(self, calls):
+        self.calls = calls
+
+    def run(self, query, **params):
+        self.calls.append((query, params))
+        return FakeResult()
+
+
+class FakeSession:
+    def __init__(self, calls):
+        self.calls = calls
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute_write(self, fn):
+        return fn(FakeTx(self.calls))
+
+
+class FakeDriver:
+    def __init__(self):
+        self.calls = []
+
+    def session(self):
+        return FakeSession(self.calls)
+
+
+def test_write_car_nodes_sync_batches(monkeypatch):
+    driver = FakeDriver()
+    monkeypatch.setattr(neo4j_service, "driver_sync", driver)
+    rows = [
+        {"car_id": i, "name": "Focus", "year": 2015, "category": "", "make_id": 1, "user_id": 0}
+        for i in range(5)
+    ]
+
+    timings = write_car_nodes_sync(rows, batch_size=2)
+
+    assert [t["rows"] for t in timings] == [2, 2, 1]
+    assert all(query == CAR_NODES_BATCH_QUERY for query, _ in driver.calls)
+    assert [p["rows"] for _, p in driver.calls] == [rows[0:2], rows[2:4], rows[4:5]]
+
+
+def test_write_car_nodes_sync_empty(monkeypatch):
+    driver = FakeDriver()
+    monkeypatch.setattr(neo4j_service, "driver_sync", driver)
+    assert write_car_nodes_sync([]) == []
+    assert driver.calls == []
+
+
+def test_delete_car_nodes_sync_batches(monkeypatch):
+    driver = FakeDriver()
+    monkeypatch.setattr(neo4j_service, "driver_sync", driver)
+
+    timings = delete_car_nodes_sync([1, 2, 3], batch_size=2)
+
+    assert [t["rows"] for t in timings] == [2, 1]
+    assert driver.calls == [
+        (DELETE_CAR_NODES_BATCH_QUERY, {"ids": [1, 2]}),
+        (DELETE_CAR_NODES_BATCH_QUERY, {"ids": [3]}),
+    ]
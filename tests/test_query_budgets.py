@@ -0,0 +1,166 @@
+"""
+Per-endpoint budgets of SQL statements and ORM rows loaded.
+
+The loader-strategy tests run on in-memory SQLite; the endpoint budgets need
+the configured PostgreSQL and skip without it.
+"""
+import uuid
+from collections.abc import Generator
+from datetime import datetime, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, delete, insert, select
+from sqlalchemy.exc import InvalidRequestError, OperationalError
+from sqlalchemy.orm import Session
+
+from app.core.async_db import async_engine, get_neo4j_service
+from app.core.sync_db import SessionLocal
+from app.deps.auth import security
+from app.main import app
+from app.models.car_model import Car, CarModel, Make
+from app.utils.catalog import catalog_cache
+from tests.conftest import count_queries
+
+STAMP = datetime(2020, 1, 1, tzinfo=timezone.utc)
+
+
+def _seed_catalog(session: Session, makes: int, models: int, cars: int, prefix: str = "", user_id=None) -> None:
+    for m in range(makes):
+        make = Make(name=f"{prefix}Make {m}")
+        session.add(make)
+        session.flush()
+        for n in range(models):
+            model = CarModel(name=f"Model {n}", make_id=make.id)
+            session.add(model)
+            session.flush()
+            session.execute(
+                insert(Car),
+                [
+                    {"name": "Car", "year": 2018, "car_model_id": model.id, "user_id": user_id, "created_at": STAMP}
+                    for _ in range(cars)
+                ],
+            )
+    session.commit()
+
+
+@pytest.fixture
+def sqlite_session() -> Generator[Session, None, None]:
+    engine = create_engine("sqlite://")
+    for table in (Make.__table__, CarModel.__table__, Car.__table__):
+        table.create(engine)
+    with Session(engine) as session:
+        _seed_catalog(session, makes=3, models=4, cars=25)
+        session.expunge_all()
+        yield session
+
+
+def test_listing_makes_loads_only_makes(sqlite_session):
+    with count_queries(sqlite_session.get_bind()) as count:
+        makes = sqlite_session.execute(select(Make)).scalars().all()
+    assert len(makes) == 3
+    assert len(count.statements) == 1 and count.loaded == 3, count
+
+
+def test_loading_a_car_stops_at_its_make(sqlite_session):
+    with count_queries(sqlite_session.get_bind()) as count:
+        car = sqlite_session.execute(select(Car).limit(1)).scalars().one()
+        assert car.full_name == "Make 0 Model 0"
+    # car, its model, its make - not the model's other 24 cars
+    assert len(count.statements) == 3 and count.loaded == 3, count
+
+
+def test_collections_load_only_on_request(sqlite_session):
+    make = sqlite_session.execute(select(Make).limit(1)).scalars().one()
+    with pytest.raises(InvalidRequestError):
+        make.models
+
+
+# -------------------- endpoint budgets (PostgreSQL) -------------------- #
+
+# path -> (max statements, max ORM rows loaded); the catalog starts cold
+BUDGETS = {
+    "/makes/": (2, 0),
+    "/makes/{make_id}/models": (2, 0),
+    "/cars/?limit=10": (4, 11 + 2 + 2),
+    "/reports/?limit=10": (2, 0),
+}
+
+
+@pytest.fixture
+def api() -> Generator[tuple[TestClient, dict, dict], None, None]:
+    """Client, auth headers and ids of a seeded catalog (removed afterwards)."""
+    prefix = f"budget-{uuid.uuid4().hex[:8]} "
+    user_id = 10**9 + uuid.uuid4().int % 10**6
+    session = SessionLocal()
+    try:
+        _seed_catalog(session, makes=2, models=5, cars=40, prefix=prefix, user_id=user_id)
+    except OperationalError:
+        session.close()
+        pytest.skip("PostgreSQL is not reachable")
+    car_id, model_id, make_id = session.execute(
+        select(Car.id, CarModel.id, CarModel.make_id).join(Car.car_model).where(Car.user_id == user_id).limit(1)
+    ).one()
+
+    catalog_cache.clear()  # the seed bypassed the catalog version
+
+    token = security.create_access_token(str(user_id))
+    try:
+        with TestClient(app) as client:
+            yield client, {"Authorization": f"Bearer {token}"}, {"make_id": make_id, "model_id": model_id, "car_id": car_id}
+    finally:
+        session.execute(delete(Make).where(Make.name.startswith(prefix)))
+        session.commit()
+        session.close()
+
+
+@pytest.mark.parametrize("path", BUDGETS)
+def test_endpoint_stays_within_budget(api, path):
+    client, headers, ids = api
+    max_statements, max_loaded = BUDGETS[path]
+    with count_queries(async_engine.sync_engine) as count:
+        response = client.get(path.format(**ids), headers=headers)
+    assert response.status_code == 200, response.text
+    assert len(count.statements) <= max_statements, f"{path}: {count}"
+    assert count.loaded <= max_loaded, f"{path}: {count}"
+
+
+def test_catalog_endpoints_are_served_from_memory(api):
+    client, headers, ids = api
+    client.get("/makes/", headers=headers)
+    with count_queries(async_engine.sync_engine) as count:
+        assert client.get("/makes/", headers=headers).status_code == 200
+        assert client.get(f"/makes/{ids['make_id']}/models", headers=headers).status_code == 200
+    assert not count.statements, count
+
+
+class FakeNeo4j:
+    async def write(self, fn, **kwargs):
+        return None
+
+
+# (method, path, body) -> max statements; the catalog is warm and Neo4j stubbed out
+WRITE_BUDGETS = {
+    ("POST", "/cars/", '{"name": "New", "year": 2020, "make_id": {make_id}, "car_model_id": {model_id}}'): 1,
+    ("GET", "/cars/{car_id}", None): 1,
+    ("PATCH", "/cars/{car_id}", '{"year": 2021}'): 1,
+    ("PUT", "/cars/{car_id}", '{"name": "Put", "year": 2019, "make_id": {make_id}, "car_model_id": {model_id}}'): 1,
+    ("DELETE", "/cars/{car_id}", None): 1,
+}
+
+
+@pytest.mark.parametrize("method,path,body", WRITE_BUDGETS)
+def test_car_write_stays_within_budget(api, method, path, body):
+    client, headers, ids = api
+    app.dependency_overrides[get_neo4j_service] = FakeNeo4j
+    try:
+        client.get("/makes/", headers=headers)
+        content = body.replace("{make_id}", str(ids["make_id"])).replace("{model_id}", str(ids["model_id"])) if body else None
+        with count_queries(async_engine.sync_engine) as count:
+            response = client.request(
+                method, path.format(**ids), content=content, headers={**headers, "Content-Type": "application/json"}
+            )
+    finally:
+        app.dependency_overrides.pop(get_neo4j_service, None)
+    assert response.status_code < 300, response.text
+    assert len(count.statements) <= WRITE_BUDGETS[(method, path, body)], f"{method} {path}: {count}"
@@ -0,0 +1,57 @@
+import asyncio
+import gzip
+import json
+from datetime import datetime, timezone
+
+from app.utils.report_export import EXPORT_FIELDS, encode_export
+
+STAMP = datetime(2020, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+
+
+def _row(i: int) -> dict:
+    return {
+        "id": i,
+        "name": "Ford Focus",
+        "year": 2018,
+        "make": "Ford",
+        "model": 'Focus "ST", 5dr',
+        "category": None,
+        "created_at": STAMP,
+        "updated_at": None,
+    }
+
+
+async def _batches(*batches):
+    for batch in batches:
+        yield batch
+
+
+def export(fmt, *batches, compress=False) -> list[bytes]:
+    async def collect():
+        return [chunk async for chunk in encode_export(_batches(*batches), fmt, compress)]
+
+    return asyncio.run(collect())
+
+
+def test_csv_export_has_header_and_one_chunk_per_batch():
+    chunks = export("csv", [_row(1), _row(2)], [_row(3)])
+    assert len(chunks) == 3
+    lines = b"".join(chunks).decode().splitlines()
+    assert lines[0] == ",".join(EXPORT_FIELDS)
+    assert lines[1] == '1,Ford Focus,2018,Ford,"Focus ""ST"", 5dr",,2020-01-02T03:04:05+00:00,'
+    assert len(lines) == 4
+
+
+def test_empty_csv_export_is_just_the_header():
+    assert b"".join(export("csv")).decode() == ",".join(EXPORT_FIELDS) + "\n"
+
+
+def test_ndjson_export_is_one_object_per_line():
+    lines = b"".join(export("ndjson", [_row(1)], [_row(2)])).splitlines()
+    assert [json.loads(line)["id"] for line in lines] == [1, 2]
+    assert json.loads(lines[0])["created_at"] == "2020-01-02T03:04:05Z"
+
+
+def test_gzip_export_is_a_single_gzip_stream():
+    body = b"".join(export("ndjson", [_row(1)], [_row(2)], compress=True))
+    assert gzip.decompress(body) == b"".join(export("ndjson", [_row(1)], [_row(2)]))
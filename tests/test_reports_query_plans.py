@@ -0,0 +1,70 @@
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import text
+
+from app.utils.cursor_pagination import build_count_query, build_page_query, encode_cursor
+from app.utils.services import REPORT_SORTS, build_car_reports_query, contains_pattern, report_keyset
+from tests.conftest import explain
+
+
+def test_contains_pattern_escapes_wildcards():
+    assert contains_pattern("  Toyota ") == "%toyota%"
+    assert contains_pattern("50%_off") == "%50\\%\\_off%"
+
+
+def test_make_filter_uses_trigram_index(pg_connection):
+    # Tiny test tables favour sequential scans; disable them to see whether
+    # the generated predicate can use the expression index at all.
+    pg_connection.execute(text("SET LOCAL enable_seqscan = off"))
+    plan = explain(pg_connection, build_car_reports_query(make="toyo"))
+    assert "ix_car_reports_make_lower_trgm" in plan
+
+
+def test_model_filter_uses_trigram_index(pg_connection):
+    pg_connection.execute(text("SET LOCAL enable_seqscan = off"))
+    plan = explain(pg_connection, build_car_reports_query(model="coro"))
+    assert "ix_car_reports_model_lower_trgm" in plan
+
+
+FILTER_COMBINATIONS = [
+    {},
+    {"year": 2018},
+    {"date_from": datetime(2016, 1, 1, tzinfo=timezone.utc), "date_to": datetime(2016, 3, 1, tzinfo=timezone.utc)},
+    {"year": 2018, "date_from": datetime(2016, 1, 1, tzinfo=timezone.utc)},
+    {"make": "plan make 7"},
+    {"model": "plan model 3-4"},
+    {"make": "plan make 7", "year": 2020},
+]
+
+
+@pytest.mark.parametrize("filters", FILTER_COMBINATIONS, ids=lambda f: "-".join(f) or "none")
+@pytest.mark.parametrize("cursor", [None, "25000"])
+def test_report_pages_avoid_seq_scan(seeded_connection, filters, cursor):
+    query = build_car_reports_query(**filters)
+    plan = explain(seeded_connection, build_page_query(query, limit=10, cursor=cursor))
+    assert "Seq Scan" not in plan, plan
+
+
+# A mid-dataset sort key per sort column, to page from deep inside the result
+SORT_KEYS = {
+    "id": [25000],
+    "created_at": [datetime(2017, 11, 1, tzinfo=timezone.utc), 25000],
+    "year": [2017, 25000],
+    "make": ["Plan Make 5", 25000],
+}
+
+
+@pytest.mark.parametrize("sort", REPORT_SORTS)
+@pytest.mark.parametrize("backward", [False, True])
+def test_sorted_pages_are_index_range_seeks(seeded_connection, sort, backward):
+    keyset = report_keyset(sort)
+    cursor = encode_cursor(keyset, SORT_KEYS[sort.lstrip("-")], backward=backward)
+    plan = explain(seeded_connection, build_page_query(build_car_reports_query(), keyset, limit=10, cursor=cursor))
+    assert "Seq Scan" not in plan and "Sort" not in plan, plan
+
+
+@pytest.mark.parametrize("filters", [f for f in FILTER_COMBINATIONS if f], ids=lambda f: "-".join(f))
+def test_report_totals_avoid_seq_scan(seeded_connection, filters):
+    plan = explain(seeded_connection, build_count_query(build_car_reports_query(**filters)))
+    assert "Seq Scan" not in plan, plan
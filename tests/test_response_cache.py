@@ -0,0 +1,73 @@
+import asyncio
+
+from redis.exceptions import RedisError
+
+from app.utils.cache import SYNC_GENERATION_KEY, cache_stats, get_or_build
+
+
+class FakeRedis:
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value
+
+    async def incr(self, key):
+        self.data[key] = int(self.data.get(key, 0)) + 1
+        return self.data[key]
+
+    async def mget(self, *keys):
+        return [self.data.get(key) for key in keys]
+
+
+class BrokenRedis:
+    async def get(self, key):
+        raise RedisError("down")
+
+
+def build_counter():
+    calls = []
+
+    async def build():
+        calls.append(1)
+        return b'{"items": []}'
+
+    return build, calls
+
+
+def test_second_lookup_is_a_hit():
+    redis = FakeRedis()
+    build, calls = build_counter()
+
+    assert asyncio.run(get_or_build(redis, "reports:page", "k", build)) == (b'{"items": []}', False)
+    assert asyncio.run(get_or_build(redis, "reports:page", "k", build)) == (b'{"items": []}', True)
+    assert len(calls) == 1
+
+    stats = asyncio.run(cache_stats(redis, "reports:page"))
+    assert stats == {"available": True, "generation": 0, "hits": 1, "misses": 1, "hit_ratio": 0.5}
+
+
+def test_new_sync_generation_misses():
+    redis = FakeRedis()
+    build, calls = build_counter()
+
+    asyncio.run(get_or_build(redis, "reports:page", "k", build))
+    redis.data[SYNC_GENERATION_KEY] = b"1"
+    _, hit = asyncio.run(get_or_build(redis, "reports:page", "k", build))
+
+    assert not hit
+    assert len(calls) == 2
+    assert "reports:page:1:k" in redis.data
+
+
+def test_redis_failure_falls_back_to_building():
+    build, calls = build_counter()
+    assert asyncio.run(get_or_build(BrokenRedis(), "reports:page", "k", build)) == (b'{"items": []}', False)
+    assert len(calls) == 1
+
+
+def test_cache_stats_degrade_when_redis_is_down():
+    assert asyncio.run(cache_stats(BrokenRedis(), "reports:page")) == {"available": False}
@@ -0,0 +1,384 @@
+import threading
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from app.schemas.sync_schema import SyncGraphTimings
+from app.utils.services import _copy_csv_field
+from car_tasks import sync_cars
+
+from car_tasks.sync_cars import (
+    _chunks,
+    _new_stats,
+    _record_error,
+    _fingerprint,
+    _normalize_record,
+    _normalize_items,
+    _records_watermark,
+    _parse_date,
+    _prefetch,
+    _record_filter,
+    _watermark_cap,
+)
+
+
+def _item(**overrides) -> dict:
+    item = {
+        "objectId": "abc123",
+        "Make": "Toyota",
+        "Model": "Corolla",
+        "Year": 2020,
+        "Category": "Sedan",
+        "createdAt": "2020-01-02T03:04:05.000Z",
+        "updatedAt": "2021-01-02T03:04:05.000Z",
+    }
+    item.update(overrides)
+    return item
+
+
+def test_normalize_record():
+    record = _normalize_record(_item())
+    assert record["external_id"] == "abc123"
+    assert record["make"] == "Toyota"
+    assert record["model"] == "Corolla"
+    assert record["year"] == 2020
+    assert record["created_at"] == datetime(2020, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+
+
+def test_normalize_record_missing_field():
+    item = _item()
+    del item["Make"]
+    with pytest.raises(KeyError):
+        _normalize_record(item)
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        {"Year": "2020"},
+        {"Year": 20.5},
+        {"Year": True},
+        {"Make": "x" * 101},
+        {"Model": None},
+        {"Model": ""},
+        {"Category": 7},
+        {"Category": "c" * 101},
+        {"objectId": "x" * 51},
+    ],
+)
+def test_normalize_record_rejects_values_the_table_would_not_store(overrides):
+    with pytest.raises(ValueError):
+        _normalize_record(_item(**overrides))
+
+
+def test_bad_record_fails_alone_in_a_batch():
+    stats = _new_stats()
+    records = _normalize_items([_item(objectId="a"), _item(objectId="b", Year="n/a"), _item(objectId="c")], stats)
+    assert list(records) == ["a", "c"]
+    assert stats["errors"] == 1 and stats["error_samples"][0]["external_id"] == "b"
+
+
+def test_copy_rows_never_read_a_string_as_null():
+    assert _copy_csv_field(None) == "\\N"
+    assert _copy_csv_field("\\N") == '"\\N"'
+    assert _copy_csv_field('5" Wagon, long') == '"5"" Wagon, long"'
+    assert _copy_csv_field(2020) == "2020"
+
+
+def test_chunks():
+    assert list(_chunks([1, 2, 3, 4, 5], 2)) == [[1, 2], [3, 4], [5]]
+
+
+def test_prefetch_preserves_order():
+    pages = ([i] for i in range(10))
+    assert list(_prefetch(pages, max_inflight=2)) == [[i] for i in range(10)]
+
+
+def test_prefetch_reraises_producer_errors():
+    def pages():
+        yield [1]
+        raise RuntimeError("boom")
+
+    consumed = []
+    with pytest.raises(RuntimeError, match="boom"):
+        for page in _prefetch(pages(), max_inflight=1):
+            consumed.append(page)
+    assert consumed == [[1]]
+
+
+def test_prefetch_releases_producer_when_consumer_stops():
+    closed = threading.Event()
+
+    def pages():
+        try:
+            for i in range(100):
+                yield [i]
+        finally:
+            closed.set()
+
+    prefetched = _prefetch(pages(), max_inflight=1)
+    assert next(prefetched) == [0]
+    prefetched.close()
+
+    assert closed.wait(timeout=5)
+    assert not any(t.name == "back4app-prefetch" and t.is_alive() for t in threading.enumerate())
+
+
+def test_parse_date():
+    value = datetime(2021, 5, 6, 7, 8, 9, 123456, tzinfo=timezone.utc)
+    assert _parse_date(value) == {"__type": "Date", "iso": "2021-05-06T07:08:09.123Z"}
+
+
+def test_watermark_ignores_failed_records():
+    stats = _new_stats()
+    page = [
+        _item(objectId="a", updatedAt="2021-01-02T03:04:05.000Z"),
+        _item(objectId="b", updatedAt="2022-01-02T03:04:05.000Z", Make=None),
+        _item(objectId="c", updatedAt=None),
+    ]
+    records = _normalize_items(page, stats)
+    assert stats["errors"] == 2
+    assert _records_watermark(records.values()) == datetime(2021, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    assert _records_watermark([]) is None
+
+
+class QuerySession:
+    """Answers the ORM path's `query(Car).filter_by(...).first()` with no existing car."""
+
+    def query(self, model):
+        return self
+
+    def filter_by(self, **kwargs):
+        return self
+
+    def first(self):
+        return None
+
+
+def test_watermark_stays_below_records_that_failed_to_write(monkeypatch):
+    def fake_write(session, car, record, stats):
+        if record["external_id"] == "old":
+            raise RuntimeError("constraint violated")
+        return SimpleNamespace(id=1, name="Corolla", year=2020, category=None), SimpleNamespace(id=1)
+
+    monkeypatch.setattr(sync_cars, "_write_car_orm", fake_write)
+    monkeypatch.setattr(sync_cars, "create_car_node_sync", lambda **kwargs: None)
+    stats = _new_stats()
+    page = [
+        _item(objectId="old", updatedAt="2021-01-02T03:04:05.000Z"),
+        _item(objectId="new", updatedAt="2022-01-02T03:04:05.000Z"),
+    ]
+
+    synced = sync_cars._sync_batch_orm(QuerySession(), page, stats)
+
+    assert synced == datetime(2022, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    assert stats["errors"] == 1
+    run_started = datetime(2030, 1, 1, tzinfo=timezone.utc)
+    assert _watermark_cap(run_started, stats) == datetime(2021, 1, 2, 3, 4, 4, 999000, tzinfo=timezone.utc)
+
+
+def test_watermark_cap_without_failures_is_the_run_start():
+    stats = _new_stats()
+    run_started = datetime(2030, 1, 1, tzinfo=timezone.utc)
+    assert _watermark_cap(run_started, stats) == run_started
+    _normalize_items([_item(objectId="bad", Year="n/a", updatedAt="2031-01-01T00:00:00.000Z")], stats)
+    assert _watermark_cap(run_started, stats) == run_started
+    _normalize_items([_item(objectId="bad", Year="n/a", updatedAt="2029-01-01T00:00:00.000Z")], stats)
+    assert _watermark_cap(run_started, stats) < datetime(2029, 1, 1, tzinfo=timezone.utc)
+
+
+def test_record_filter_incremental_resume():
+    since = datetime(2021, 5, 6, tzinfo=timezone.utc)
+    where = _record_filter(updated_after=since, after_object_id="id0042")
+    assert where["updatedAt"] == {"$gt": _parse_date(since)}
+    assert where["objectId"] == {"$gt": "id0042"}
+    assert "Year" in where
+
+
+def test_record_filter_full():
+    assert set(_record_filter()) == {"Year"}
+
+
+def test_fingerprint_tracks_source_fields():
+    record = _normalize_record(_item())
+    assert record["source_hash"] == _fingerprint("Toyota", "Corolla", 2020, "Sedan")
+    assert len(record["source_hash"]) == 32
+    # Timestamps are not part of the content fingerprint
+    assert _normalize_record(_item(updatedAt="2023-01-01T00:00:00.000Z"))["source_hash"] == record["source_hash"]
+    assert _normalize_record(_item(Category="Coupe"))["source_hash"] != record["source_hash"]
+    assert _fingerprint("Ford", "Ka", 2015, None) == _fingerprint("Ford", "Ka", 2015, "")
+
+
+def test_record_error_keeps_bounded_samples():
+    stats = _new_stats()
+    for i in range(15):
+        _record_error(stats, f"id{i}", KeyError("Make"))
+    assert stats["errors"] == 15
+    assert len(stats["error_samples"]) == 10
+    assert stats["error_samples"][0] == {"external_id": "id0", "error": "KeyError: 'Make'"}
+
+
+class FakeLock:
+    def __init__(self, available: bool):
+        self.available = available
+        self.reacquired = 0
+        self.released = False
+
+    def acquire(self):
+        return self.available
+
+    def reacquire(self):
+        self.reacquired += 1
+
+    def release(self):
+        self.released = True
+
+
+class FakeRedis:
+    def __init__(self, lock):
+        self._lock = lock
+
+    def lock(self, name, timeout, blocking):
+        return self._lock
+
+
+class FakeTask:
+    def __init__(self):
+        self.request = type("Request", (), {"id": "task-1"})()
+        self.states = []
+
+    def update_state(self, state, meta):
+        self.states.append((state, meta))
+
+
+def test_run_exclusive_exits_when_locked(monkeypatch):
+    monkeypatch.setattr(sync_cars, "redis_client", FakeRedis(FakeLock(available=False)))
+    monkeypatch.setattr(sync_cars, "_run_sync", lambda *a, **k: pytest.fail("sync must not run"))
+
+    assert sync_cars._run_exclusive(FakeTask(), None, False) == {"status": "locked"}
+
+
+def test_run_exclusive_reports_progress_and_releases(monkeypatch):
+    lock = FakeLock(available=True)
+    task = FakeTask()
+    monkeypatch.setattr(sync_cars, "redis_client", FakeRedis(lock))
+
+    def fake_run_sync(mode, full, on_progress, heartbeat):
+        stats = _new_stats()
+        stats.update(pages=1, fetched=1000, inserted=900, updated=50)
+        heartbeat()
+        on_progress(stats)
+        return stats
+
+    monkeypatch.setattr(sync_cars, "_run_sync", fake_run_sync)
+    result = sync_cars._run_exclusive(task, None, False)
+
+    assert result["fetched"] == 1000
+    assert lock.reacquired == 1 and lock.released
+    state, meta = task.states[0]
+    assert state == "PROGRESS"
+    assert meta["pages"] == 1 and meta["written"] == 950
+
+
+@pytest.mark.parametrize("changes, published", [({}, False), ({"updated": 1}, True), ({"deleted": 3}, True)])
+def test_run_sync_publishes_only_changed_data(monkeypatch, changes, published):
+    calls = []
+
+    def fake_execute_sync(mode, full, state_name, stats, on_progress, reconcile, heartbeat):
+        stats.update(changes)
+        return stats
+
+    monkeypatch.setattr(sync_cars, "_start_run", lambda *a: None)
+    monkeypatch.setattr(sync_cars, "_execute_sync", fake_execute_sync)
+    monkeypatch.setattr(sync_cars, "_publish_changes", lambda stats, heartbeat: calls.append(stats))
+
+    sync_cars._run_sync("bulk", full=False)
+    assert bool(calls) is published
+
+
+def test_run_sync_can_skip_reconcile_and_publish(monkeypatch):
+    calls = []
+
+    def fake_execute_sync(mode, full, state_name, stats, on_progress, reconcile, heartbeat):
+        calls.append(("reconcile", reconcile))
+        stats.update(inserted=5)
+        return stats
+
+    monkeypatch.setattr(sync_cars, "_start_run", lambda *a: None)
+    monkeypatch.setattr(sync_cars, "_execute_sync", fake_execute_sync)
+    monkeypatch.setattr(sync_cars, "_publish_changes", lambda stats, heartbeat: calls.append("published"))
+
+    sync_cars._run_sync("bulk", full=True, state_name="benchmark", reconcile=False, publish=False)
+    assert calls == [("reconcile", False)]
+
+
+class FakeSession:
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def test_publish_changes_renews_the_lock_between_steps(monkeypatch):
+    calls = []
+    monkeypatch.setattr(sync_cars, "SessionLocal", FakeSession)
+    monkeypatch.setattr(sync_cars, "refresh_car_reports_sync", lambda session: calls.append("refresh"))
+    monkeypatch.setattr(sync_cars, "rebuild_report_rollup_sync", lambda session: calls.append("rollup"))
+    monkeypatch.setattr(sync_cars, "bump_sync_generation_sync", lambda redis: None)
+    monkeypatch.setattr(sync_cars, "bump_catalog_version_sync", lambda redis: None)
+
+    sync_cars._publish_changes(_new_stats(), heartbeat=lambda: calls.append("beat"))
+    assert calls == ["beat", "refresh", "beat", "rollup"]
+
+
+def test_reconcile_deletions_renews_the_lock_and_keeps_graph_batch_timings(monkeypatch):
+    calls = []
+    monkeypatch.setattr(sync_cars, "delete_unseen_synced_cars_sync", lambda session: calls.append("delete") or [1, 2, 3])
+
+    def fake_delete_nodes(car_ids, batch_size):
+        calls.append("graph")
+        return [{"rows": 2, "seconds": 0.5}, {"rows": 1, "seconds": 0.25}]
+
+    monkeypatch.setattr(sync_cars, "delete_car_nodes_sync", fake_delete_nodes)
+    stats = _new_stats()
+
+    sync_cars._reconcile_deletions(FakeSession(), stats, heartbeat=lambda: calls.append("beat"))
+    assert calls == ["delete", "beat", "graph"]
+    assert stats["deleted"] == 3
+    assert stats["graph_batches"] == [{"rows": 2, "seconds": 0.5}, {"rows": 1, "seconds": 0.25}]
+
+
+def test_graph_batch_summary_for_sync_runs():
+    timings = [{"rows": 1000, "seconds": s / 100} for s in range(1, 21)] + [{"rows": 10, "seconds": 0.01}]
+    summary = sync_cars._summarize_graph_batches(timings)
+    assert summary == {
+        "batches": 21,
+        "rows": 20010,
+        "seconds": 2.11,
+        "min_seconds": 0.01,
+        "max_seconds": 0.2,
+        "p95_seconds": 0.19,
+    }
+    assert sync_cars._summarize_graph_batches([]) is None
+    SyncGraphTimings.model_validate(summary)
+
+
+def test_run_sync_records_the_graph_summary(monkeypatch):
+    finished = []
+
+    def fake_execute_sync(mode, full, state_name, stats, on_progress, reconcile, heartbeat):
+        stats["graph_batches"].extend([{"rows": 5, "seconds": 0.5}, {"rows": 2, "seconds": 0.25}])
+        return stats
+
+    monkeypatch.setattr(sync_cars, "_start_run", lambda *a: 1)
+    monkeypatch.setattr(sync_cars, "_execute_sync", fake_execute_sync)
+    monkeypatch.setattr(sync_cars, "_finish_run", lambda run_id, status, stats, *a: finished.append(stats))
+
+    sync_cars._run_sync("bulk", full=False, publish=False)
+    assert finished[0]["graph_timings"]["batches"] == 2
+    assert finished[0]["graph_timings"]["p95_seconds"] == 0.5
@@ -0,0 +1,202 @@
+"""Chunked commits and checkpoint resume of `_execute_sync`, against fake pages and an in-memory store."""
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from typing import Optional
+
+import pytest
+import requests
+
+from app.core.config import config
+from car_tasks import sync_cars
+from car_tasks.sync_cars import _new_stats
+
+STATE = "test_cars"
+BASE = datetime(2021, 1, 1, tzinfo=timezone.utc)
+
+
+def _item(n: int, **overrides) -> dict:
+    item = {
+        "objectId": f"id{n:02d}",
+        "Make": "Toyota",
+        "Model": "Corolla",
+        "Year": 2020,
+        "Category": None,
+        "createdAt": "2020-01-01T00:00:00.000Z",
+        "updatedAt": (BASE + timedelta(days=n)).isoformat().replace("+00:00", "Z"),
+    }
+    item.update(overrides)
+    return item
+
+
+# Four pages of two records, ordered by objectId as Back4App returns them.
+PAGES = [[_item(1), _item(2)], [_item(3), _item(4)], [_item(5), _item(6)], [_item(7), _item(8)]]
+
+
+class FakeStore:
+    """Committed contents of `cars` and `sync_state`."""
+
+    def __init__(self):
+        self.cars: dict[str, int] = {}
+        self.state = None
+        self.page_requests: list[tuple] = []
+
+
+class FakeSession:
+    """Buffers writes until commit; rollback drops them."""
+
+    def __init__(self, store: FakeStore):
+        self.store = store
+        self.pending: list = []
+
+    def commit(self):
+        for write in self.pending:
+            write()
+        self.pending = []
+
+    def rollback(self):
+        self.pending = []
+
+    def close(self):
+        self.rollback()
+
+
+@pytest.fixture
+def store(monkeypatch) -> FakeStore:
+    store = FakeStore()
+    monkeypatch.setattr(config, "SYNC_COMMIT_SIZE", 4)
+    monkeypatch.setattr(config, "SYNC_BATCH_SIZE", 100)
+    monkeypatch.setattr(config, "SYNC_MAX_INFLIGHT_PAGES", 0)
+    monkeypatch.setattr(sync_cars, "SessionLocal", lambda: FakeSession(store))
+    monkeypatch.setattr(sync_cars, "get_sync_state_sync", lambda session, name: store.state)
+
+    def save_checkpoint(session, name, object_id, since, watermark, full, watermark_cap=None):
+        def write():
+            state = store.state or SimpleNamespace(watermark=None)
+            state.checkpoint_object_id = object_id
+            state.checkpoint_since = since
+            state.checkpoint_watermark = watermark
+            state.checkpoint_watermark_cap = watermark_cap
+            state.checkpoint_full = full
+            store.state = state
+        session.pending.append(write)
+
+    def finish(session, name, watermark, watermark_cap=None):
+        def write():
+            stored = store.state.watermark if store.state else None
+            advanced = max(filter(None, (stored, watermark)), default=None)
+            if watermark is not None and watermark_cap is not None:
+                advanced = min(advanced, watermark_cap)
+            store.state = SimpleNamespace(
+                watermark=advanced,
+                checkpoint_object_id=None,
+                checkpoint_since=None,
+                checkpoint_watermark=None,
+                checkpoint_watermark_cap=None,
+                checkpoint_full=False,
+            )
+        session.pending.append(write)
+
+    def resolve_make_ids(session, names, make_ids):
+        make_ids.update({name: 1 for name in names})
+
+    def resolve_model_ids(session, keys, model_ids):
+        model_ids.update({key: 10 for key in keys})
+
+    def upsert(session, rows):
+        written = []
+        for row in rows:
+            inserted = row["external_id"] not in store.cars
+            car_id = store.cars.get(row["external_id"], 100 + len(store.cars) + len(written))
+            written.append(SimpleNamespace(id=car_id, external_id=row["external_id"], inserted=inserted))
+        session.pending.append(lambda: store.cars.update({row.external_id: row.id for row in written}))
+        return written
+
+    monkeypatch.setattr(sync_cars, "save_sync_checkpoint_sync", save_checkpoint)
+    monkeypatch.setattr(sync_cars, "finish_sync_sync", finish)
+    monkeypatch.setattr(sync_cars, "resolve_make_ids_sync", resolve_make_ids)
+    monkeypatch.setattr(sync_cars, "resolve_model_ids_sync", resolve_model_ids)
+    monkeypatch.setattr(sync_cars, "bulk_upsert_cars_sync", upsert)
+    monkeypatch.setattr(sync_cars, "write_car_nodes_sync", lambda rows, batch_size: [])
+    return store
+
+
+def serve(store: FakeStore, pages: list[list[dict]], fail_after: Optional[int] = None):
+    """Stand-in for `_iter_record_pages`: pages past the checkpoint, then optionally a network error."""
+
+    def iter_pages(updated_after=None, after_object_id=None):
+        store.page_requests.append((updated_after, after_object_id))
+        served = 0
+        for page in pages:
+            if after_object_id is not None and page[-1]["objectId"] <= after_object_id:
+                continue
+            if fail_after is not None and served == fail_after:
+                raise requests.ConnectionError("connection reset")
+            served += 1
+            yield page
+
+    return iter_pages
+
+
+def test_crash_keeps_committed_chunks_and_resume_continues_after_the_checkpoint(store, monkeypatch):
+    # Pages 1-2 are committed as one chunk, page 3 is written but not committed.
+    monkeypatch.setattr(sync_cars, "_iter_record_pages", serve(store, PAGES, fail_after=3))
+    with pytest.raises(requests.ConnectionError):
+        sync_cars._execute_sync("bulk", False, STATE, _new_stats())
+
+    assert sorted(store.cars) == ["id01", "id02", "id03", "id04"]
+    assert store.state.checkpoint_object_id == "id04"
+    assert store.state.checkpoint_watermark == BASE + timedelta(days=4)
+    assert store.state.watermark is None  # only a finished run moves it
+
+    monkeypatch.setattr(sync_cars, "_iter_record_pages", serve(store, PAGES))
+    stats = sync_cars._execute_sync("bulk", False, STATE, _new_stats())
+
+    assert store.page_requests[-1] == (None, "id04")
+    assert stats["resumed_after"] == "id04"
+    assert stats["fetched"] == 4 and stats["inserted"] == 4
+    assert sorted(store.cars) == [f"id{n:02d}" for n in range(1, 9)]
+    assert store.state.checkpoint_object_id is None
+    assert store.state.watermark == BASE + timedelta(days=8)
+
+
+def test_checkpoint_is_cleared_only_when_the_run_finishes(store, monkeypatch):
+    checkpoints = []
+    real_commit = FakeSession.commit
+
+    def commit(session):
+        real_commit(session)
+        checkpoints.append(store.state.checkpoint_object_id)
+
+    monkeypatch.setattr(FakeSession, "commit", commit)
+    monkeypatch.setattr(sync_cars, "_iter_record_pages", serve(store, PAGES))
+
+    stats = sync_cars._execute_sync("bulk", False, STATE, _new_stats())
+
+    # One commit per chunk of four records, then the final one that clears it.
+    assert checkpoints == ["id04", "id08", None]
+    assert stats["commits"] == 3
+
+
+def test_failed_run_keeps_its_checkpoint(store, monkeypatch):
+    def finish(*args):
+        raise RuntimeError("db gone")
+
+    monkeypatch.setattr(sync_cars, "_iter_record_pages", serve(store, PAGES))
+    monkeypatch.setattr(sync_cars, "finish_sync_sync", finish)
+
+    assert sync_cars._execute_sync("bulk", False, STATE, _new_stats()) is None
+    assert store.state.checkpoint_object_id == "id08"
+    assert store.state.watermark is None
+
+
+def test_resumed_run_keeps_the_interrupted_runs_failures(store, monkeypatch):
+    pages = [[_item(1, Year="n/a"), _item(2)], [_item(3), _item(4)], [_item(5), _item(6)]]
+    monkeypatch.setattr(sync_cars, "_iter_record_pages", serve(store, pages, fail_after=2))
+    with pytest.raises(requests.ConnectionError):
+        sync_cars._execute_sync("bulk", False, STATE, _new_stats())
+
+    monkeypatch.setattr(sync_cars, "_iter_record_pages", serve(store, pages))
+    sync_cars._execute_sync("bulk", False, STATE, _new_stats())
+
+    # id01 failed before the crash: the watermark stays just below it.
+    assert store.state.watermark == BASE + timedelta(days=1) - sync_cars.WATERMARK_STEP
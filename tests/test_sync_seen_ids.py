@@ -0,0 +1,64 @@
+"""Deletion reconciliation of full syncs against the configured PostgreSQL (skipped without it)."""
+import uuid
+from typing import Dict, Tuple
+
+from sqlalchemy import insert, select, text
+from sqlalchemy.orm import Session
+
+from app.models.car_model import Car, CarModel, Make
+from app.utils.services import (
+    delete_unseen_synced_cars_sync,
+    reset_seen_external_ids_sync,
+    stage_seen_external_ids_sync,
+)
+
+
+def _seed(session: Session) -> Tuple[Dict[str, int], str]:
+    """Synced cars a-d plus one user-owned car; returns their ids by key and the id prefix."""
+    prefix = f"seen-{uuid.uuid4().hex[:8]}"
+    make_id = session.execute(insert(Make).values(name=prefix).returning(Make.id)).scalar_one()
+    model_id = session.execute(
+        insert(CarModel).values(name="Model", make_id=make_id).returning(CarModel.id)
+    ).scalar_one()
+    rows = [{"name": "Car", "year": 2018, "car_model_id": model_id, "external_id": f"{prefix}-{key}"} for key in "abcd"]
+    rows.append({"name": "Mine", "year": 2018, "car_model_id": model_id, "user_id": 1})
+    ids = session.execute(insert(Car).returning(Car.id, Car.external_id), rows).all()
+    return {(external_id or "user").rsplit("-", 1)[-1]: car_id for car_id, external_id in ids}, prefix
+
+
+def _remaining(session: Session, ids: Dict[str, int]) -> set:
+    found = set(session.execute(select(Car.id).where(Car.id.in_(ids.values()))).scalars())
+    return {key for key, car_id in ids.items() if car_id in found}
+
+
+def test_seen_ids_survive_a_crash(pg_connection):
+    persistence = pg_connection.execute(
+        text("SELECT relpersistence FROM pg_class WHERE relname = 'sync_seen_ids'")
+    ).scalar_one()
+    assert persistence == "p"  # logged; unlogged tables are emptied by crash recovery
+
+
+def test_unseen_synced_cars_are_deleted(pg_connection):
+    session = Session(bind=pg_connection)
+    ids, prefix = _seed(session)
+
+    reset_seen_external_ids_sync(session)
+    stage_seen_external_ids_sync(session, [f"{prefix}-a", f"{prefix}-b", f"{prefix}-a"])
+    deleted = delete_unseen_synced_cars_sync(session)
+
+    assert {ids["c"], ids["d"]} <= set(deleted)
+    assert _remaining(session, ids) == {"a", "b", "user"}
+
+
+def test_resumed_run_keeps_cars_seen_before_the_checkpoint(pg_connection):
+    session = Session(bind=pg_connection)
+    ids, prefix = _seed(session)
+
+    # First attempt stages a and b, commits its checkpoint and dies.
+    reset_seen_external_ids_sync(session)
+    stage_seen_external_ids_sync(session, [f"{prefix}-a", f"{prefix}-b"])
+    # The resumed run does not reset and only fetches the pages after the checkpoint.
+    stage_seen_external_ids_sync(session, [f"{prefix}-c"])
+    delete_unseen_synced_cars_sync(session)
+
+    assert _remaining(session, ids) == {"a", "b", "c", "user"}
@@ -0,0 +1,49 @@
+"""Set-based upsert of synced cars against the configured PostgreSQL (skipped without it)."""
+import uuid
+from datetime import datetime, timezone
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models.car_model import Car
+from app.utils.services import bulk_upsert_cars_sync, resolve_make_ids_sync, resolve_model_ids_sync
+
+STAMP = datetime(2021, 1, 1, tzinfo=timezone.utc)
+
+
+def test_bulk_upsert_reports_inserted_and_updated_rows_only(pg_connection):
+    session = Session(bind=pg_connection)
+    prefix = f"upsert-{uuid.uuid4().hex[:8]}"
+    make_ids, model_ids = {}, {}
+    resolve_make_ids_sync(session, {prefix}, make_ids)
+    resolve_model_ids_sync(session, {(make_ids[prefix], "Model")}, model_ids)
+
+    def row(key: str, source_hash: str, category: str = "Sedan") -> dict:
+        return {
+            "external_id": f"{prefix}-{key}",
+            "name": "Model",
+            "year": 2020,
+            "category": category,
+            "car_model_id": model_ids[(make_ids[prefix], "Model")],
+            "user_id": None,
+            "created_at": STAMP,
+            "updated_at": STAMP,
+            "source_hash": source_hash,
+        }
+
+    first = bulk_upsert_cars_sync(session, [row("same", "1" * 32), row("changed", "1" * 32)])
+    assert sorted((r.external_id, r.inserted) for r in first) == [(f"{prefix}-changed", True), (f"{prefix}-same", True)]
+
+    second = bulk_upsert_cars_sync(
+        session,
+        [row("same", "1" * 32), row("changed", "2" * 32, category="Coupe"), row("new", "1" * 32)],
+    )
+    # The unchanged row is filtered by the source_hash guard and not returned.
+    assert sorted((r.external_id, r.inserted) for r in second) == [(f"{prefix}-changed", False), (f"{prefix}-new", True)]
+    ids = {r.external_id: r.id for r in first}
+    assert {r.id for r in second if not r.inserted} == {ids[f"{prefix}-changed"]}
+
+    stored = dict(
+        session.execute(select(Car.external_id, Car.category).where(Car.external_id.like(f"{prefix}-%"))).all()
+    )
+    assert stored == {f"{prefix}-same": "Sedan", f"{prefix}-changed": "Coupe", f"{prefix}-new": "Sedan"}